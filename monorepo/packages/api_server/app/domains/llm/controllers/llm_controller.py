@@ -1,8 +1,11 @@
 # app/domains/llm/controllers/llm_controller.py
 
+import json
+
 from app.domains.llm.schemas import ChatCompletionRequest
 from app.domains.llm.services import LLMService, get_llm_service
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
 from shared.core.logging import get_logger
 from shared.utils.response_builder import ResponseBuilder
 
@@ -23,42 +26,102 @@ async def llm_health_check():
 
 @router.get("/models")
 async def get_available_models(llm_service: LLMService = Depends(get_llm_service)):
-    """사용 가능한 LLM 모델 목록 조회"""
+    """사용 가능한 LLM 모델 목록 조회 (모델별 지연 통계 포함)"""
 
     available_models = await llm_service.get_available_models()
 
     return ResponseBuilder.success(
-        data={"servers": "", "available_models": available_models},
+        data={
+            "servers": llm_service.server_url,
+            "available_models": available_models,
+            "model_stats": llm_service.model_registry.stats(),
+        },
         message="",
     )
 
 
+def _sse(event: str, data: dict) -> str:
+    """SSE 프레임 (event/data)"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
 @router.post("/chat")
 async def run_chat_completion(
     request: ChatCompletionRequest,
+    http_request: Request,
     llm_service: LLMService = Depends(get_llm_service),
 ):
     """LLM 채팅 완성 수행
 
+    stream=true이면 토큰을 Server-Sent Events로 생성되는 대로 전달합니다.
+    (token 이벤트들 → done 이벤트에 ttft_ms/total_ms, 실패 시 error 이벤트)
+
     Args:
         request: 채팅 완성 요청 데이터 (메시지, 모델, 온도 등)
         llm_service: LLM 서비스 의존성
 
     Returns:
-        채팅 완성 결과
+        채팅 완성 결과 또는 SSE 스트림
     """
     # Pydantic 모델을 딕셔너리로 변환하여 서비스에 전달
     messages = [msg.model_dump() for msg in request.messages]
 
+    if request.stream:
+        return await _stream_chat_completion(
+            http_request, llm_service, messages, request
+        )
+
     result = await llm_service.chat_completion(
         messages=messages,
         model=request.model,
         temperature=request.temperature,
         max_tokens=request.max_tokens,
-        stream=request.stream,
+        use_cache=request.use_cache,
     )
 
     return ResponseBuilder.success(
         data={"result": result},
         message="채팅 완성 성공",
     )
+
+
+async def _stream_chat_completion(
+    http_request: Request,
+    llm_service: LLMService,
+    messages: list,
+    request: ChatCompletionRequest,
+) -> StreamingResponse:
+    """채팅 완성 SSE 스트림
+
+    첫 이벤트를 미리 받아 두므로 연결/모델 오류는 스트림 시작 전에 일반 오류
+    응답으로 처리됩니다. 클라이언트 연결이 끊기면 서비스 제너레이터를 닫아
+    업스트림 생성을 중단합니다.
+    """
+    events = llm_service.stream_chat_completion(
+        messages=messages,
+        model=request.model,
+        temperature=request.temperature,
+        max_tokens=request.max_tokens,
+    )
+    first = await anext(events)
+
+    async def event_source():
+        try:
+            yield _sse(**first)
+            async for event in events:
+                if await http_request.is_disconnected():
+                    logger.info("📴 클라이언트 연결 종료, 스트리밍 중단")
+                    break
+                yield _sse(**event)
+        except Exception as e:
+            # 스트림 시작 후에는 상태 코드를 바꿀 수 없으므로 error 이벤트로 전달
+            logger.error(f"❌ 스트리밍 채팅 실패: {str(e)}")
+            yield _sse("error", {"message": str(e)})
+        finally:
+            await events.aclose()
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
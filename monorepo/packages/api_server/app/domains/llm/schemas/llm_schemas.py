@@ -40,7 +40,14 @@ class ChatCompletionRequest(BaseModel):
     max_tokens: Optional[int] = Field(
         None, description="최대 생성 토큰 수", gt=0, examples=[512, 1024, 2048]
     )
-    stream: bool = Field(False, description="스트리밍 응답 여부")
+    stream: bool = Field(
+        False,
+        description="스트리밍 응답 여부 (true이면 SSE로 토큰을 생성되는 대로 전달)",
+    )
+    use_cache: bool = Field(
+        False,
+        description="응답 캐시 사용 여부 (temperature 0 비스트리밍 요청만 적용)",
+    )
 
     model_config = {
         "json_schema_extra": {
@@ -50,6 +57,7 @@ class ChatCompletionRequest(BaseModel):
                 "temperature": 0.7,
                 "max_tokens": 512,
                 "stream": False,
+                "use_cache": False,
             }
         }
     }
@@ -1,41 +1,68 @@
-from typing import Any, Dict, Iterator, List, Optional
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
 
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI, AsyncStream, DefaultAsyncHttpxClient
 from openai.types.chat import ChatCompletion, ChatCompletionChunk
+from shared.config import settings
 from shared.core.logging import get_logger
+from shared.llm.model_registry import (
+    LLM_TIME_TO_FIRST_TOKEN_SECONDS,
+    get_llm_model_registry,
+)
+from shared.llm.response_cache import get_llm_response_cache
 from shared.service.base_service import BaseService
 
 logger = get_logger(__name__)
 
 
 class LLMService(BaseService):
-    """vLLM 서버 통신 전담 클래스 (OpenAI API 호환)"""
+    """vLLM 서버 통신 전담 클래스 (OpenAI API 호환)
+
+    keep-alive 연결 풀을 가진 AsyncOpenAI 클라이언트 하나를 앱 수명 동안
+    재사용합니다. (앱 종료 시 aclose)
+    """
 
     def __init__(
         self,
-        server_url: str = "http://192.168.0.122:38000/v1",
-        api_key: str = "EMPTY",
-        timeout: float = 60.0,
+        server_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        timeout: Optional[float] = None,
     ):
         """LLMClient 초기화
 
         Args:
-            server_url: vLLM 서버 URL (기본값: http://192.168.0.122:38000/v1)
+            server_url: vLLM 서버 URL (기본값: settings.LLM_SERVER_URL)
             api_key: API 키 (vLLM은 "EMPTY" 사용)
-            timeout: 요청 타임아웃 (초 단위, 기본값: 60.0)
+            timeout: 요청 타임아웃 (초 단위, 기본값: settings.LLM_TIMEOUT)
         """
-        self.server_url = server_url
-        self.api_key = api_key
-        self.timeout = timeout
-        self.client = OpenAI(
-            api_key=api_key,
-            base_url=server_url,
-            timeout=timeout,
+        self.server_url = server_url or settings.LLM_SERVER_URL
+        self.api_key = api_key or settings.LLM_API_KEY
+        self.timeout = timeout or settings.LLM_TIMEOUT
+        self.client = AsyncOpenAI(
+            api_key=self.api_key,
+            base_url=self.server_url,
+            timeout=self.timeout,
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=settings.LLM_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.LLM_MAX_CONNECTIONS,
+                )
+            ),
         )
-        logger.info(f"LLMClient 초기화 완료: {server_url}")
+        # 모델 목록 캐시 + 모델별 지연 통계 (워커의 LLMClient와 같은 방식)
+        self.model_registry = get_llm_model_registry(self.server_url, self.api_key)
+        logger.info(f"LLMClient 초기화 완료: {self.server_url}")
+
+    async def aclose(self) -> None:
+        """연결 풀 종료 (앱 종료 시)"""
+        await self.client.close()
 
-    async def get_available_models(self) -> List[str]:
-        """사용 가능한 모델 목록 조회
+    async def get_available_models(self, force_refresh: bool = False) -> List[str]:
+        """사용 가능한 모델 목록 조회 (모델 레지스트리 캐시)
+
+        Args:
+            force_refresh: 캐시를 무시하고 서버에서 다시 조회
 
         Returns:
             List[str]: 모델 ID 리스트
@@ -44,10 +71,7 @@ class LLMService(BaseService):
             Exception: 모델 조회 실패
         """
         try:
-            models = self.client.models.list()
-            model_ids = [model.id for model in models.data]
-            logger.info(f"사용 가능한 모델: {model_ids}")
-            return model_ids
+            return await self.model_registry.get_models(force_refresh)
         except Exception as e:
             logger.error(f"모델 목록 조회 실패: {str(e)}")
             raise
@@ -59,8 +83,9 @@ class LLMService(BaseService):
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
         stream: bool = False,
+        use_cache: bool = False,
         **kwargs: Any,
-    ) -> ChatCompletion | Iterator[ChatCompletionChunk]:
+    ) -> ChatCompletion | AsyncStream[ChatCompletionChunk]:
         """채팅 완성 요청
 
         Args:
@@ -69,10 +94,12 @@ class LLMService(BaseService):
             temperature: 샘플링 온도 (0.0 ~ 2.0, 기본값: 0.7)
             max_tokens: 최대 생성 토큰 수 (기본값: None)
             stream: 스트리밍 응답 여부 (기본값: False)
+            use_cache: 응답 캐시 사용 여부 (temperature 0 비스트리밍 요청만 적용)
             **kwargs: 추가 OpenAI API 파라미터
 
         Returns:
-            ChatCompletion | Iterator[ChatCompletionChunk]: 완성 결과 또는 스트리밍 청크
+            ChatCompletion | AsyncStream[ChatCompletionChunk]: 완성 결과 또는
+                스트리밍 청크
 
         Raises:
             ValueError: 사용 가능한 모델이 없거나 메시지가 비어있음
@@ -81,25 +108,49 @@ class LLMService(BaseService):
         if not messages:
             raise ValueError("메시지가 비어있습니다")
 
-        # 모델이 지정되지 않으면 첫 번째 모델 사용
+        # 모델이 지정되지 않으면 레지스트리의 기본 모델 사용
         if model is None:
-            available_models = await self.get_available_models()
-            if not available_models:
-                raise ValueError("사용 가능한 모델이 없습니다")
-            model = available_models[0]
+            model = await self.model_registry.resolve()
             logger.info(f"기본 모델 사용: {model}")
 
+        params = {
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": stream,
+            **kwargs,
+        }
+
+        async def create() -> Any:
+            start = time.perf_counter()
+            try:
+                response = await self.client.chat.completions.create(
+                    messages=messages,  # type: ignore
+                    model=model,
+                    **params,
+                )  # type: ignore
+            except Exception as e:
+                self.model_registry.record(model, time.perf_counter() - start, e)
+                raise
+            # 스트리밍은 첫 응답(헤더)까지의 시간만 반영되므로 제외
+            if not stream:
+                self.model_registry.record(
+                    model,
+                    time.perf_counter() - start,
+                    completion_tokens=(
+                        response.usage.completion_tokens if response.usage else None
+                    ),
+                )
+            return response
+
         try:
             logger.info(f"채팅 완성 요청 (모델: {model}, 스트리밍: {stream})")
 
-            response = self.client.chat.completions.create(
-                messages=messages,  # type: ignore
-                model=model,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                stream=stream,
-                **kwargs,
-            )  # type: ignore
+            if use_cache:
+                response = await get_llm_response_cache().cached_completion(
+                    model, messages, params, create
+                )
+            else:
+                response = await create()
 
             if stream:
                 logger.info("스트리밍 응답 시작")
@@ -112,6 +163,111 @@ class LLMService(BaseService):
             logger.error(f"채팅 완성 실패: {str(e)}")
             raise
 
+    async def stream_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """스트리밍 채팅 완성 (토큰이 생성되는 대로 전달)
+
+        소비자가 다음 이벤트를 요청할 때만 업스트림 응답을 읽으므로, 클라이언트가
+        느리면 TCP 흐름 제어로 업스트림까지 역압이 전달됩니다. 소비자가 중간에
+        제너레이터를 닫으면 (클라이언트 연결 종료) 업스트림 응답 연결을 닫아
+        vLLM의 생성도 중단됩니다.
+
+        Args:
+            messages: 메시지 리스트
+            model: 사용할 모델 ID (기본값: 레지스트리의 기본 모델)
+            temperature: 샘플링 온도
+            max_tokens: 최대 생성 토큰 수
+            **kwargs: 추가 OpenAI API 파라미터
+
+        Yields:
+            {"event": "token", "data": {"content": ...}} 이벤트들과 마지막
+            {"event": "done", "data": {model, finish_reason, chunks, ttft_ms,
+            total_ms}} 이벤트
+
+        Raises:
+            ValueError: 사용 가능한 모델이 없거나 메시지가 비어있음
+            Exception: API 호출 실패
+        """
+        if not messages:
+            raise ValueError("메시지가 비어있습니다")
+
+        if model is None:
+            model = await self.model_registry.resolve()
+
+        logger.info(f"스트리밍 채팅 요청 (모델: {model})")
+        start = time.perf_counter()
+        try:
+            stream = await self.client.chat.completions.create(
+                messages=messages,  # type: ignore
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+                **kwargs,
+            )
+        except Exception as e:
+            self.model_registry.record(model, time.perf_counter() - start, e)
+            logger.error(f"스트리밍 채팅 요청 실패: {str(e)}")
+            raise
+
+        ttft: Optional[float] = None
+        chunks = 0
+        finish_reason: Optional[str] = None
+        completed = False
+        try:
+            async with stream:
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    choice = chunk.choices[0]
+                    finish_reason = choice.finish_reason or finish_reason
+                    if not choice.delta.content:
+                        continue
+                    if ttft is None:
+                        ttft = time.perf_counter() - start
+                        LLM_TIME_TO_FIRST_TOKEN_SECONDS.labels(model).observe(ttft)
+                    chunks += 1
+                    yield {"event": "token", "data": {"content": choice.delta.content}}
+            completed = True
+        except Exception as e:
+            self.model_registry.record(model, time.perf_counter() - start, e)
+            logger.error(f"스트리밍 채팅 중 오류: {str(e)}")
+            raise
+        finally:
+            if not completed:
+                logger.info(
+                    f"🛑 스트리밍 중단, 업스트림 생성 취소 (모델: {model}, "
+                    f"전달 청크: {chunks})"
+                )
+
+        total = time.perf_counter() - start
+        # 스트림 청크는 대부분 토큰 하나이므로 청크 수를 완성 토큰 수로 사용
+        self.model_registry.record(model, total, completion_tokens=chunks)
+        logger.info(
+            f"스트리밍 채팅 완료 (모델: {model}, 청크: {chunks}, "
+            f"TTFT: {_ms(ttft)}, 전체: {_ms(total)})"
+        )
+        yield {
+            "event": "done",
+            "data": {
+                "model": model,
+                "finish_reason": finish_reason,
+                "chunks": chunks,
+                "ttft_ms": round(ttft * 1000, 1) if ttft is not None else None,
+                "total_ms": round(total * 1000, 1),
+            },
+        }
+
+
+def _ms(seconds: Optional[float]) -> str:
+    return "-" if seconds is None else f"{seconds * 1000:.0f}ms"
+
 
 llm_service = LLMService()
 
@@ -1,15 +1,30 @@
 # app/domains/task/controllers/task_controller.py
 import uuid
-from typing import List
+from typing import List, Optional
 
 # Celery 태스크는 celery app을 통해 호출
 from app.main import get_celery_app
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Header,
+    HTTPException,
+    Request,
+    UploadFile,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from fastapi.responses import StreamingResponse
 from shared.config import settings
 from shared.core.database import get_db
 from shared.core.logging import get_logger
-from shared.pipeline.cache import PipelineCacheService, get_pipeline_cache_service
+from shared.pipeline.cache import (
+    AsyncPipelineCacheService,
+    get_async_pipeline_cache_service,
+)
 from shared.pipeline.context import PipelineContext
+from shared.pipeline.progress import BatchEventHub, get_batch_event_hub
 from shared.repository.crud.async_crud import chain_execution_crud
 from shared.schemas.chain_execution import ChainExecutionResponse
 from shared.utils.file_utils import get_default_storage
@@ -197,7 +212,9 @@ async def run_ocr_pdf_extract_async(
 @router.get("/batch/{batch_id}")
 async def get_batch_contexts(
     batch_id: str,
-    cache_service: PipelineCacheService = Depends(get_pipeline_cache_service),
+    cache_service: AsyncPipelineCacheService = Depends(
+        get_async_pipeline_cache_service
+    ),
 ):
     """
     batch_id로 모든 파이프라인 컨텍스트 조회 (진행 중 + 대기 중)
@@ -211,7 +228,9 @@ async def get_batch_contexts(
     logger.info(f"🔍 배치 컨텍스트 조회: batch_id={batch_id}")
 
     try:
-        contexts: List[PipelineContext] = cache_service.load_all_by_batch_id(batch_id)
+        contexts: List[PipelineContext] = await cache_service.load_all_by_batch_id(
+            batch_id
+        )
 
         # 컨텍스트 정보를 응답 형식으로 변환
         contexts_data = [ctx for ctx in contexts]
@@ -240,6 +259,68 @@ async def get_batch_contexts(
         )
 
 
+# batch_id 진행 이벤트 스트림 (SSE)
+@router.get("/batch/{batch_id}/events")
+async def stream_batch_events(
+    batch_id: str,
+    request: Request,
+    last_event_id: Optional[str] = Header(default=None),
+    hub: BatchEventHub = Depends(get_batch_event_hub),
+):
+    """
+    배치 진행 이벤트를 Server-Sent Events로 전달 (폴링 대체)
+
+    연결 시 저장된 이벤트를 재생한 뒤 실시간 이벤트를 이어서 보내고,
+    batch_completed/batch_failed 이벤트 후 스트림을 닫습니다.
+    재연결 시 브라우저가 보내는 Last-Event-ID 이후부터 이어받습니다.
+
+    Args:
+        batch_id: 배치 ID
+        last_event_id: 마지막으로 받은 이벤트 ID (Last-Event-ID 헤더)
+    """
+    logger.info(f"📡 배치 진행 SSE 연결: batch_id={batch_id}")
+
+    async def event_source():
+        async for event in hub.subscribe(batch_id, last_event_id):
+            if await request.is_disconnected():
+                break
+            # 이벤트가 없을 때는 주석 프레임으로 연결 유지
+            yield event.to_sse() if event else ": keepalive\n\n"
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# batch_id 진행 이벤트 스트림 (WebSocket)
+@router.websocket("/batch/{batch_id}/ws")
+async def batch_events_websocket(
+    websocket: WebSocket,
+    batch_id: str,
+    last_event_id: Optional[str] = None,
+):
+    """
+    배치 진행 이벤트를 WebSocket으로 전달 (SSE와 같은 이벤트, JSON 메시지)
+
+    Args:
+        batch_id: 배치 ID
+        last_event_id: 마지막으로 받은 이벤트 ID (쿼리 파라미터)
+    """
+    hub = get_batch_event_hub()
+    await websocket.accept()
+    try:
+        async for event in hub.subscribe(batch_id, last_event_id):
+            if event is None:
+                await websocket.send_json({"event": "heartbeat"})
+                continue
+            await websocket.send_json(event.to_dict())
+        await websocket.close()
+    except WebSocketDisconnect:
+        logger.info(f"배치 진행 WebSocket 연결 종료: batch_id={batch_id}")
+
+
 @router.delete("/cancel/{chain_id}")
 async def cancel_task_result(
     chain_id: str,
@@ -3,6 +3,7 @@
 import os
 from contextlib import asynccontextmanager
 
+from app.domains.llm.services import get_llm_service
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from shared.config import settings
@@ -14,6 +15,7 @@ from shared.handler.exceptions_handler import (
 )
 from shared.middleware.request_middleware import RequestLogMiddleware
 from shared.middleware.response_middleware import ResponseLogMiddleware
+from shared.service.redis_service import close_redis_pools
 from shared.utils.response_builder import ResponseBuilder
 
 logger = get_logger(__name__)
@@ -47,6 +49,18 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"❌ 데이터베이스 지우연결 종료 실패: {e}")
 
+    # LLM 연결 풀 종료
+    try:
+        await get_llm_service().aclose()
+    except Exception as e:
+        logger.error(f"❌ LLM 연결 종료 실패: {e}")
+
+    # Redis 커넥션 풀 종료
+    try:
+        await close_redis_pools()
+    except Exception as e:
+        logger.error(f"❌ Redis 연결 종료 실패: {e}")
+
 
 # 로깅 초기화
 from shared.core.logging import get_logger  # noqa: E402
@@ -25,6 +25,7 @@ celery_app = Celery(
         "tasks.batch.image_tasks",  # 이미지 배치 태스크
         "tasks.batch.ocr_tasks",  # OCR 스테이지 태스크
         "tasks.batch.llm_tasks",  # LLM 스테이지 태스크
+        "tasks.batch.pipeline_tasks",  # 스테이지 연속 실행 태스크
     ],
 )
 
@@ -39,6 +40,10 @@ celery_app.conf.update(
     worker_prefetch_multiplier=settings.CELERY_WORKER_PREFETCH_MULTIPLIER,
     worker_max_tasks_per_child=settings.CELERY_WORKER_MAX_TASKS_PER_CHILD,
     task_acks_late=True,
+    # PDF 변환은 렌더링 프로세스 풀을 쓰므로 비데몬(threads/solo) 워커 전용 큐로
+    task_routes={
+        "batch.convert_pdf_and_process": {"queue": settings.CELERY_PDF_QUEUE},
+    },
 )
 
 logger.info(
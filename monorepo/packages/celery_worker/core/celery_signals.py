@@ -4,12 +4,21 @@ Task 실행 생명주기를 자동으로 DB에 기록
 """
 
 import asyncio
+import os
+import time
 from datetime import datetime
 
 from celery import signals
+from core.worker_runtime import init_worker_runtime, shutdown_worker_runtime
+from shared.config import settings
 from shared.core.database import get_db_manager
 from shared.core.logging import get_logger
 from shared.pipeline.context import PipelineContext
+from shared.pipeline.metrics import (
+    SENT_AT_HEADER,
+    record_queue_wait,
+    start_metrics_server,
+)
 from shared.repository.crud.sync_crud.chain_execution import (
     chain_execution_crud,
 )
@@ -26,9 +35,21 @@ TASK_STAGE_MAP = {
 }
 
 
+@signals.before_task_publish.connect
+def before_task_publish_handler(headers=None, **kwargs):
+    """Task 발행 시 - 큐 대기 시간 측정용 발행 시각 헤더 기록
+
+    Args:
+        headers: 메시지 헤더 (수정 가능)
+        **kwargs: Additional kwargs
+    """
+    if headers is not None:
+        headers[SENT_AT_HEADER] = time.time()
+
+
 @signals.task_prerun.connect
 def task_prerun_handler(sender=None, task_id=None, task=None, args=None, **kwargs):
-    """Task 시작 전 - TaskLog 생성
+    """Task 시작 전 - 큐 대기 시간 기록, TaskLog 생성
 
     Args:
         sender: Task instance
@@ -37,6 +58,13 @@ def task_prerun_handler(sender=None, task_id=None, task=None, args=None, **kwarg
         args: Task arguments
         **kwargs: Additional kwargs
     """
+    if task is not None:
+        request = task.request
+        sent_at = getattr(request, SENT_AT_HEADER, None) or (request.headers or {}).get(
+            SENT_AT_HEADER
+        )
+        record_queue_wait(task.name, sent_at, eta=request.eta)
+
     # Pipeline task인지 확인
     if task_id is None or task is None or task.name not in TASK_STAGE_MAP:
         return
@@ -194,6 +222,49 @@ def task_retry_handler(sender=None, task_id=None, **kwargs):
             )
 
 
+@signals.worker_init.connect
+def worker_init_handler(sender=None, **kwargs):
+    """워커 시작 시 - Prometheus 메트릭 서버 시작 (CELERY_METRICS_PORT)
+
+    Args:
+        sender: Worker instance
+        **kwargs: Additional kwargs
+    """
+    if not settings.CELERY_METRICS_PORT:
+        return
+
+    try:
+        start_metrics_server(settings.CELERY_METRICS_PORT)
+    except OSError as e:
+        logger.error(f"❌ Prometheus 메트릭 서버 시작 실패: {e}")
+
+
+@signals.worker_process_init.connect
+def worker_process_init_handler(**kwargs):
+    """자식 프로세스 시작 시 - 이벤트 루프/스테이지 런타임 초기화
+
+    Args:
+        **kwargs: Additional kwargs
+    """
+    init_worker_runtime()
+
+
+@signals.worker_process_shutdown.connect
+def worker_process_shutdown_handler(pid=None, **kwargs):
+    """자식 프로세스 종료 시 - 런타임 정리, multiprocess 메트릭 파일 정리
+
+    Args:
+        pid: 종료되는 프로세스 ID
+        **kwargs: Additional kwargs
+    """
+    shutdown_worker_runtime()
+
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(pid or os.getpid())
+
+
 @signals.worker_shutdown.connect
 def worker_shutdown_handler(sender=None, **kwargs):
     """워커 종료 시 - DB 연결 풀 정리
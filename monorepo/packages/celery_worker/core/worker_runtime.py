@@ -0,0 +1,187 @@
+"""워커 프로세스 런타임
+
+워커 프로세스당 하나의 장수 이벤트 루프(전용 스레드)와 재사용 스테이지 인스턴스를
+관리합니다. 태스크마다 asyncio.run으로 루프를 만들고 OCRStage()/LLMStage()를
+새로 생성하던 방식과 달리, HTTP 클라이언트/Repository/캐시 클라이언트를
+프로세스 수명 동안 재사용합니다.
+
+- worker_process_init에서 초기화 (prefork 자식 프로세스)
+- solo/threads 풀이나 워커 밖(스크립트 등)에서는 첫 사용 시 지연 초기화
+- 태스크 스레드는 run_async()로 코루틴을 제출하고 결과를 기다림
+  (루프가 별도 스레드이므로 threads 풀에서도 안전)
+"""
+
+import asyncio
+import inspect
+import os
+import threading
+from typing import Any, Awaitable, Callable, Coroutine, Dict, Optional, TypeVar
+
+from shared.core.logging import get_logger
+from shared.pipeline.stage import PipelineStage
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class WorkerRuntime:
+    """워커 프로세스당 이벤트 루프 + 재사용 스테이지"""
+
+    def __init__(self):
+        self.pid = os.getpid()
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_loop, name="worker-runtime-loop", daemon=True
+        )
+        self._stages: Dict[str, PipelineStage] = {}
+        self._stages_lock = threading.Lock()
+        self._thread.start()
+        logger.info(f"🔁 워커 런타임 시작: pid={self.pid}")
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """코루틴을 런타임 루프에 제출하고 결과를 기다림 (태스크 스레드에서 호출)
+
+        Args:
+            coro: 실행할 코루틴
+            timeout: 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            코루틴 반환값 (예외는 그대로 전파)
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def get_stage(self, name: str) -> PipelineStage:
+        """재사용 스테이지 인스턴스 조회 (STAGE_REGISTRY 키)
+
+        Args:
+            name: 스테이지 이름 (예: "ocr", "llm")
+        """
+        stage = self._stages.get(name)
+        if stage is None:
+            from tasks.stages import STAGE_REGISTRY
+
+            with self._stages_lock:
+                stage = self._stages.get(name)
+                if stage is None:
+                    stage = STAGE_REGISTRY[name]()
+                    self._stages[name] = stage
+        return stage
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        """스테이지 자원 정리 후 루프 종료"""
+        if not self.loop.is_running():
+            return
+
+        async def _close_stages():
+            for name, stage in self._stages.items():
+                aclose = getattr(stage, "aclose", None)
+                if aclose is None:
+                    continue
+                try:
+                    result = aclose()
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as e:
+                    logger.warning(f"⚠️ 스테이지 정리 실패 ({name}): {e}")
+
+        try:
+            self.run(_close_stages(), timeout=timeout)
+        except Exception as e:
+            logger.warning(f"⚠️ 워커 런타임 정리 실패: {e}")
+
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
+        self.loop.close()
+        self._stages.clear()
+        logger.info(f"🛑 워커 런타임 종료: pid={self.pid}")
+
+
+# 프로세스당 1개 (fork 이후 자식 프로세스에서 다시 생성)
+_runtime: Optional[WorkerRuntime] = None
+_runtime_lock = threading.Lock()
+
+
+def init_worker_runtime() -> WorkerRuntime:
+    """워커 런타임 초기화 (worker_process_init에서 호출)"""
+    global _runtime
+    with _runtime_lock:
+        # fork 전에 만들어진 런타임은 루프 스레드가 복제되지 않으므로 새로 생성
+        if _runtime is None or _runtime.pid != os.getpid():
+            _runtime = WorkerRuntime()
+    return _runtime
+
+
+def get_worker_runtime() -> WorkerRuntime:
+    """WorkerRuntime 싱글톤 인스턴스 반환 (필요 시 지연 초기화)"""
+    runtime = _runtime
+    if runtime is None or runtime.pid != os.getpid():
+        runtime = init_worker_runtime()
+    return runtime
+
+
+def shutdown_worker_runtime() -> None:
+    """워커 런타임 종료 (worker_process_shutdown에서 호출)"""
+    global _runtime
+    with _runtime_lock:
+        runtime, _runtime = _runtime, None
+    if runtime is not None and runtime.pid == os.getpid():
+        runtime.shutdown()
+
+
+def run_async(coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+    """Celery 태스크에서 코루틴 실행 (asyncio.run 대체)
+
+    Args:
+        coro: 실행할 코루틴
+        timeout: 대기 시간 (초)
+
+    Returns:
+        코루틴 반환값
+    """
+    return get_worker_runtime().run(coro, timeout)
+
+
+def close_on_loop(
+    loop: Optional[asyncio.AbstractEventLoop],
+    close: Callable[[], Awaitable[Any]],
+    name: str,
+) -> None:
+    """이전 이벤트 루프에 묶인 자원 정리 (루프가 바뀌어 자원을 다시 만들 때)
+
+    이전 루프가 아직 실행 중이면(다른 스레드) 그 루프에서 close()를 실행하고,
+    이미 멈췄거나 닫혔으면 정리할 수 없으므로 경고만 남깁니다.
+
+    Args:
+        loop: 자원이 묶인 이전 이벤트 루프
+        close: 자원을 닫는 코루틴 함수
+        name: 로그용 자원 이름
+    """
+    if loop is None:
+        return
+    if loop.is_closed() or not loop.is_running():
+        logger.warning(f"⚠️ 이전 이벤트 루프가 종료되어 {name}을(를) 닫지 못했습니다")
+        return
+
+    async def _close() -> None:
+        await close()
+
+    def _log_failure(future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning(f"⚠️ {name} 정리 실패: {future.exception()}")
+
+    asyncio.run_coroutine_threadsafe(_close(), loop).add_done_callback(_log_failure)
+
+
+def get_stage(name: str) -> PipelineStage:
+    """현재 워커 프로세스의 재사용 스테이지 인스턴스 반환"""
+    return get_worker_runtime().get_stage(name)
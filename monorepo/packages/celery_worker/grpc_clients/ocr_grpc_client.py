@@ -1,23 +1,47 @@
 # packages/celery_worker/tasks/grpc_clients/ocr_client.py
 """OCR gRPC 클라이언트"""
 
-from typing import Optional
+import asyncio
+import itertools
+from typing import List, Optional
 
 import grpc
+from core.worker_runtime import close_on_loop
 from shared.config import settings
 from shared.core.logging import get_logger
 from shared.grpc.generated import ocr_pb2, ocr_pb2_grpc
 
 logger = get_logger(__name__)
 
+_CHANNEL_OPTIONS = [
+    ("grpc.max_send_message_length", 100 * 1024 * 1024),
+    ("grpc.max_receive_message_length", 100 * 1024 * 1024),
+    ("grpc.keepalive_time_ms", 10000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    # 채널마다 별도 TCP 연결을 쓰도록 (같은 주소여도 서브채널 공유 안 함)
+    ("grpc.use_local_subchannel_pool", 1),
+]
 
-class OCRGrpcClient:
-    """OCR gRPC 클라이언트"""
 
-    def __init__(self, server_address: Optional[str] = None):
-        self.server_address = settings.ML_SERVER_GRPC_ADDRESS
-        self._channel: Optional[grpc.aio.Channel] = None
-        self._stub: Optional[ocr_pb2_grpc.OCRServiceStub] = None
+class OCRGrpcClient:
+    """OCR gRPC 클라이언트 (채널 풀)
+
+    채널 N개를 만들어 두고 요청마다 라운드 로빈으로 사용합니다. 채널 하나는
+    HTTP/2 연결 하나이므로 여러 개를 두면 동시 요청이 한 연결의 스트림 한도와
+    흐름 제어에 몰리지 않습니다. 채널은 인스턴스 수명 동안 재사용되며
+    (워커 런타임의 재사용 OCRStage가 보유), grpc.aio 채널은 이벤트 루프에
+    묶이므로 루프가 바뀌면 다시 만듭니다.
+    """
+
+    def __init__(
+        self, server_address: Optional[str] = None, pool_size: Optional[int] = None
+    ):
+        self.server_address = server_address or settings.ML_SERVER_GRPC_ADDRESS
+        self.pool_size = max(1, pool_size or settings.OCR_GRPC_CHANNELS)
+        self._channels: List[grpc.aio.Channel] = []
+        self._stubs: List[ocr_pb2_grpc.OCRServiceStub] = []
+        self._next_stub: Optional[itertools.cycle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     async def __aenter__(self):
         """컨텍스트 매니저 진입"""
@@ -29,26 +53,50 @@ class OCRGrpcClient:
         await self.close()
 
     async def connect(self):
-        """채널 연결"""
-        if self._channel is None:
-            self._channel = grpc.aio.insecure_channel(
-                self.server_address,
-                options=[
-                    ("grpc.max_send_message_length", 100 * 1024 * 1024),
-                    ("grpc.max_receive_message_length", 100 * 1024 * 1024),
-                    ("grpc.keepalive_time_ms", 10000),
-                ],
-            )
-            self._stub = ocr_pb2_grpc.OCRServiceStub(self._channel)
-            logger.info(f"gRPC 채널 연결: {self.server_address}")
+        """채널 풀 연결 (현재 이벤트 루프에 채널이 없을 때만)"""
+        loop = asyncio.get_running_loop()
+        if self._channels and self._loop is loop:
+            return
+
+        # 다른 루프에서 만든 채널은 사용할 수 없으므로 이전 루프에서 닫고 새로 생성
+        old_channels = self._channels
+        if old_channels:
+
+            async def _close_old_channels():
+                for channel in old_channels:
+                    await channel.close()
+
+            close_on_loop(self._loop, _close_old_channels, "gRPC 채널 풀")
+
+        self._channels = [
+            grpc.aio.insecure_channel(self.server_address, options=_CHANNEL_OPTIONS)
+            for _ in range(self.pool_size)
+        ]
+        self._stubs = [
+            ocr_pb2_grpc.OCRServiceStub(channel) for channel in self._channels
+        ]
+        self._next_stub = itertools.cycle(self._stubs)
+        self._loop = loop
+        logger.info(
+            f"gRPC 채널 풀 연결: {self.server_address} (채널 {self.pool_size}개)"
+        )
 
     async def close(self):
-        """채널 종료"""
-        if self._channel:
-            await self._channel.close()
-            self._channel = None
-            self._stub = None
-            logger.info("gRPC 채널 종료")
+        """채널 풀 종료"""
+        channels, self._channels = self._channels, []
+        self._stubs = []
+        self._next_stub = None
+        self._loop = None
+        for channel in channels:
+            await channel.close()
+        if channels:
+            logger.info("gRPC 채널 풀 종료")
+
+    async def _stub(self) -> ocr_pb2_grpc.OCRServiceStub:
+        await self.connect()
+        if self._next_stub is None:
+            raise Exception("_stub is None")
+        return next(self._next_stub)
 
     async def extract_text(
         self,
@@ -75,11 +123,7 @@ class OCRGrpcClient:
         Raises:
             grpc.RpcError: gRPC 통신 오류
         """
-        if not self._stub:
-            await self.connect()
-
-        if self._stub is None:
-            raise Exception("_stub is None")
+        stub = await self._stub()
 
         # 요청 생성
         request = ocr_pb2.OCRRequest(
@@ -92,10 +136,10 @@ class OCRGrpcClient:
 
         # gRPC 호출
         try:
-            response = await self._stub.ExtractText(request, timeout=timeout)
+            response = await stub.ExtractText(request, timeout=timeout)
 
             logger.info(
-                f"gRPC OCR 완료: {len(response.text_boxes)} 텍스트 박스, "
+                f"gRPC OCR 완료: {len(response.packed_boxes.texts)} 텍스트 박스, "
                 f"신뢰도: {response.overall_confidence:.2f}"
             )
 
@@ -105,20 +149,64 @@ class OCRGrpcClient:
             logger.error(f"gRPC 오류: {e.code()}, {e.details()}")
             raise
 
+    async def batch_extract_text(
+        self,
+        private_image_paths: List[str],
+        language: str = "korean",
+        confidence_threshold: float = 0.5,
+        use_angle_cls: bool = True,
+        timeout: Optional[float] = None,
+    ) -> ocr_pb2.OCRBatchResponse:
+        """배치 OCR 텍스트 추출 (BatchExtractText, 단일 응답)
+
+        Args:
+            private_image_paths: 비공개 이미지 경로 리스트
+            language: 언어
+            confidence_threshold: 신뢰도 임계값
+            use_angle_cls: 각도 분류 사용 여부
+            timeout: 타임아웃 (초, None이면 이미지 개수 * 10초 + 기본 30초)
+
+        Returns:
+            배치 OCR 응답 (results는 입력 순서)
+
+        Raises:
+            grpc.RpcError: gRPC 통신 오류
+        """
+        stub = await self._stub()
+
+        request = ocr_pb2.OCRBatchRequest(
+            image_paths=[
+                ocr_pb2.ImagePath(private_path=path) for path in private_image_paths
+            ],
+            language=language,
+            confidence_threshold=confidence_threshold,
+            use_angle_cls=use_angle_cls,
+        )
+        if timeout is None:
+            timeout = 30.0 + len(private_image_paths) * 10.0
+
+        try:
+            response = await stub.BatchExtractText(request, timeout=timeout)
+            logger.info(
+                f"gRPC 배치 OCR 완료: {response.total_success}/"
+                f"{response.total_processed} 성공"
+            )
+            return response
+
+        except grpc.RpcError as e:
+            logger.error(f"gRPC 배치 오류: {e.code()}, {e.details()}")
+            raise
+
     async def check_health(self) -> ocr_pb2.HealthCheckResponse:
         """헬스 체크
 
         Returns:
             헬스 체크 응답
         """
-        if not self._stub:
-            await self.connect()
-
-        if self._stub is None:
-            raise Exception("_stub is None")
+        stub = await self._stub()
 
         request = ocr_pb2.HealthCheckRequest(service_name="OCRService")
-        return await self._stub.CheckHealth(request)
+        return await stub.CheckHealth(request)
 
 
 # 싱글톤 인스턴스
@@ -3,19 +3,28 @@
 OCR 결과를 데이터베이스에 저장하는 책임만 담당하는 클래스
 """
 
+from typing import Dict, List, Optional, Tuple
+
 from shared.core.database import get_db_manager
 from shared.core.logging import get_logger
 from shared.pipeline.context import PipelineContext
+from shared.pipeline.progress import EVENT_CHUNK_COMPLETED, get_progress_publisher
 from shared.repository.crud.sync_crud import (
     ocr_execution_crud,
     ocr_text_box_crud,
 )
 from shared.repository.crud.sync_crud.batch_execution import batch_execution_crud
 from shared.schemas import OCRExecutionCreate
-from shared.schemas.ocr_db import OCRTextBoxCreate
+from shared.schemas.ocr_db import OCRExtractDTO, OCRTextBoxCreate
+from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 
 logger = get_logger(__name__)
 
+# (이미지 인덱스, OCRExecution 생성 데이터, OCR 결과)
+ExecutionRow = Tuple[int, OCRExecutionCreate, OCRExtractDTO]
+
 
 class OCRRepository:
     """OCR 결과 DB 저장 전담 클래스"""
@@ -23,8 +32,10 @@ class OCRRepository:
     def save_batch(self, context: PipelineContext):
         """배치 OCR 결과를 DB에 저장
 
-        배치 전체의 chain_id를 사용하고, 각 이미지 처리마다 task_log를 생성합니다.
-        트랜잭션 관리 및 에러 핸들링 개선 버전.
+        청크의 모든 OCRExecution을 다중 행 INSERT 한 번으로, 이어서 모든
+        OCRTextBox를 다중 행 INSERT로 저장하고 한 트랜잭션으로 commit합니다.
+        중복 경로 등으로 일괄 저장이 실패하면 이미지별 SAVEPOINT로 다시 저장하여
+        이미지 단위 성공/실패 집계를 유지합니다.
 
         Args:
             context: 파이프라인 컨텍스트
@@ -34,82 +45,22 @@ class OCRRepository:
             logger.warning("OCR 결과가 없어 DB 저장을 건너뜁니다.")
             return
 
-        success_count = 0
-        failed_count = 0
+        rows, failed_count = self._build_execution_rows(context)
 
         with get_db_manager().get_sync_session() as session:
             if not session:
                 raise RuntimeError("DB 세션 생성 실패")
 
             try:
-                # 각 이미지의 OCR 결과를 개별적으로 저장
-                for idx, ocr_result in enumerate(ocr_results):
-                    try:
-                        # private_imgs와 public_file_paths 확인
-                        if context.private_imgs is None:
-                            logger.warning(
-                                f"이미지 {idx}: private_imgs가 없어 건너뜁니다."
-                            )
-                            failed_count += 1
-                            continue
-
-                        image_path = (
-                            context.private_imgs[idx]
-                            if idx < len(context.private_imgs)
-                            else ""
-                        )
-                        public_path = (
-                            context.public_file_paths[idx]
-                            if context.public_file_paths
-                            and idx < len(context.public_file_paths)
-                            else ""
-                        )
-
-                        # OCRExecution 생성
-                        status = "success" if ocr_result.text_boxes else "failed"
-                        error = (
-                            "" if ocr_result.text_boxes else "No text boxes extracted"
-                        )
-
-                        ocr_execution_data = OCRExecutionCreate(
-                            chain_execution_id=context.chain_execution_id,
-                            image_path=image_path,
-                            public_path=public_path,
-                            status=status,
-                            error=error,
-                        )
-
-                        db_ocr_execution = ocr_execution_crud.create(
-                            db=session, obj_in=ocr_execution_data
-                        )
-
-                        # 텍스트 박스 저장 (있는 경우에만)
-                        text_box_count = 0
-                        for box in ocr_result.text_boxes:
-                            text_box_data = OCRTextBoxCreate(
-                                ocr_execution_id=db_ocr_execution.id,
-                                text=box.text,
-                                confidence=box.confidence,
-                                bbox=box.bbox,
-                            )
-                            ocr_text_box_crud.create(db=session, obj_in=text_box_data)
-                            text_box_count += 1
-
-                        success_count += 1
-                        logger.debug(
-                            f"이미지 {idx + 1}/{len(ocr_results)} 저장 완료: "
-                            f"chain_execution_id={context.chain_execution_id}, "
-                            f"text_boxes={text_box_count}"
-                        )
-
-                    except Exception as e:
-                        failed_count += 1
-                        logger.error(
-                            f"이미지 {idx + 1}/{len(ocr_results)} 저장 실패: {e}",
-                            exc_info=True,
-                        )
-
-                        # 개별 이미지 실패는 건너뛰고 계속 진행
+                try:
+                    success_count = self._bulk_insert(session, rows)
+                except IntegrityError as e:
+                    session.rollback()
+                    logger.warning(
+                        f"⚠️ OCR 결과 일괄 저장 실패, 이미지별 저장으로 재시도: {e.orig}"
+                    )
+                    success_count, row_failed = self._insert_per_image(session, rows)
+                    failed_count += row_failed
 
                 # 모든 이미지 처리 후 한 번만 commit
                 session.commit()
@@ -119,7 +70,7 @@ class OCRRepository:
                 )
 
                 # BatchExecution 진행 상태 업데이트
-                self._update_batch_execution(
+                counters = self._update_batch_execution(
                     session, context.batch_id, success_count, failed_count
                 )
 
@@ -129,9 +80,140 @@ class OCRRepository:
                 logger.error(f"❌ 배치 OCR DB 저장 중 오류 발생: {e}", exc_info=True)
                 raise
 
+        # 진행 이벤트는 세션이 commit된 뒤에 발행
+        # (구독자가 아직 보이지 않거나 롤백될 행의 완료 이벤트를 받지 않도록)
+        if counters:
+            get_progress_publisher().publish_counters(
+                context.batch_id,
+                EVENT_CHUNK_COMPLETED,
+                counters,
+                chain_execution_id=context.chain_execution_id,
+                succeeded=success_count,
+                failed=failed_count,
+            )
+
+    def _build_execution_rows(
+        self, context: PipelineContext
+    ) -> Tuple[List[ExecutionRow], int]:
+        """이미지별 OCRExecution 생성 데이터 구성
+
+        Returns:
+            (저장할 행 목록, 저장 전에 실패 처리된 이미지 수)
+        """
+        ocr_results = context.ocr_results
+        rows: List[ExecutionRow] = []
+        failed_count = 0
+
+        for idx, ocr_result in enumerate(ocr_results):
+            # private_imgs와 public_file_paths 확인
+            if context.private_imgs is None:
+                logger.warning(f"이미지 {idx}: private_imgs가 없어 건너뜁니다.")
+                failed_count += 1
+                continue
+
+            try:
+                image_path = (
+                    context.private_imgs[idx] if idx < len(context.private_imgs) else ""
+                )
+                public_path = (
+                    context.public_file_paths[idx]
+                    if context.public_file_paths
+                    and idx < len(context.public_file_paths)
+                    else ""
+                )
+
+                # OCRExecution 생성 데이터
+                status = "success" if ocr_result.text_boxes else "failed"
+                error = "" if ocr_result.text_boxes else "No text boxes extracted"
+
+                ocr_execution_data = OCRExecutionCreate(
+                    chain_execution_id=context.chain_execution_id,
+                    image_path=image_path,
+                    public_path=public_path,
+                    status=status,
+                    error=error,
+                )
+                rows.append((idx, ocr_execution_data, ocr_result))
+
+            except Exception as e:
+                failed_count += 1
+                logger.error(
+                    f"이미지 {idx + 1}/{len(ocr_results)} 저장 실패: {e}",
+                    exc_info=True,
+                )
+
+        return rows, failed_count
+
+    def _bulk_insert(self, session: Session, rows: List[ExecutionRow]) -> int:
+        """OCRExecution → OCRTextBox 순서로 다중 행 INSERT (commit하지 않음)
+
+        Returns:
+            저장된 이미지 수
+        """
+        if not rows:
+            return 0
+
+        # image_path는 unique이므로 RETURNING 결과를 경로로 매핑 (행 순서 비의존)
+        inserted = ocr_execution_crud.bulk_create(
+            session,
+            objs_in=[execution for _, execution, _ in rows],
+            returning=("id", "image_path"),
+        )
+        execution_ids: Dict[str, int] = {row.image_path: row.id for row in inserted}
+
+        text_boxes = [
+            self._to_text_box(execution_ids[execution.image_path], box)
+            for _, execution, ocr_result in rows
+            for box in ocr_result.text_boxes
+        ]
+        ocr_text_box_crud.bulk_create(session, objs_in=text_boxes)
+
+        logger.debug(
+            f"OCR 결과 일괄 저장: executions={len(rows)}, text_boxes={len(text_boxes)}"
+        )
+        return len(rows)
+
+    def _insert_per_image(
+        self, session: Session, rows: List[ExecutionRow]
+    ) -> Tuple[int, int]:
+        """이미지별 SAVEPOINT로 저장 (실패한 이미지만 건너뜀)
+
+        Returns:
+            (성공 수, 실패 수)
+        """
+        success_count = 0
+        failed_count = 0
+
+        for idx, execution, ocr_result in rows:
+            try:
+                with session.begin_nested():
+                    self._bulk_insert(session, [(idx, execution, ocr_result)])
+                success_count += 1
+            except Exception as e:
+                failed_count += 1
+                logger.error(
+                    f"이미지 {idx + 1}/{len(rows)} 저장 실패: {e}",
+                    exc_info=True,
+                )
+
+        return success_count, failed_count
+
+    @staticmethod
+    def _to_text_box(ocr_execution_id: int, box: OCRTextBoxCreate) -> OCRTextBoxCreate:
+        return OCRTextBoxCreate(
+            ocr_execution_id=ocr_execution_id,
+            text=box.text,
+            confidence=box.confidence,
+            bbox=box.bbox,
+        )
+
     def _update_batch_execution(
-        self, session, batch_id: str, success_count: int, failed_count: int
-    ) -> None:
+        self,
+        session,
+        batch_id: str,
+        success_count: int,
+        failed_count: int,
+    ) -> Optional[Row]:
         """BatchExecution 진행 상태 업데이트
 
         Args:
@@ -139,33 +221,33 @@ class OCRRepository:
             batch_id: 배치 ID
             success_count: 성공 개수
             failed_count: 실패 개수
+
+        Returns:
+            갱신 후 카운터 Row (진행 이벤트 발행용, 배치가 없거나 실패 시 None)
         """
         if not batch_id:
-            return
+            return None
 
         try:
-            batch_execution = batch_execution_crud.get_by_batch_id(
-                db=session, batch_id=batch_id
+            # SELECT 없이 단일 원자적 UPDATE ... RETURNING으로 반영
+            counters = batch_execution_crud.increment_counters(
+                session,
+                batch_id=batch_id,
+                completed_images=success_count,
+                failed_images=failed_count,
             )
-            if batch_execution:
-                batch_execution_crud.increment_completed_images(
-                    db=session,
-                    batch_execution=batch_execution,
-                    count=success_count,
-                )
-                if failed_count > 0:
-                    batch_execution_crud.increment_failed_images(
-                        db=session,
-                        batch_execution=batch_execution,
-                        count=failed_count,
-                    )
+            if counters:
                 logger.info(
                     f"📊 BatchExecution 진행 상태 업데이트 완료: "
                     f"batch_id={batch_id}, "
-                    f"성공={success_count}, 실패={failed_count}"
+                    f"성공={success_count}, 실패={failed_count}, "
+                    f"진행={counters.completed_images + counters.failed_images}"
+                    f"/{counters.total_images}"
                 )
             else:
                 logger.warning(f"⚠️ BatchExecution을 찾을 수 없음: batch_id={batch_id}")
+            return counters
         except Exception as e:
             logger.error(f"⚠️ BatchExecution 업데이트 실패: {e}", exc_info=True)
             # 진행 상태 업데이트 실패는 치명적이지 않으므로 계속 진행
+            return None
@@ -9,6 +9,7 @@ Public API:
 Celery Tasks:
     - process_image_chunk_task: 이미지 청크 처리 (batch.process_image_chunk)
     - convert_pdf_and_process_task: PDF 변환 및 처리 (batch.convert_pdf_and_process)
+    - run_pipeline_stages: 여러 스테이지 연속 실행 (pipeline.run_stages)
 """
 
 from .image_tasks import (
@@ -18,6 +19,7 @@ from .image_tasks import (
 from .llm_tasks import start_llm_stage
 from .ocr_tasks import start_ocr_stage
 from .pdf_tasks import start_pdf_batch_pipeline
+from .pipeline_tasks import run_pipeline_stages
 from .yolo_tasks import start_yolo_stage
 
 __all__ = [
@@ -29,4 +31,5 @@ __all__ = [
     "start_pdf_batch_pipeline",
     # Celery Tasks
     "process_image_chunk_task",
+    "run_pipeline_stages",
 ]
@@ -1,7 +1,6 @@
 from celery_app import celery_app
 from shared.core.logging import get_logger
 from shared.pipeline.cache import get_pipeline_cache_service
-from shared.pipeline.context import PipelineContext
 from shared.pipeline.exceptions import RetryableError
 from shared.schemas.enums import ProcessStatus
 
@@ -16,19 +15,23 @@ logger = get_logger(__name__)
     retry_backoff_max=600,
     retry_jitter=True,
 )
-def start_finish_stage(context_dict: dict):
+def start_finish_stage(payload: dict):
     """finish 스테이지 실행
 
     Args:
-        context_dict: PipelineContext의 딕셔너리 표현
+        payload: 이전 스테이지가 넘긴 컨텍스트 참조 (claim-check) 또는 딕셔너리
     """
-    # 딕셔너리를 PipelineContext로 변환
-    context = PipelineContext(**context_dict)
+    # 컨텍스트 참조를 PipelineContext로 복원
+    cache_service = get_pipeline_cache_service()
+    context = cache_service.from_task_payload(payload)
 
     logger.info(f"finish_stage ${context.chain_execution_id}")
 
     context.status = ProcessStatus.SUCCESS
-    get_pipeline_cache_service().save_context(context)
+    cache_service.save_context(context)
 
-    # 결과를 딕셔너리로 반환
-    return context.model_dump()
+    # 마지막 스테이지: 결과 백엔드에는 컨텍스트 참조만 남김
+    return {
+        "batch_id": context.batch_id,
+        "chain_execution_id": context.chain_execution_id,
+    }
@@ -3,10 +3,15 @@
 배치 파이프라인에서 사용하는 공통 유틸리티 함수들
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from shared.core.database import get_db, get_db_manager
 from shared.core.logging import get_logger
+from shared.pipeline.progress import (
+    EVENT_BATCH_FAILED,
+    EVENT_CHUNK_FAILED,
+    get_progress_publisher,
+)
 from shared.schemas.common import ImageResponse
 from shared.schemas.enums import ProcessStatus
 
@@ -54,6 +59,7 @@ def update_batch_statistics(
     batch_id: str,
     completed_count: int,
     failed_count: int,
+    chunk_index: Optional[int] = None,
 ):
     """배치 실행 통계 업데이트
 
@@ -61,6 +67,7 @@ def update_batch_statistics(
         batch_id: 배치 ID
         completed_count: 완료된 이미지 수
         failed_count: 실패한 이미지 수
+        chunk_index: 청크 인덱스 (실패 이벤트용)
     """
     from shared.repository.crud.sync_crud.batch_execution import batch_execution_crud
 
@@ -69,28 +76,26 @@ def update_batch_statistics(
             logger.warning("DB 세션 생성 실패 - 통계 업데이트 건너뜀")
             return
 
-        batch_execution = batch_execution_crud.get_by_batch_id(
-            session, batch_id=batch_id
+        # 완료/실패 이미지 수 + 청크 완료를 단일 원자적 UPDATE로 반영
+        counters = batch_execution_crud.increment_counters(
+            session,
+            batch_id=batch_id,
+            completed_images=completed_count,
+            failed_images=failed_count,
+            completed_chunks=1,
         )
 
-        if not batch_execution:
+        if counters is None:
             logger.warning(f"BatchExecution을 찾을 수 없음: batch_id={batch_id}")
-            return
-
-        # 완료/실패 이미지 수 업데이트
-        if completed_count > 0:
-            batch_execution_crud.increment_completed_images(
-                session, batch_execution=batch_execution, count=completed_count
-            )
-
-        if failed_count > 0:
-            batch_execution_crud.increment_failed_images(
-                session, batch_execution=batch_execution, count=failed_count
-            )
 
-        # 청크 완료 표시
-        batch_execution_crud.increment_completed_chunks(
-            session, batch_execution=batch_execution
+    # 청크 전체 실패는 OCR 결과 저장 경로를 거치지 않으므로 여기서 이벤트 발행
+    if failed_count:
+        get_progress_publisher().publish_counters(
+            batch_id,
+            EVENT_CHUNK_FAILED,
+            counters,
+            chunk_index=chunk_index,
+            failed=failed_count,
         )
 
 
@@ -150,6 +155,32 @@ def start_batch_execution(batch_id: str):
             session.commit()
 
 
+def fail_batch_execution(batch_id: str, error_message: str):
+    """배치 실행 실패 상태로 변경
+
+    Args:
+        batch_id: 배치 ID
+        error_message: 실패 사유
+    """
+    from shared.repository.crud.sync_crud.batch_execution import batch_execution_crud
+
+    with get_db_manager().get_sync_session() as session:
+        if not session:
+            logger.warning("DB 세션 생성 실패 - 상태 업데이트 건너뜀")
+            return
+
+        batch_execution = batch_execution_crud.get_by_batch_id(
+            session, batch_id=batch_id
+        )
+        if batch_execution:
+            batch_execution.complete_execution(
+                success=False, error_message=error_message
+            )
+            session.commit()
+
+    get_progress_publisher().publish(batch_id, EVENT_BATCH_FAILED, error=error_message)
+
+
 # ==================== 비동기 버전 헬퍼 함수들 ====================
 
 
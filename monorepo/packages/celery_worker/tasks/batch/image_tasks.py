@@ -9,6 +9,11 @@ from celery import group
 from celery_app import celery_app
 from shared.core.logging import get_logger
 from shared.pipeline.exceptions import RetryableError
+from shared.pipeline.progress import (
+    EVENT_BATCH_STARTED,
+    EVENT_CHUNK_STARTED,
+    get_progress_publisher,
+)
 from shared.schemas.common import ImageResponse
 
 from .helpers import (
@@ -56,6 +61,10 @@ def process_image_chunk_task(
         f"images={len(image_dicts)}"
     )
 
+    get_progress_publisher().publish(
+        batch_id, EVENT_CHUNK_STARTED, chunk_index=chunk_index, images=len(image_dicts)
+    )
+
     completed_count = 0
     failed_count = 0
 
@@ -86,6 +95,7 @@ def process_image_chunk_task(
         batch_id=batch_id,
         completed_count=completed_count,
         failed_count=failed_count,
+        chunk_index=chunk_index,
     )
 
     logger.info(
@@ -153,6 +163,12 @@ async def start_image_batch_pipeline(
 
     # # 5. 배치 실행 시작 상태로 변경 (비동기)
     await async_start_batch_execution(batch_id)
+    get_progress_publisher().publish(
+        batch_id,
+        EVENT_BATCH_STARTED,
+        total_images=len(file_response),
+        total_chunks=len(chunks),
+    )
 
     # # 6. 비동기 실행
     chunk_tasks.apply_async()
@@ -1,10 +1,9 @@
 from celery_app import celery_app
+from core.worker_runtime import get_stage, run_async
 from shared.core.logging import get_logger
-from shared.pipeline.context import PipelineContext
+from shared.pipeline.cache import get_pipeline_cache_service
 from shared.pipeline.exceptions import RetryableError
 
-from tasks.stages.ocr_stage import OCRStage
-
 logger = get_logger(__name__)
 
 
@@ -16,22 +15,21 @@ logger = get_logger(__name__)
     retry_backoff_max=600,
     retry_jitter=True,
 )
-def start_ocr_stage(context_dict: dict):
+def start_ocr_stage(payload: dict):
     """OCR 스테이지 실행
 
     Args:
-        context_dict: PipelineContext의 딕셔너리 표현
+        payload: 이전 스테이지가 넘긴 컨텍스트 참조 (claim-check) 또는 딕셔너리
     """
-    import asyncio
-
-    # 딕셔너리를 PipelineContext로 변환
-    context = PipelineContext(**context_dict)
+    # 컨텍스트 참조를 PipelineContext로 복원
+    cache_service = get_pipeline_cache_service()
+    context = cache_service.from_task_payload(payload)
 
-    stage = OCRStage()
-    # 비동기 함수를 동기적으로 실행
-    context = asyncio.run(stage.run(context))
+    # 워커 프로세스의 재사용 스테이지를 장수 이벤트 루프에서 실행
+    stage = get_stage("ocr")
+    context = run_async(stage.run(context))
 
     logger.info(f"ocr_stage ${context.chain_execution_id}")
 
-    # 결과를 딕셔너리로 반환
-    return context.model_dump()
+    # 다음 스테이지로 컨텍스트 참조 전달 (본문은 Redis에 저장)
+    return cache_service.to_task_payload(context)
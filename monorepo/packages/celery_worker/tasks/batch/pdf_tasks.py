@@ -3,7 +3,9 @@ import asyncio
 from typing import Any, Dict
 
 from celery_app import celery_app
+from core.worker_runtime import run_async
 from shared.core.logging import get_logger
+from shared.pipeline.progress import EVENT_BATCH_STARTED, get_progress_publisher
 from shared.service.common_service import get_common_service
 
 logger = get_logger(__name__)
@@ -21,55 +23,95 @@ def convert_pdf_and_process_task(
 ):
     """
     PDF를 이미지로 변환하고, 이미지 배치 파이프라인을 시작하는 Celery 태스크
+
+    페이지가 업로드되는 대로 chunk_size 단위로 모아, 청크가 채워지면
+    즉시 process_image_chunk_task를 디스패치합니다.
+    (전체 PDF 변환을 기다리지 않으므로 첫 OCR 결과까지의 시간이 짧아짐)
     """
     logger.info(f"PDF 변환 및 처리 작업 시작: batch_id={batch_id}")
+    batch_created = False
 
     async def _async_run():
         common_service = get_common_service()
-        # start_pdf_batch_pipeline의 비동기 로직을 이곳으로 이동
-        from celery import group
-
         from tasks.batch.helpers import (
             convert_to_image_response_dicts,
             create_batch_execution,
-            split_into_chunks,
             start_batch_execution,
         )
         from tasks.batch.image_tasks import process_image_chunk_task
 
-        image_responses = await common_service.download_and_split_pdf(
-            pdf_url, original_filename
-        )
-        total_images = len(image_responses)
-
-        create_batch_execution(
-            batch_id=batch_id,
-            batch_name=batch_name,
-            total_images=total_images,
-            chunk_size=chunk_size,
-            initiated_by=initiated_by,
-            options=options,
-        )
+        total_pages = 0
+        # 청크 인덱스 -> {페이지 번호: 이미지 dict}
+        pending_chunks: Dict[int, Dict[int, Dict[str, str]]] = {}
+        dispatched = 0
 
-        image_dicts = convert_to_image_response_dicts(image_responses)
-        chunks = split_into_chunks(image_dicts, chunk_size)
-        chunk_tasks = group(
-            process_image_chunk_task.s(
+        def _start_batch(page_count: int):
+            nonlocal batch_created
+            # 페이지 수로 BatchExecution을 미리 생성 (total_images 확정)
+            create_batch_execution(
                 batch_id=batch_id,
-                chunk_index=idx,
-                image_dicts=chunk,
+                batch_name=batch_name,
+                total_images=page_count,
+                chunk_size=chunk_size,
+                initiated_by=initiated_by,
                 options=options,
             )
-            for idx, chunk in enumerate(chunks)
-        )
+            batch_created = True
+            start_batch_execution(batch_id)
+            get_progress_publisher().publish(
+                batch_id,
+                EVENT_BATCH_STARTED,
+                total_images=page_count,
+                total_chunks=(page_count + chunk_size - 1) // chunk_size,
+            )
+
+        async def _on_page_count(page_count: int):
+            nonlocal total_pages
+            total_pages = page_count
+            # 동기 DB/Redis 호출은 공유 런타임 루프를 막지 않도록 스레드에서 실행
+            await asyncio.to_thread(_start_batch, page_count)
 
-        start_batch_execution(batch_id)
-        chunk_tasks.apply_async()
+        def _chunk_length(chunk_index: int) -> int:
+            return min(chunk_size, total_pages - chunk_index * chunk_size)
+
+        async for page_num, image_response in common_service.stream_pdf_pages(
+            pdf_url, original_filename, on_page_count=_on_page_count
+        ):
+            chunk_index = (page_num - 1) // chunk_size
+            chunk = pending_chunks.setdefault(chunk_index, {})
+            chunk[page_num] = convert_to_image_response_dicts([image_response])[0]
+
+            if len(chunk) < _chunk_length(chunk_index):
+                continue
+
+            # 청크의 모든 페이지 업로드 완료 → 페이지 순서대로 즉시 디스패치
+            del pending_chunks[chunk_index]
+            # 브로커 발행도 동기 I/O이므로 스레드에서 실행
+            await asyncio.to_thread(
+                process_image_chunk_task.apply_async,
+                kwargs={
+                    "batch_id": batch_id,
+                    "chunk_index": chunk_index,
+                    "image_dicts": [chunk[num] for num in sorted(chunk)],
+                    "options": options,
+                },
+            )
+            dispatched += 1
+            logger.info(
+                f"📤 청크 {chunk_index} 디스패치: batch_id={batch_id}, "
+                f"pages={len(chunk)}, 진행={dispatched}"
+                f"/{(total_pages + chunk_size - 1) // chunk_size}"
+            )
 
     try:
-        asyncio.run(_async_run())
+        run_async(_async_run())
     except Exception as e:
         logger.error(f"❌ PDF 처리 중 오류 발생: batch_id={batch_id}, error={e}")
+        if batch_created:
+            # 일부 청크만 디스패치된 상태로 남지 않도록 배치를 실패 처리
+            from tasks.batch.helpers import fail_batch_execution
+
+            fail_batch_execution(batch_id, f"PDF 변환 실패: {e}")
         raise
 
 
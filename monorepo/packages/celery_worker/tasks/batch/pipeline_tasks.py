@@ -0,0 +1,49 @@
+from typing import List
+
+from celery_app import celery_app
+from core.worker_runtime import get_stage, run_async
+from shared.core.logging import get_logger
+from shared.pipeline.cache import get_pipeline_cache_service
+from shared.pipeline.orchestrator import RETRYABLE_EXCEPTIONS, PipelineOrchestrator
+
+from tasks.stages import STAGE_REGISTRY
+
+logger = get_logger(__name__)
+
+
+@celery_app.task(
+    name="pipeline.run_stages",
+    max_retries=3,
+    autoretry_for=RETRYABLE_EXCEPTIONS,
+    retry_backoff=True,
+    retry_backoff_max=600,
+    retry_jitter=True,
+)
+def run_pipeline_stages(payload: dict, stage_names: List[str]):
+    """여러 스테이지를 한 태스크에서 연속 실행 (스테이지 간 브로커 hop 없음)
+
+    재시도 시 Redis 체크포인트에서 재개하여 완료된 스테이지는 건너뜁니다.
+
+    Args:
+        payload: 컨텍스트 참조 (claim-check) 또는 딕셔너리
+        stage_names: 실행할 스테이지 이름 목록 (STAGE_REGISTRY 키)
+    """
+    unknown = [name for name in stage_names if name not in STAGE_REGISTRY]
+    if unknown:
+        raise ValueError(f"알 수 없는 스테이지: {unknown}")
+
+    orchestrator = PipelineOrchestrator(
+        stages=[get_stage(name) for name in stage_names]
+    )
+    context = orchestrator.restore(payload)
+
+    # 모든 스테이지를 워커 프로세스의 장수 이벤트 루프에서 실행
+    context = run_async(orchestrator.execute(context))
+
+    logger.info(
+        f"스테이지 연속 실행 완료: stages={stage_names}, "
+        f"chain_id={context.chain_execution_id}"
+    )
+
+    # 다른 워커 풀의 스테이지를 chain으로 이어 붙일 수 있도록 참조 반환
+    return get_pipeline_cache_service().to_task_payload(context)
@@ -1,6 +1,6 @@
 from celery_app import celery_app
 from shared.core.logging import get_logger
-from shared.pipeline.context import PipelineContext
+from shared.pipeline.cache import get_pipeline_cache_service
 from shared.pipeline.exceptions import RetryableError
 
 logger = get_logger(__name__)
@@ -14,18 +14,19 @@ logger = get_logger(__name__)
     retry_backoff_max=600,
     retry_jitter=True,
 )
-def start_yolo_stage(context_dict: dict):
+def start_yolo_stage(payload: dict):
     """yolo 스테이지 실행
 
     Args:
-        context_dict: PipelineContext의 딕셔너리 표현
+        payload: 이전 스테이지가 넘긴 컨텍스트 참조 (claim-check) 또는 딕셔너리
     """
-    # 딕셔너리를 PipelineContext로 변환
-    context = PipelineContext(**context_dict)
+    # 컨텍스트 참조를 PipelineContext로 복원
+    cache_service = get_pipeline_cache_service()
+    context = cache_service.from_task_payload(payload)
 
     logger.info(f"yolo_stage ${context.chain_execution_id}")
 
     # TODO: YOLO Stage 로직 구현
 
-    # 결과를 딕셔너리로 반환
-    return context.model_dump()
+    # 다음 스테이지로 컨텍스트 참조 전달 (본문은 Redis에 저장)
+    return cache_service.to_task_payload(context)
@@ -3,43 +3,127 @@
 OpenAI API를 통해 vLLM 서버와 통신하는 책임만 담당하는 클래스
 """
 
-from typing import Any, Dict, Iterator, List, Optional
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
 
-from openai import OpenAI
+import httpx
+from core.worker_runtime import close_on_loop
+from openai import AsyncOpenAI, AsyncStream, DefaultAsyncHttpxClient
 from openai.types.chat import ChatCompletion, ChatCompletionChunk
+from shared.config import settings
 from shared.core.logging import get_logger
+from shared.llm.model_registry import LLMModelRegistry, get_llm_model_registry
+from shared.llm.response_cache import LLMResponseCache, get_llm_response_cache
+from shared.service.rate_limiter import RedisTokenBucket
 
 logger = get_logger(__name__)
 
 
 class LLMClient:
-    """vLLM 서버 통신 전담 클래스 (OpenAI API 호환)"""
+    """vLLM 서버 통신 전담 클래스 (OpenAI API 호환)
+
+    keep-alive 연결 풀을 가진 AsyncOpenAI 클라이언트 하나를 인스턴스 수명 동안
+    재사용합니다. (워커 런타임의 재사용 LLMStage가 보유, 종료 시 aclose)
+    LLM_RATE_LIMIT_PER_SEC가 설정되면 모든 요청 전에 Redis 토큰 버킷에서
+    토큰을 받아 전체 워커의 요청 속도를 제한합니다.
+    use_cache=True이면 결정적 요청(temperature 0)의 응답을 LLMResponseCache에서
+    재사용합니다. (캐시 적중 시 속도 제한 토큰도 쓰지 않음)
+    모델 목록과 모델별 지연 통계는 서버 URL별 LLMModelRegistry가 관리합니다.
+    """
 
     def __init__(
         self,
-        server_url: str = "http://localhost:38000/v1",
-        api_key: str = "EMPTY",
-        timeout: float = 60.0,
+        server_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        timeout: Optional[float] = None,
+        use_cache: bool = False,
     ):
         """LLMClient 초기화
 
         Args:
-            server_url: vLLM 서버 URL (기본값: http://localhost:38000/v1)
+            server_url: vLLM 서버 URL (기본값: settings.LLM_SERVER_URL)
             api_key: API 키 (vLLM은 "EMPTY" 사용)
-            timeout: 요청 타임아웃 (초 단위, 기본값: 60.0)
+            timeout: 요청 타임아웃 (초 단위, 기본값: settings.LLM_TIMEOUT)
+            use_cache: 결정적 요청의 응답 캐시 사용 여부
         """
-        self.server_url = server_url
-        self.api_key = api_key
-        self.timeout = timeout
-        self.client = OpenAI(
-            api_key=api_key,
-            base_url=server_url,
-            timeout=timeout,
+        self.server_url = server_url or settings.LLM_SERVER_URL
+        self.api_key = api_key or settings.LLM_API_KEY
+        self.timeout = timeout or settings.LLM_TIMEOUT
+        self._client: Optional[AsyncOpenAI] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.model_registry: LLMModelRegistry = get_llm_model_registry(
+            self.server_url, self.api_key
+        )
+        self.cache: Optional[LLMResponseCache] = (
+            get_llm_response_cache() if use_cache else None
+        )
+
+        self.rate_limiter: Optional[RedisTokenBucket] = None
+        if settings.LLM_RATE_LIMIT_PER_SEC > 0:
+            self.rate_limiter = RedisTokenBucket(
+                name="llm",
+                rate=settings.LLM_RATE_LIMIT_PER_SEC,
+                capacity=settings.LLM_RATE_LIMIT_BURST,
+            )
+        logger.info(f"LLMClient 초기화 완료: {self.server_url}")
+
+    def _create_client(self) -> AsyncOpenAI:
+        limits = httpx.Limits(
+            max_connections=settings.LLM_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.LLM_MAX_CONNECTIONS,
+        )
+        logger.info(
+            f"🔌 LLM HTTP 연결 풀 생성: {self.server_url} "
+            f"(max={limits.max_connections})"
+        )
+        return AsyncOpenAI(
+            api_key=self.api_key,
+            base_url=self.server_url,
+            timeout=self.timeout,
+            http_client=DefaultAsyncHttpxClient(limits=limits),
         )
-        logger.info(f"LLMClient 초기화 완료: {server_url}")
 
-    async def get_available_models(self) -> List[str]:
-        """사용 가능한 모델 목록 조회
+    @property
+    def client(self) -> AsyncOpenAI:
+        """현재 이벤트 루프용 풀 클라이언트 (루프가 바뀌면 새로 생성)"""
+        loop = asyncio.get_running_loop()
+        if (
+            self._client is None
+            or self._client.is_closed()
+            or self._client_loop is not loop
+        ):
+            # 다른 루프(asyncio.run 등)에서 만든 연결은 재사용할 수 없으므로
+            # 이전 루프에서 닫고 새로 생성
+            old_client = self._client
+            if old_client is not None and not old_client.is_closed():
+                close_on_loop(
+                    self._client_loop, old_client.close, "LLM HTTP 클라이언트"
+                )
+            self._client = self._create_client()
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """연결 풀 종료 (워커 프로세스 종료 시)"""
+        if self._client is not None and not self._client.is_closed():
+            await self._client.close()
+        self._client = None
+        self._client_loop = None
+
+    async def _acquire(self) -> None:
+        """속도 제한 토큰 대기 (제한이 꺼져 있으면 즉시 반환)"""
+        if self.rate_limiter is None:
+            return
+        waited = await self.rate_limiter.acquire()
+        if waited > 0:
+            logger.debug(f"LLM 속도 제한 대기: {waited * 1000:.0f}ms")
+
+    async def get_available_models(self, force_refresh: bool = False) -> List[str]:
+        """사용 가능한 모델 목록 조회 (모델 레지스트리 캐시)
+
+        Args:
+            force_refresh: 캐시를 무시하고 서버에서 다시 조회
 
         Returns:
             List[str]: 모델 ID 리스트
@@ -48,14 +132,19 @@ class LLMClient:
             Exception: 모델 조회 실패
         """
         try:
-            models = self.client.models.list()
-            model_ids = [model.id for model in models.data]
-            logger.info(f"사용 가능한 모델: {model_ids}")
-            return model_ids
+            return await self.model_registry.get_models(force_refresh)
         except Exception as e:
             logger.error(f"모델 목록 조회 실패: {str(e)}")
             raise
 
+    async def resolve_model(self, model: Optional[str] = None) -> str:
+        """요청에 사용할 모델 (지정하지 않으면 레지스트리의 기본 모델)
+
+        Raises:
+            ValueError: 사용 가능한 모델이 없음
+        """
+        return await self.model_registry.resolve(model)
+
     async def chat_completion(
         self,
         messages: List[Dict[str, str]],
@@ -64,7 +153,7 @@ class LLMClient:
         max_tokens: Optional[int] = None,
         stream: bool = False,
         **kwargs: Any,
-    ) -> ChatCompletion | Iterator[ChatCompletionChunk]:
+    ) -> ChatCompletion | AsyncStream[ChatCompletionChunk]:
         """채팅 완성 요청
 
         Args:
@@ -76,7 +165,8 @@ class LLMClient:
             **kwargs: 추가 OpenAI API 파라미터
 
         Returns:
-            ChatCompletion | Iterator[ChatCompletionChunk]: 완성 결과 또는 스트리밍 청크
+            ChatCompletion | AsyncStream[ChatCompletionChunk]: 완성 결과 또는
+                스트리밍 청크
 
         Raises:
             ValueError: 사용 가능한 모델이 없거나 메시지가 비어있음
@@ -85,25 +175,50 @@ class LLMClient:
         if not messages:
             raise ValueError("메시지가 비어있습니다")
 
-        # 모델이 지정되지 않으면 첫 번째 모델 사용
+        # 모델이 지정되지 않으면 레지스트리의 기본 모델 사용
         if model is None:
-            available_models = await self.get_available_models()
-            if not available_models:
-                raise ValueError("사용 가능한 모델이 없습니다")
-            model = available_models[0]
+            model = await self.resolve_model()
             logger.info(f"기본 모델 사용: {model}")
 
+        params = {
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": stream,
+            **kwargs,
+        }
+
+        async def create() -> Any:
+            await self._acquire()
+            start = time.perf_counter()
+            try:
+                response = await self.client.chat.completions.create(
+                    messages=messages,  # type: ignore
+                    model=model,
+                    **params,
+                )  # type: ignore
+            except Exception as e:
+                self.model_registry.record(model, time.perf_counter() - start, e)
+                raise
+            # 스트리밍은 첫 응답(헤더)까지의 시간만 반영되므로 제외
+            if not stream:
+                self.model_registry.record(
+                    model,
+                    time.perf_counter() - start,
+                    completion_tokens=(
+                        response.usage.completion_tokens if response.usage else None
+                    ),
+                )
+            return response
+
         try:
             logger.info(f"채팅 완성 요청 (모델: {model}, 스트리밍: {stream})")
 
-            response = self.client.chat.completions.create(
-                messages=messages,  # type: ignore
-                model=model,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                stream=stream,
-                **kwargs,
-            )  # type: ignore
+            if self.cache is not None:
+                response = await self.cache.cached_completion(
+                    model, messages, params, create
+                )
+            else:
+                response = await create()
 
             if stream:
                 logger.info("스트리밍 응답 시작")
@@ -116,7 +231,7 @@ class LLMClient:
             logger.error(f"채팅 완성 실패: {str(e)}")
             raise
 
-    def simple_chat(
+    async def simple_chat(
         self,
         user_message: str,
         system_message: Optional[str] = None,
@@ -142,19 +257,19 @@ class LLMClient:
             messages.append({"role": "system", "content": system_message})
         messages.append({"role": "user", "content": user_message})
 
-        response = self.chat_completion(messages=messages, model=model, **kwargs)
+        response = await self.chat_completion(messages=messages, model=model, **kwargs)
 
         if not isinstance(response, ChatCompletion):
             raise ValueError("스트리밍 응답이 아닌 일반 응답을 기대했습니다")
 
         return response.choices[0].message.content or ""
 
-    def stream_chat(
+    async def stream_chat(
         self,
         messages: List[Dict[str, str]],
         model: Optional[str] = None,
         **kwargs: Any,
-    ) -> Iterator[str]:
+    ) -> AsyncIterator[str]:
         """스트리밍 채팅 요청
 
         Args:
@@ -168,7 +283,7 @@ class LLMClient:
         Raises:
             Exception: API 호출 실패
         """
-        stream_response = self.chat_completion(
+        stream_response = await self.chat_completion(
             messages=messages, model=model, stream=True, **kwargs
         )
 
@@ -176,7 +291,8 @@ class LLMClient:
         if isinstance(stream_response, ChatCompletion):
             raise ValueError("스트리밍 응답을 기대했지만 일반 응답을 받았습니다")
 
-        # 스트리밍 청크 처리
-        for chunk in stream_response:
-            if chunk.choices and chunk.choices[0].delta.content:
-                yield chunk.choices[0].delta.content
+        # 스트리밍 청크 처리 (중단 시 응답 연결 반환)
+        async with stream_response:
+            async for chunk in stream_response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
@@ -3,20 +3,81 @@
 HTTP/gRPC를 통해 ML 서버와 통신하는 책임만 담당하는 클래스
 """
 
+import asyncio
 import json
-from typing import List
+import time
+from typing import Any, List, Optional
 
 import httpx
 from celery.beat import get_logger
+from core.worker_runtime import close_on_loop
+from shared.config import settings
 from shared.pipeline.exceptions import RetryableError
+from shared.pipeline.metrics import ML_CLIENT_REQUEST_SECONDS
 from shared.schemas.ocr_db import OCRExtractDTO
 from shared.schemas.ocr_text_box import OCRTextBoxCreate
 
+try:
+    import h2  # noqa: F401
+except ImportError:  # 선택 의존성 (httpx[http2])
+    _HTTP2_AVAILABLE = False
+else:
+    _HTTP2_AVAILABLE = True
+
 logger = get_logger(__name__)
 
 
+class _RequestTrace:
+    """httpx trace 확장으로 요청 구간(connect/TTFB/total) 측정"""
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        self._start = time.perf_counter()
+        self._connect_start: Optional[float] = None
+        self.connect: Optional[float] = None
+        self.ttfb: Optional[float] = None
+
+    async def __call__(self, event_name: str, info: dict) -> None:
+        now = time.perf_counter()
+        if event_name == "connection.connect_tcp.started":
+            self._connect_start = now
+        elif event_name in (
+            "connection.connect_tcp.complete",
+            "connection.start_tls.complete",
+        ):
+            # TLS가 있으면 start_tls 완료 시점까지 연결 시간으로 봄
+            if self._connect_start is not None:
+                self.connect = now - self._connect_start
+        elif event_name.endswith("receive_response_headers.complete"):
+            self.ttfb = now - self._start
+
+    def observe(self, http_version: str) -> None:
+        total = time.perf_counter() - self._start
+        if self.connect is not None:
+            ML_CLIENT_REQUEST_SECONDS.labels(self.endpoint, "connect").observe(
+                self.connect
+            )
+        if self.ttfb is not None:
+            ML_CLIENT_REQUEST_SECONDS.labels(self.endpoint, "ttfb").observe(self.ttfb)
+        ML_CLIENT_REQUEST_SECONDS.labels(self.endpoint, "total").observe(total)
+
+        logger.debug(
+            f"OCR HTTP {self.endpoint} ({http_version}): "
+            f"connect={_ms(self.connect)}, ttfb={_ms(self.ttfb)}, "
+            f"total={_ms(total)}"
+        )
+
+
+def _ms(seconds: Optional[float]) -> str:
+    return "reused" if seconds is None else f"{seconds * 1000:.1f}ms"
+
+
 class OCRClient:
-    """ML 서버 통신 전담 클래스"""
+    """ML 서버 통신 전담 클래스
+
+    keep-alive 연결 풀을 가진 httpx.AsyncClient 하나를 인스턴스 수명 동안
+    재사용합니다. (워커 런타임의 재사용 OCRStage가 보유, 종료 시 aclose)
+    """
 
     def __init__(self, server_url: str):
         """OCRClient 초기화
@@ -25,6 +86,96 @@ class OCRClient:
             server_url: ML 서버 URL
         """
         self.server_url = server_url
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _create_client(self) -> httpx.AsyncClient:
+        http2 = settings.OCR_HTTP2 and _HTTP2_AVAILABLE
+        if settings.OCR_HTTP2 and not _HTTP2_AVAILABLE:
+            logger.warning("⚠️ h2 패키지 없음, OCR 서버 요청에 HTTP/1.1을 사용합니다")
+
+        limits = httpx.Limits(
+            max_connections=settings.OCR_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.OCR_HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=settings.OCR_HTTP_KEEPALIVE_EXPIRY,
+        )
+        logger.info(
+            f"🔌 OCR HTTP 연결 풀 생성: {self.server_url} "
+            f"(max={limits.max_connections}, "
+            f"keepalive={limits.max_keepalive_connections}, http2={http2})"
+        )
+        return httpx.AsyncClient(
+            base_url=self.server_url,
+            timeout=httpx.Timeout(30.0, connect=settings.OCR_HTTP_CONNECT_TIMEOUT),
+            # 연결 수립 실패만 한 번 재시도 (요청 재전송은 Celery 재시도에 맡김)
+            transport=httpx.AsyncHTTPTransport(http2=http2, limits=limits, retries=1),
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """현재 이벤트 루프용 풀 클라이언트 (루프가 바뀌면 새로 생성)"""
+        loop = asyncio.get_running_loop()
+        if (
+            self._client is None
+            or self._client.is_closed
+            or self._client_loop is not loop
+        ):
+            # 다른 루프(asyncio.run 등)에서 만든 연결은 재사용할 수 없으므로
+            # 이전 루프에서 닫고 새로 생성
+            old_client = self._client
+            if old_client is not None and not old_client.is_closed:
+                close_on_loop(
+                    self._client_loop, old_client.aclose, "OCR HTTP 클라이언트"
+                )
+            self._client = self._create_client()
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """연결 풀 종료 (워커 프로세스 종료 시)"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+
+    async def _post(self, endpoint: str, timeout: float, **kwargs: Any) -> Any:
+        """풀 클라이언트로 POST 요청 후 JSON 응답 반환
+
+        Raises:
+            RetryableError: 타임아웃, 연결 오류, 서버 오류 (5xx)
+            ValueError: 클라이언트 오류 (4xx)
+        """
+        trace = _RequestTrace(endpoint)
+        try:
+            response = await self.client.post(
+                endpoint,
+                timeout=httpx.Timeout(
+                    timeout, connect=settings.OCR_HTTP_CONNECT_TIMEOUT
+                ),
+                extensions={"trace": trace},
+                **kwargs,
+            )
+        except httpx.TimeoutException as e:
+            raise RetryableError("OCRClient", f"BentoML timeout: {str(e)}") from e
+        except httpx.TransportError as e:
+            # 연결 실패, 유휴 연결이 서버에서 끊긴 경우 등
+            raise RetryableError(
+                "OCRClient", f"BentoML connection error: {str(e)}"
+            ) from e
+
+        trace.observe(response.http_version)
+
+        # 응답 확인
+        if response.status_code != 200:
+            error_msg = (
+                f"BentoML API failed ({endpoint}): "
+                f"{response.status_code} - {response.text}"
+            )
+            if response.status_code >= 500:
+                raise RetryableError("OCRClient", error_msg)
+            raise ValueError(error_msg)
+
+        return response.json()
 
     async def call_single(self, image_path: str, options: dict) -> OCRExtractDTO:
         """단일 이미지 OCR 요청
@@ -42,54 +193,30 @@ class OCRClient:
         """
         logger.info(f"단일 BentoML OCR 요청: {image_path}")
 
-        try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                request_data = {
-                    "private_img": image_path,
-                    "language": options.get("language", "korean"),
-                    "confidence_threshold": options.get("confidence_threshold", 0.5),
-                    "use_angle_cls": options.get("use_angle_cls", True),
-                }
-                data = {"request_data": json.dumps(request_data)}
-
-                response = await client.post(
-                    f"{self.server_url}/extract_text",
-                    data=data,
-                )
-
-                # 응답 확인
-                if response.status_code != 200:
-                    error_msg = (
-                        f"BentoML API failed: {response.status_code} - {response.text}"
-                    )
-                    if response.status_code >= 500:
-                        raise RetryableError("OCRClient", error_msg)
-                    else:
-                        raise ValueError(error_msg)
+        request_data = {
+            "private_img": image_path,
+            "language": options.get("language", "korean"),
+            "confidence_threshold": options.get("confidence_threshold", 0.5),
+            "use_angle_cls": options.get("use_angle_cls", True),
+        }
+        result = await self._post(
+            "/extract_text",
+            timeout=30.0,
+            data={"request_data": json.dumps(request_data)},
+        )
 
-                # JSON 응답 파싱
-                result = response.json()
+        # OCRExtractDTO로 변환
+        text_boxes = self._parse_text_boxes(result.get("text_boxes", []))
 
-                # OCRExtractDTO로 변환
-                text_boxes = self._parse_text_boxes(result.get("text_boxes", []))
+        logger.info(f"단일 BentoML OCR 완료: {len(text_boxes)} 텍스트 박스")
 
-                logger.info(f"단일 BentoML OCR 완료: {len(text_boxes)} 텍스트 박스")
-
-                return OCRExtractDTO(
-                    text_boxes=text_boxes,
-                )
-
-        except httpx.TimeoutException as e:
-            raise RetryableError("OCRClient", f"BentoML timeout: {str(e)}") from e
-        except httpx.ConnectError as e:
-            raise RetryableError(
-                "OCRClient", f"BentoML connection error: {str(e)}"
-            ) from e
+        return OCRExtractDTO(
+            text_boxes=text_boxes,
+        )
 
     async def call_batch(
         self, image_paths: List[str], options: dict
     ) -> List[OCRExtractDTO]:
-        logger.info(f"port = ${self.server_url}")
         """배치 이미지 OCR 요청
 
         Args:
@@ -108,62 +235,33 @@ class OCRClient:
         # 배치는 타임아웃을 길게 설정 (이미지 개수 * 10초 + 기본 30초)
         timeout = 30.0 + (len(image_paths) * 10.0)
 
-        try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                payload = {
-                    "request_data": {
-                        "language": options.get("language", "korean"),
-                        "confidence_threshold": options.get(
-                            "confidence_threshold", 0.5
-                        ),
-                        "use_angle_cls": options.get("use_angle_cls", True),
-                    },
-                    "private_imgs": image_paths,
-                }
-
-                response = await client.post(
-                    f"{self.server_url}/extract_text_batch",
-                    json=payload,
-                )
-
-                # 응답 확인
-                if response.status_code != 200:
-                    error_msg = (
-                        f"BentoML Batch API failed: "
-                        f"{response.status_code} - {response.text}"
-                    )
-
-                    if response.status_code >= 500:
-                        raise RetryableError("OCRClient", error_msg)
-                    else:
-                        raise ValueError(error_msg)
-
-                # BatchOCRResponse 파싱
-                result = response.json()
-
-                # OCRExtractDTO 리스트로 변환
-                ocr_results = []
-                for r in result["results"]:
-                    text_boxes = self._parse_text_boxes(r.get("text_boxes", []))
-                    ocr_results.append(
-                        OCRExtractDTO(
-                            text_boxes=text_boxes,
-                        )
-                    )
-
-                logger.info(
-                    f"배치 BentoML OCR 완료: {result['total_success']}/"
-                    f"{result['total_processed']} 성공"
+        payload = {
+            "request_data": {
+                "language": options.get("language", "korean"),
+                "confidence_threshold": options.get("confidence_threshold", 0.5),
+                "use_angle_cls": options.get("use_angle_cls", True),
+            },
+            "private_imgs": image_paths,
+        }
+        # BatchOCRResponse 파싱
+        result = await self._post("/extract_text_batch", timeout=timeout, json=payload)
+
+        # OCRExtractDTO 리스트로 변환
+        ocr_results = []
+        for r in result["results"]:
+            text_boxes = self._parse_text_boxes(r.get("text_boxes", []))
+            ocr_results.append(
+                OCRExtractDTO(
+                    text_boxes=text_boxes,
                 )
+            )
 
-                return ocr_results
+        logger.info(
+            f"배치 BentoML OCR 완료: {result['total_success']}/"
+            f"{result['total_processed']} 성공"
+        )
 
-        except httpx.TimeoutException as e:
-            raise RetryableError("OCRClient", f"BentoML batch timeout: {str(e)}") from e
-        except httpx.ConnectError as e:
-            raise RetryableError(
-                "OCRClient", f"BentoML batch connection error: {str(e)}"
-            ) from e
+        return ocr_results
 
     def _parse_text_boxes(self, boxes: List[dict]) -> List[OCRTextBoxCreate]:
         """텍스트 박스 파싱
@@ -6,6 +6,7 @@
 from typing import Any, Dict, Optional
 
 from celery import chain
+from shared.config import settings
 from shared.core.database import get_db_manager
 from shared.core.logging import get_logger
 from shared.pipeline.cache import get_pipeline_cache_service
@@ -14,7 +15,7 @@ from shared.repository.crud.sync_crud.chain_execution import chain_execution_cru
 from shared.schemas.common import ImageResponse
 from shared.schemas.enums import ProcessStatus
 
-from tasks.batch import start_ocr_stage
+from tasks.batch import run_pipeline_stages, start_ocr_stage
 from tasks.batch.finish_tasks import start_finish_stage
 
 logger = get_logger(__name__)
@@ -78,22 +79,26 @@ def execute_batch_ocr_pipeline(
             options=options,
         )
 
-        # Redis에 컨텍스트 저장
-        cache_service.save_context(context)
-
         # 4. OCR Stage 실행 (배치)
         try:
-            # PipelineContext를 딕셔너리로 변환하여 Celery 태스크 실행
-            context_dict = context.model_dump()
-
-            # Celery chain을 사용하여 순차적으로 태스크 실행
-            # 각 태스크의 출력이 다음 태스크의 입력으로 자동 전달됨
-            workflow = chain(
-                start_ocr_stage.s(context_dict),  # .s()는 signature 생성
-                # start_llm_stage.s(),  # 이전 결과를 자동으로 받음
-                # start_yolo_stage.s(),  # 이전 결과를 자동으로 받음
-                start_finish_stage.s(),
-            )
+            # Redis에 컨텍스트 저장 후 참조만 Celery 태스크로 전달 (claim-check)
+            payload = cache_service.to_task_payload(context)
+
+            if settings.PIPELINE_FUSE_STAGES:
+                # 같은 워커 풀의 스테이지는 한 태스크에서 연속 실행
+                # (완료 처리는 오케스트레이터가 수행, 재시도 시 체크포인트 재개)
+                # 다른 워커 풀 스테이지는 chain으로 이어 붙임
+                # 예: chain(run_pipeline_stages.s(...), start_llm_stage.s())
+                workflow = run_pipeline_stages.s(payload, ["ocr"])
+            else:
+                # Celery chain을 사용하여 순차적으로 태스크 실행
+                # 각 태스크의 출력이 다음 태스크의 입력으로 자동 전달됨
+                workflow = chain(
+                    start_ocr_stage.s(payload),  # .s()는 signature 생성
+                    # start_llm_stage.s(),  # 이전 결과를 자동으로 받음
+                    # start_yolo_stage.s(),  # 이전 결과를 자동으로 받음
+                    start_finish_stage.s(),
+                )
 
             # 비동기로 실행
             result = workflow.apply_async()
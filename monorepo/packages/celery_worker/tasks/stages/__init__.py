@@ -7,8 +7,15 @@ from .layout_stage import LayoutStage
 from .llm_stage import LLMStage
 from .ocr_stage import OCRStage
 
+# 태스크 인자로 전달하는 스테이지 이름 → 스테이지 클래스
+STAGE_REGISTRY = {
+    "ocr": OCRStage,
+    "llm": LLMStage,
+}
+
 __all__ = [
     "OCRStage",
     "LLMStage",
     "LayoutStage",
+    "STAGE_REGISTRY",
 ]
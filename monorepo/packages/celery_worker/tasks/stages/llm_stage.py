@@ -3,29 +3,69 @@
 OpenAI API를 사용하여 OCR 텍스트를 구조화된 데이터로 변환합니다.
 """
 
-import json
+import asyncio
+from typing import List, Optional, Tuple
 
+import httpx
+import openai
 from shared.config import settings
 from shared.core.logging import get_logger
+from shared.llm.model_registry import is_model_not_found
+from shared.llm.prompt_builder import OCRPromptBuilder
 from shared.pipeline.context import LLMResult, PipelineContext
+from shared.pipeline.exceptions import RetryableError
 from shared.pipeline.stage import PipelineStage
+from shared.schemas.ocr_db import OCRExtractDTO
 
 from tasks.client.llm_client import LLMClient
 
 logger = get_logger(__name__)
 
+SYSTEM_PROMPT = (
+    "ocr 모델을 돌려서 나온 문서 텍스트야. 읽기 순서대로 한 줄씩 적혀 있어. "
+    "텍스트 중 숫자만 추출해서 알려줘."
+)
+# 좌표 표기 사용 시 추가 설명
+COORDS_PROMPT = " 줄 앞의 [x,y]는 페이지 내 대략적인 위치(0~99)야."
+
+# 재시도로 해결될 수 있는 LLM 서버 오류
+_RETRYABLE_ERRORS = (
+    openai.APIConnectionError,  # APITimeoutError 포함
+    openai.RateLimitError,
+    openai.InternalServerError,
+    httpx.TransportError,  # 모델 목록 조회
+)
+
 
 class LLMStage(PipelineStage):
     """LLM 분석 스테이지
 
     OCR로 추출된 텍스트를 LLM으로 분석하여 구조화된 데이터로 변환합니다.
+    페이지마다 요청을 나눠 LLM_CONCURRENCY개까지 동시에 보내고, 요청 속도는
+    LLMClient의 Redis 토큰 버킷이 전체 워커 기준으로 제한합니다.
+    추출 작업이므로 temperature 0으로 요청하여, 같은 템플릿/재처리 페이지는
+    LLM 응답 캐시에서 재사용합니다.
+
+    프롬프트는 OCRPromptBuilder가 읽기 순서의 줄 텍스트로 만들며, 토큰 예산
+    (LLM_PROMPT_MAX_TOKENS)을 넘는 페이지는 세그먼트로 나눠 요청한 뒤 응답을
+    페이지 단위로 병합합니다.
     """
 
     def __init__(self):
         super().__init__()
-        self.MODEL_SERVER_URL = settings.MODEL_SERVER_URL
-        self.client = LLMClient(server_url="http://192.168.0.122:38000/v1")
-        # TODO: API 키는 환경 변수에서 로드
+        self.client = LLMClient(use_cache=True)
+        self.concurrency = max(1, settings.LLM_CONCURRENCY)
+        self.prompt_builder = OCRPromptBuilder(
+            max_tokens=settings.LLM_PROMPT_MAX_TOKENS,
+            include_coords=settings.LLM_PROMPT_COORDS,
+        )
+        self.system_prompt = SYSTEM_PROMPT + (
+            COORDS_PROMPT if settings.LLM_PROMPT_COORDS else ""
+        )
+
+    async def aclose(self) -> None:
+        """LLM 연결 풀 종료 (워커 런타임 종료 시 호출)"""
+        await self.client.aclose()
 
     def validate_input(self, context: PipelineContext) -> None:
         """입력 검증: OCR 결과가 있는지 확인
@@ -40,53 +80,99 @@ class LLMStage(PipelineStage):
             raise ValueError("OCR result is required for LLM analysis")
 
     async def execute(self, context: PipelineContext) -> PipelineContext:
-        """LLM으로 텍스트 구조화
+        """LLM으로 텍스트 구조화 (페이지별 동시 요청)
 
         Args:
             context: 파이프라인 컨텍스트
 
         Returns:
-            업데이트된 컨텍스트 (llm_result 포함)
+            업데이트된 컨텍스트 (llm_result 포함, entities는 페이지 순서의
+            응답 텍스트이며 실패/빈 페이지는 None)
 
         Raises:
             RetryableError: API 오류 또는 Rate limit
         """
-        # OCR 텍스트 추출
         ocr_results = context.ocr_results
         if ocr_results is None:
             return context
 
-        # OCR 결과를 딕셔너리로 변환
-        messages = [msg.model_dump() for msg in ocr_results]
-
-        # LLM 메시지 구성 (content는 반드시 문자열이어야 함)
-        llm_messages = []
-        llm_messages.append(
-            {
-                "role": "system",
-                "content": (
-                    "ocr 모델을 돌려서 나온 text_boxes로 나온 결과야 텍스트 박스 "
-                    "중 숫자만 추출해서 알려줘."
-                ),
-            }
-        )
-        # 딕셔너리를 JSON 문자열로 변환하여 전달
-        llm_messages.append(
-            {"role": "user", "content": json.dumps(messages, ensure_ascii=False)}
-        )
-
-        result = await self.client.chat_completion(messages=llm_messages)
-
+        try:
+            # 모델은 페이지마다가 아니라 실행당 한 번만 결정
+            model = await self.client.resolve_model()
+
+            semaphore = asyncio.Semaphore(self.concurrency)
+
+            async def analyze_segment(segment: str) -> Tuple[Optional[str], int]:
+                async with semaphore:
+                    return await self._analyze_segment(segment, model)
+
+            async def analyze(page: OCRExtractDTO) -> Tuple[Optional[str], int]:
+                if page.error or not page.text_boxes:
+                    return None, 0
+                segments = self.prompt_builder.build_segments(page)
+                if len(segments) == 1:
+                    return await analyze_segment(segments[0])
+                # 예산 초과 페이지: 세그먼트도 같은 동시성 제한 안에서 요청
+                outputs = await asyncio.gather(
+                    *(analyze_segment(segment) for segment in segments)
+                )
+                return (
+                    self.prompt_builder.merge_outputs([out for out, _ in outputs]),
+                    sum(tokens for _, tokens in outputs),
+                )
+
+            tasks = [asyncio.create_task(analyze(page)) for page in ocr_results]
+            try:
+                results = await asyncio.gather(*tasks)
+            except BaseException:
+                # 한 페이지라도 실패하면 나머지 요청은 취소 (Celery 재시도로 재실행)
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+        except _RETRYABLE_ERRORS as e:
+            raise RetryableError("LLMStage", f"LLM 서버 오류: {e}") from e
+        except openai.APIStatusError as e:
+            if is_model_not_found(e):
+                # 레지스트리가 모델 목록을 무효화했으므로 재시도 시 다시 조회
+                raise RetryableError("LLMStage", f"모델을 찾을 수 없음: {e}") from e
+            raise
+
+        entities: List[Optional[str]] = [content for content, _ in results]
         context.llm_result = LLMResult(
-            entities=result,
+            entities=entities,
             metadata={
-                "model": "mock",
-                "tokens_used": 0,
+                "model": model,
+                "tokens_used": sum(tokens for _, tokens in results),
+                "pages": len(ocr_results),
+                "concurrency": self.concurrency,
             },
         )
+        logger.info(
+            f"🤖 LLM 분석 완료: {sum(e is not None for e in entities)}/"
+            f"{len(entities)} 페이지 (model={model})"
+        )
 
         return context
 
+    async def _analyze_segment(
+        self, segment: str, model: str
+    ) -> Tuple[Optional[str], int]:
+        """프롬프트 세그먼트 하나를 LLM으로 분석
+
+        Returns:
+            (응답 텍스트, 사용 토큰 수)
+        """
+        llm_messages = [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "user", "content": segment},
+        ]
+        response = await self.client.chat_completion(
+            messages=llm_messages, model=model, temperature=0.0
+        )
+        tokens = response.usage.total_tokens if response.usage else 0
+        return response.choices[0].message.content, tokens
+
     def validate_output(self, context: PipelineContext) -> None:
         """출력 검증: 필수 필드가 있는지 확인
 
@@ -5,14 +5,14 @@ ML 서버를 호출하여 이미지/PDF 파일에서 텍스트를 추출합니
 
 import grpc
 from celery.beat import get_logger
+from grpc_clients.ocr_grpc_client import OCRGrpcClient
 from repository.ocr_repository import OCRRepository
 from shared.config import settings
-from shared.grpc.generated import common_pb2
+from shared.grpc.ocr_converters import ocr_result_from_proto
 from shared.pipeline.cache import get_pipeline_cache_service
 from shared.pipeline.context import PipelineContext
 from shared.pipeline.exceptions import RetryableError
 from shared.pipeline.stage import PipelineStage
-from shared.schemas.ocr_db import OCRExtractDTO
 
 from ..client.ocr_client import OCRClient
 
@@ -26,7 +26,7 @@ class OCRStage(PipelineStage):
     책임:
     - OCRClient를 통해 ML 서버와 통신
     - OCRRepository를 통해 DB 저장
-    - gRPC 통신 (향후 지원)
+    - OCRGrpcClient를 통한 gRPC 통신 (OCR_TRANSPORT=grpc)
     """
 
     def __init__(self):
@@ -35,7 +35,13 @@ class OCRStage(PipelineStage):
         # self.client = OCRClient("http://localhost:8002")
         self.repository = OCRRepository()
         self.cache_service = get_pipeline_cache_service()
-        self.use_grpc = settings.USE_GRPC
+        self.use_grpc = settings.OCR_TRANSPORT == "grpc"
+        self.grpc_client = OCRGrpcClient()
+
+    async def aclose(self) -> None:
+        """HTTP 연결 풀/gRPC 채널 풀 종료 (워커 런타임 종료 시 호출)"""
+        await self.client.aclose()
+        await self.grpc_client.close()
 
     def validate_input(self, context: PipelineContext) -> None:
         """입력 검증: 파일 경로가 있는지 확인
@@ -66,6 +72,9 @@ class OCRStage(PipelineStage):
             RetryableError: 네트워크 오류 또는 서버 오류
             ValueError: 클라이언트 오류
         """
+        if self.use_grpc:
+            return await self.execute_grpc(context)
+
         # 배치 처리 분기
         if context.is_batch and context.private_imgs:
             context.ocr_results = await self.client.call_batch(
@@ -96,52 +105,45 @@ class OCRStage(PipelineStage):
         Args:
             context: 파이프라인 컨텍스트
         """
-        self.repository.save_batch(context)
-        self.cache_service.save_context(context)
+        with self.span("db_write"):
+            self.repository.save_batch(context)
+        with self.span("redis_write"):
+            self.cache_service.save_context(context)
 
     async def execute_grpc(self, context: PipelineContext) -> PipelineContext:
-        """gRPC로 OCR 실행 (신규 방식)"""
-        from grpc_clients.ocr_grpc_client import OCRGrpcClient
+        """gRPC로 OCR 실행 (OCR_TRANSPORT=grpc)
+
+        배치는 BatchExtractText 한 번으로, 단일 이미지는 ExtractText로 요청하며
+        채널 풀은 스테이지 수명 동안 재사용합니다.
+        """
+        options = context.options
+        language = options.get("language", "korean")
+        confidence_threshold = options.get("confidence_threshold", 0.5)
+        use_angle_cls = options.get("use_angle_cls", True)
 
         try:
-            # gRPC 클라이언트를 컨텍스트 매니저로 사용 (매 요청마다 새 연결 생성)
-            async with OCRGrpcClient() as client:
-                # gRPC 호출
-                response = await client.extract_text(
+            if context.is_batch and context.private_imgs:
+                response = await self.grpc_client.batch_extract_text(
+                    context.private_imgs,
+                    language=language,
+                    confidence_threshold=confidence_threshold,
+                    use_angle_cls=use_angle_cls,
+                )
+                context.ocr_results = [
+                    ocr_result_from_proto(result) for result in response.results
+                ]
+            else:
+                response = await self.grpc_client.extract_text(
                     public_image_path=context.public_file_path,
                     private_image_path=context.private_img,
-                    language="korean",
-                    confidence_threshold=0.5,
-                    use_angle_cls=True,
-                )
-
-                # 성공 여부 확인
-                if response.status != common_pb2.STATUS_SUCCESS:
-                    error_msg = (
-                        response.error.message if response.error else "Unknown error"
-                    )
-                    raise ValueError(f"gRPC OCR failed: {error_msg}")
-
-                # Protobuf → OCRResult 변환
-                text_boxes = []
-                for box in response.text_boxes:
-                    # bbox를 [[x1,y1], [x2,y2], ...] 형식으로 변환
-                    coords = list(box.bbox.coordinates)
-                    bbox_pairs = []
-                    for i in range(0, len(coords), 2):
-                        if i + 1 < len(coords):
-                            bbox_pairs.append([coords[i], coords[i + 1]])
-
-                    text_box_dict = {
-                        "text": box.text,
-                        "confidence": box.confidence,
-                        "bbox": bbox_pairs,
-                    }
-                    text_boxes.append(text_box_dict)
-
-                context.ocr_result = OCRExtractDTO(
-                    text_boxes=text_boxes,
+                    language=language,
+                    confidence_threshold=confidence_threshold,
+                    use_angle_cls=use_angle_cls,
                 )
+                result = ocr_result_from_proto(response)
+                if result.error:
+                    raise ValueError(f"gRPC OCR failed: {result.error}")
+                context.ocr_result = result
 
             logger.info("gRPC OCR 완료")
             return context
@@ -10,9 +10,11 @@ Celery 워커 시작 스크립트
 - CELERY_WORKER_PREFETCH_MULTIPLIER: prefetch 배수
 - CELERY_WORKER_MAX_TASKS_PER_CHILD: worker 재시작 전 최대 태스크
 - CELERY_WORKER_LOGLEVEL: 로그 레벨
+- CELERY_PDF_QUEUE / CELERY_PDF_WORKER_POOL: PDF 변환 전용 워커의 큐와 Pool
 
 사용법:
-    python worker.py
+    python worker.py          # 기본 큐 워커
+    python worker.py --pdf    # PDF 변환 전용 큐 워커 (비데몬 Pool)
 """
 
 import os
@@ -39,8 +41,22 @@ if __name__ == "__main__":
         "worker",
     ]
 
+    # PDF 변환 태스크는 렌더링 프로세스 풀을 만들므로 데몬 자식을 쓰는
+    # prefork가 아닌 전용 Pool 워커에서 실행
+    pdf_worker = "--pdf" in sys.argv[1:]
+    if pdf_worker:
+        pool = settings.CELERY_PDF_WORKER_POOL
+        if pool == "prefork":
+            logger.warning(
+                "⚠️ PDF 워커가 prefork로 설정됨 - 렌더링이 스레드 풀로 대체됩니다"
+            )
+        cmd.append(f"--queues={settings.CELERY_PDF_QUEUE}")
+        cmd.append("--hostname=pdf@%h")
+        logger.info(f"🔧 Celery Worker Queue: {settings.CELERY_PDF_QUEUE}")
+    else:
+        pool = settings.CELERY_WORKER_POOL
+
     # Pool 설정
-    pool = settings.CELERY_WORKER_POOL
     cmd.append(f"--pool={pool}")
     logger.info(f"🔧 Celery Worker Pool: {pool}")
 
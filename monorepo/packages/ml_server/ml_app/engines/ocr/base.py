@@ -33,7 +33,6 @@ class BaseOCREngine(ABC):
         """
         pass
 
-    @abstractmethod
     def predict_batch(
         self, image_data_list: List[bytes], confidence_threshold: float
     ) -> List[OCRExtractDTO]:
@@ -48,9 +47,12 @@ class BaseOCREngine(ABC):
             confidence_threshold: 신뢰도 임계값
 
         Returns:
-            OCRExtractDTO 객체 리스트
+            OCRExtractDTO 객체 리스트 (입력 순서와 동일)
         """
-        pass
+        return [
+            self.predict(image_data, confidence_threshold)
+            for image_data in image_data_list
+        ]
 
     @abstractmethod
     def get_engine_name(self) -> str:
@@ -1,6 +1,8 @@
 # app/domains/ocr/services/engines/easyocr_engine.py
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
+import cv2
+import numpy as np
 from shared.core.logging import get_logger
 from shared.schemas import OCRExtractDTO, OCRTextBoxCreate
 
@@ -67,27 +69,7 @@ class EasyOCREngine(BaseOCREngine):
             # EasyOCR 실행
             result = self.model.readtext(image_data)
 
-            # 결과 파싱
-            text_boxes = []
-            for detection in result:
-                bbox = detection[0]
-                text = detection[1]
-                confidence = detection[2]
-
-                if confidence >= confidence_threshold:
-                    # numpy 배열을 Python 리스트로 변환
-                    bbox_list = [[float(x), float(y)] for x, y in bbox]
-                    text_boxes.append(
-                        OCRTextBoxCreate(
-                            text=text,
-                            confidence=float(confidence),
-                            bbox=bbox_list,
-                        )
-                    )
-
-            return OCRExtractDTO(
-                text_boxes=text_boxes,
-            )
+            return self._parse_result(result, confidence_threshold)
 
         except Exception as e:
             logger.error(f"EasyOCR predict 실행 중 오류: {str(e)}")
@@ -96,8 +78,72 @@ class EasyOCREngine(BaseOCREngine):
     def predict_batch(
         self, image_data_list: List[bytes], confidence_threshold: float
     ) -> List[OCRExtractDTO]:
+        """EasyOCR 배치 예측
+
+        readtext_batched는 같은 크기의 이미지만 한 번에 묶을 수 있으므로
+        디코딩 후 이미지 shape별로 그룹을 나눠 그룹당 한 번씩 추론합니다.
+        (리사이즈하지 않으므로 bbox 좌표는 원본 기준 그대로 유지)
+
+        Returns:
+            입력 순서와 동일한 OCRExtractDTO 리스트
+        """
         if not self.is_loaded or self.model is None:
-            return [OCRExtractDTO(text_boxes=[], error="Model not loaded")]
+            return [
+                OCRExtractDTO(text_boxes=[], error="Model not loaded")
+                for _ in image_data_list
+            ]
+
+        results: List[Optional[OCRExtractDTO]] = [None] * len(image_data_list)
+
+        # 1. 디코딩 + shape별 그룹핑 (입력 인덱스 보존)
+        groups: Dict[tuple, List[Tuple[int, np.ndarray]]] = {}
+        for idx, image_data in enumerate(image_data_list):
+            img_np = cv2.imdecode(np.frombuffer(image_data, np.uint8), cv2.IMREAD_COLOR)
+            if img_np is None:
+                results[idx] = OCRExtractDTO(text_boxes=[], error="이미지 디코딩 실패")
+                continue
+            groups.setdefault(img_np.shape, []).append((idx, img_np))
+
+        # 2. 그룹 단위 배치 추론
+        for shape, items in groups.items():
+            indices = [idx for idx, _ in items]
+            images = [img for _, img in items]
+            try:
+                logger.info(
+                    f"EasyOCR 배치 실행: shape={shape}, 이미지 수={len(images)}"
+                )
+                batch_result = self.model.readtext_batched(images)
+                for idx, detections in zip(indices, batch_result):
+                    results[idx] = self._parse_result(detections, confidence_threshold)
+            except Exception as e:
+                logger.error(f"EasyOCR predict_batch 실행 중 오류: {str(e)}")
+                for idx in indices:
+                    results[idx] = OCRExtractDTO(text_boxes=[], error=str(e))
+
+        # 배치 결과가 입력보다 적으면 남은 자리는 해당 이미지만 실패 처리
+        # (입력 순서/길이 유지)
+        return [
+            result
+            if result is not None
+            else OCRExtractDTO(text_boxes=[], error="EasyOCR 배치 결과 누락")
+            for result in results
+        ]
+
+    def _parse_result(
+        self, detections: list, confidence_threshold: float
+    ) -> OCRExtractDTO:
+        """EasyOCR 원본 결과 [(bbox, text, confidence), ...]를 DTO로 변환"""
+        text_boxes = []
+        for bbox, text, confidence in detections:
+            if confidence >= confidence_threshold:
+                # numpy 배열을 Python 리스트로 변환
+                bbox_list = [[float(x), float(y)] for x, y in bbox]
+                text_boxes.append(
+                    OCRTextBoxCreate(
+                        text=text,
+                        confidence=float(confidence),
+                        bbox=bbox_list,
+                    )
+                )
 
-        result = self.model.readtext_batched(image_data_list)
-        return result
+        return OCRExtractDTO(text_boxes=text_boxes)
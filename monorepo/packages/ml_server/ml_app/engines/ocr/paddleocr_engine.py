@@ -86,27 +86,10 @@ class PaddleOCREngine(BaseOCREngine):
             result = self.model.ocr(img_np)
 
             # 결과 파싱
-            text_boxes = []
-            if result and result[0]:
-                for line in result[0]:
-                    bbox = line[0]
-                    text = line[1][0]
-                    confidence = line[1][1]
-
-                    if confidence >= confidence_threshold:
-                        # numpy 배열을 Python 리스트로 변환
-                        bbox_list = [[float(x), float(y)] for x, y in bbox]
-                        text_boxes.append(
-                            OCRTextBoxCreate(
-                                text=text,
-                                confidence=float(confidence),
-                                bbox=bbox_list,
-                            )
-                        )
-
-            logger.info(f"PaddleOCR 실행 완료: {len(text_boxes)}개 텍스트 검출")
+            parsed = self._parse_result(result, confidence_threshold)
+            logger.info(f"PaddleOCR 실행 완료: {len(parsed.text_boxes)}개 텍스트 검출")
 
-            return OCRExtractDTO(text_boxes=text_boxes)
+            return parsed
 
         except Exception as e:
             logger.error(f"PaddleOCR predict 실행 중 오류: {str(e)}")
@@ -115,8 +98,61 @@ class PaddleOCREngine(BaseOCREngine):
     def predict_batch(
         self, image_data_list: List[bytes], confidence_threshold: float
     ) -> List[OCRExtractDTO]:
+        """PaddleOCR 배치 예측
+
+        PaddleOCR 2.x의 ocr()는 이미지 리스트를 받지 않으므로 전체 이미지를
+        먼저 디코딩한 뒤 이미지별로 추론합니다. 인식(rec) 단계는 엔진 내부에서
+        rec_batch_num 단위로 텍스트 영역을 묶어 처리합니다.
+
+        Returns:
+            입력 순서와 동일한 OCRExtractDTO 리스트
+        """
         if not self.is_loaded or self.model is None:
-            return [OCRExtractDTO(text_boxes=[], error="Model not loaded")]
+            return [
+                OCRExtractDTO(text_boxes=[], error="Model not loaded")
+                for _ in image_data_list
+            ]
+
+        # 1. 전체 디코딩 (추론 루프에서 디코딩 비용 제거)
+        images = [
+            cv2.imdecode(np.frombuffer(image_data, np.uint8), cv2.IMREAD_COLOR)
+            for image_data in image_data_list
+        ]
+
+        # 2. 이미지별 추론 + 파싱
+        results: List[OCRExtractDTO] = []
+        for img_np in images:
+            if img_np is None:
+                results.append(OCRExtractDTO(text_boxes=[], error="이미지 디코딩 실패"))
+                continue
+            try:
+                result = self.model.ocr(img_np)
+                results.append(self._parse_result(result, confidence_threshold))
+            except Exception as e:
+                logger.error(f"PaddleOCR predict_batch 실행 중 오류: {str(e)}")
+                results.append(OCRExtractDTO(text_boxes=[], error=str(e)))
+
+        logger.info(f"PaddleOCR 배치 실행 완료: 이미지 수={len(results)}")
+        return results
+
+    def _parse_result(self, result: list, confidence_threshold: float) -> OCRExtractDTO:
+        """PaddleOCR 원본 결과 [[(bbox, (text, confidence)), ...]]를 DTO로 변환"""
+        text_boxes = []
+        if result and result[0]:
+            for line in result[0]:
+                bbox = line[0]
+                text = line[1][0]
+                confidence = line[1][1]
+
+                if confidence >= confidence_threshold:
+                    # numpy 배열을 Python 리스트로 변환
+                    bbox_list = [[float(x), float(y)] for x, y in bbox]
+                    text_boxes.append(
+                        OCRTextBoxCreate(
+                            text=text,
+                            confidence=float(confidence),
+                            bbox=bbox_list,
+                        )
+                    )
 
-        result = self.model.ocr(image_data_list)
-        return result
+        return OCRExtractDTO(text_boxes=text_boxes)
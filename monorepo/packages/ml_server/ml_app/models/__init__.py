@@ -1,5 +1,20 @@
 """Models package for celery_worker"""
 
+from .inference_executor import InferenceExecutor, get_inference_executor
+from .ocr_micro_batcher import OCRMicroBatcher, get_ocr_micro_batcher
 from .ocr_model import OCRModel, get_ocr_model
+from .ocr_model_pool import OCRModelPool, get_ocr_model_pool
+from .ocr_result_cache import OCRResultCache, get_ocr_result_cache
 
-__all__ = ["OCRModel", "get_ocr_model"]
+__all__ = [
+    "OCRModel",
+    "get_ocr_model",
+    "OCRModelPool",
+    "get_ocr_model_pool",
+    "OCRResultCache",
+    "get_ocr_result_cache",
+    "InferenceExecutor",
+    "get_inference_executor",
+    "OCRMicroBatcher",
+    "get_ocr_micro_batcher",
+]
@@ -0,0 +1,162 @@
+"""OCR 추론 전용 실행기
+
+CPU 바운드인 OCR 추론을 이벤트 루프 밖에서 실행합니다.
+async 핸들러(BentoML/gRPC)가 추론 중에도 헬스 체크, 다운로드, 다른 요청을
+계속 처리할 수 있도록 하기 위함입니다.
+
+실행 모드 (settings.OCR_INFERENCE_EXECUTOR):
+    - thread: 스레드 풀에서 실행 (torch/paddle처럼 연산 중 GIL을 놓는 엔진용)
+    - process: 엔진을 미리 로드한 워커 프로세스 풀에서 실행
+      (GIL을 잡고 있는 엔진이거나 CPU 코어를 모두 활용해야 할 때)
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Optional
+
+from ml_app.models.ocr_model_pool import get_ocr_model_pool
+from shared.config import settings
+from shared.core.logging import get_logger
+from shared.schemas.ocr_db import OCRExtractDTO
+
+logger = get_logger(__name__)
+
+
+def _init_process_worker(use_angle_cls: bool, lang: str) -> None:
+    """프로세스 워커 초기화: 기본 설정 모델을 미리 로드"""
+    loaded = get_ocr_model_pool().warmup(use_angle_cls=use_angle_cls, lang=lang)
+    logger.info(f"추론 워커 프로세스 모델 로드: loaded={loaded}")
+
+
+def _predict_batch_task(
+    image_datas: List[bytes],
+    confidence_threshold: float,
+    lang: str,
+    use_angle_cls: bool,
+) -> List[OCRExtractDTO]:
+    """워커(스레드/프로세스)에서 실행되는 배치 추론
+
+    요청 설정에 맞는 모델 복제본을 풀에서 빌려 사용하므로
+    워커 수만큼의 추론이 서로 다른 복제본에서 병렬로 실행됩니다.
+    """
+    with get_ocr_model_pool().checkout(use_angle_cls=use_angle_cls, lang=lang) as model:
+        return model.predict_batch(image_datas, confidence_threshold)
+
+
+def _warmup_task(use_angle_cls: bool, lang: str) -> dict:
+    """워커에서 기본 설정 모델을 로드하고 상태 반환"""
+    get_ocr_model_pool().warmup(use_angle_cls=use_angle_cls, lang=lang)
+    return get_ocr_model_pool().model_status()
+
+
+class InferenceExecutor:
+    """OCR 추론 실행기 (thread / process)"""
+
+    def __init__(self, mode: Optional[str] = None, max_workers: Optional[int] = None):
+        self.mode = (mode or settings.OCR_INFERENCE_EXECUTOR).lower()
+        self.max_workers = max(1, max_workers or settings.OCR_INFERENCE_WORKERS)
+        self._executor: Optional[Executor] = None
+        # process 모드에서는 부모 프로세스에 모델이 없으므로 워밍업 결과로 상태 추적
+        self._worker_status = {"is_loaded": False, "is_loading": False}
+
+        if self.mode not in ("thread", "process"):
+            raise ValueError(f"지원하지 않는 추론 실행 모드: {self.mode}")
+
+    @property
+    def executor(self) -> Executor:
+        """실행기 (지연 생성)"""
+        if self._executor is None:
+            if self.mode == "process":
+                # spawn: CUDA/스레드 상태를 복제하지 않도록 fork 대신 사용
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_process_worker,
+                    initargs=(settings.OCR_USE_ANGLE_CLS, settings.OCR_LANG),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="ocr-inference",
+                )
+            logger.info(
+                f"OCR 추론 실행기 생성: mode={self.mode}, "
+                f"max_workers={self.max_workers}"
+            )
+        return self._executor
+
+    async def warmup(self) -> bool:
+        """모델을 미리 로드 (process 모드는 워커 프로세스 안에서 로드)
+
+        Returns:
+            모델 로드 여부
+        """
+        self._worker_status["is_loading"] = True
+        try:
+            loop = asyncio.get_running_loop()
+            self._worker_status = await loop.run_in_executor(
+                self.executor,
+                _warmup_task,
+                settings.OCR_USE_ANGLE_CLS,
+                settings.OCR_LANG,
+            )
+        finally:
+            self._worker_status["is_loading"] = False
+        return self._worker_status["is_loaded"]
+
+    async def predict_batch(
+        self,
+        image_datas: List[bytes],
+        confidence_threshold: float = 0.5,
+        lang: str = "korean",
+        use_angle_cls: bool = True,
+    ) -> List[OCRExtractDTO]:
+        """이벤트 루프를 막지 않고 배치 추론 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor,
+            _predict_batch_task,
+            image_datas,
+            confidence_threshold,
+            lang,
+            use_angle_cls,
+        )
+
+    async def predict(
+        self,
+        image_data: bytes,
+        confidence_threshold: float = 0.5,
+        lang: str = "korean",
+        use_angle_cls: bool = True,
+    ) -> OCRExtractDTO:
+        """이벤트 루프를 막지 않고 단일 이미지 추론 실행"""
+        results = await self.predict_batch(
+            [image_data], confidence_threshold, lang, use_angle_cls
+        )
+        return results[0]
+
+    def model_status(self) -> dict:
+        """헬스 체크용 모델 상태 (추론 워커를 기다리지 않음)"""
+        if self.mode == "process":
+            return dict(self._worker_status)
+
+        return get_ocr_model_pool().model_status()
+
+    def shutdown(self) -> None:
+        """실행기 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# 싱글톤 인스턴스
+_executor_instance: Optional[InferenceExecutor] = None
+
+
+def get_inference_executor() -> InferenceExecutor:
+    """OCR 추론 실행기 (싱글톤 패턴)"""
+    global _executor_instance
+    if _executor_instance is None:
+        _executor_instance = InferenceExecutor()
+    return _executor_instance
@@ -0,0 +1,296 @@
+"""OCR 마이크로 배칭 스케줄러
+
+동시에 들어오는 단일 이미지 OCR 요청을 짧은 시간 창(max_wait_ms) 동안 모아
+한 번의 predict_batch 호출로 처리하고, 결과를 각 호출자에게 돌려줍니다.
+
+같은 배치로 묶이려면 (lang, use_angle_cls, confidence_threshold)가 같아야 합니다.
+"""
+
+import asyncio
+import functools
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+from ml_app.models.inference_executor import get_inference_executor
+from ml_app.models.ocr_result_cache import get_ocr_result_cache
+from prometheus_client import Gauge, Histogram
+from shared.config import settings
+from shared.core.logging import get_logger
+from shared.schemas.ocr_db import OCRExtractDTO
+
+logger = get_logger(__name__)
+
+# === Prometheus 메트릭 ===
+QUEUE_DEPTH = Gauge(
+    "ocr_micro_batch_queue_depth",
+    "마이크로 배칭 대기열에 쌓인 요청 수",
+)
+BATCH_SIZE = Histogram(
+    "ocr_micro_batch_size",
+    "한 번의 배치 추론에 묶인 요청 수",
+    buckets=(1, 2, 4, 8, 16, 32, 64),
+)
+QUEUE_WAIT_SECONDS = Histogram(
+    "ocr_micro_batch_wait_seconds",
+    "요청이 대기열에 들어온 뒤 추론이 시작되기까지 걸린 시간",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+
+BatchKey = Tuple[str, bool, float]
+
+
+@dataclass
+class _PendingRequest:
+    """대기 중인 단일 OCR 요청"""
+
+    key: BatchKey
+    image_data: bytes
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class OCRMicroBatcher:
+    """OCRModel 앞단의 마이크로 배칭 스케줄러"""
+
+    def __init__(
+        self,
+        max_batch_size: Optional[int] = None,
+        max_wait_ms: Optional[float] = None,
+    ):
+        self.max_batch_size = max(
+            1, max_batch_size or settings.OCR_MICRO_BATCH_MAX_SIZE
+        )
+        self.max_wait = (
+            max_wait_ms
+            if max_wait_ms is not None
+            else settings.OCR_MICRO_BATCH_MAX_WAIT_MS
+        ) / 1000
+        # asyncio 객체는 이벤트 루프에 묶이므로 루프가 바뀔 때만 다시 만듦
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue[_PendingRequest]] = None
+        self._inflight: Optional[asyncio.Semaphore] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._worker: Optional[asyncio.Task] = None
+        # 워커가 대기열에서 꺼냈지만 아직 배치 태스크로 넘기지 않은 요청
+        self._undispatched: List[_PendingRequest] = []
+
+        # 튜닝용 통계 (stats()로 조회)
+        self._batch_sizes: Counter = Counter()
+        self._recent_waits: Deque[float] = deque(maxlen=1000)
+        self._total_requests = 0
+        self._total_batches = 0
+
+    async def submit(
+        self,
+        image_data: bytes,
+        confidence_threshold: float = 0.5,
+        lang: str = "korean",
+        use_angle_cls: bool = True,
+    ) -> OCRExtractDTO:
+        """단일 이미지 OCR 요청을 대기열에 넣고 결과를 기다림
+
+        결과 캐시에 적중하면 대기열을 거치지 않고 바로 반환합니다.
+        """
+        key = (lang, use_angle_cls, confidence_threshold)
+        results = await get_ocr_result_cache().cached_predict(
+            [image_data],
+            lang=lang,
+            use_angle_cls=use_angle_cls,
+            confidence_threshold=confidence_threshold,
+            predict_fn=lambda image_datas: self._enqueue_all(key, image_datas),
+        )
+        return results[0]
+
+    async def _enqueue_all(
+        self, key: BatchKey, image_datas: List[bytes]
+    ) -> List[OCRExtractDTO]:
+        """이미지들을 대기열에 넣고 모든 결과를 기다림"""
+        self._ensure_worker()
+
+        loop = asyncio.get_running_loop()
+        requests = [
+            _PendingRequest(key=key, image_data=image_data, future=loop.create_future())
+            for image_data in image_datas
+        ]
+        for request in requests:
+            self._queue.put_nowait(request)
+        QUEUE_DEPTH.set(self._queue.qsize())
+
+        return list(await asyncio.gather(*(request.future for request in requests)))
+
+    def _ensure_worker(self) -> None:
+        """현재 이벤트 루프에서 배치 워커 태스크 시작 (없거나 종료된 경우)"""
+        if self._worker is not None and not self._worker.done():
+            return
+
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._inflight = asyncio.Semaphore(get_inference_executor().max_workers)
+            self._tasks = set()
+        self._undispatched = []
+        self._worker = loop.create_task(self._run())
+        self._worker.add_done_callback(
+            functools.partial(self._on_worker_done, self._queue)
+        )
+        logger.info(
+            f"OCR 마이크로 배칭 시작: max_batch_size={self.max_batch_size}, "
+            f"max_wait_ms={self.max_wait * 1000:.0f}"
+        )
+
+    async def _run(self) -> None:
+        """대기열에서 요청을 모아 배치 단위로 처리하는 워커 루프"""
+        while True:
+            batch = await self._collect_batch()
+            self._undispatched = list(batch)
+            QUEUE_DEPTH.set(self._queue.qsize())
+
+            # 같은 설정끼리 묶어서 추론
+            groups: Dict[BatchKey, List[_PendingRequest]] = {}
+            for request in batch:
+                groups.setdefault(request.key, []).append(request)
+
+            # 실행기 워커 수만큼 배치를 동시에 추론하고, 빈 워커가 없으면
+            # 대기하는 동안 다음 요청들이 쌓여 다음 배치가 커짐
+            for key, requests in groups.items():
+                await self._inflight.acquire()
+                task = asyncio.create_task(self._run_batch(key, requests))
+                self._tasks.add(task)
+                task.add_done_callback(self._on_batch_done)
+                dispatched = {id(request) for request in requests}
+                self._undispatched = [
+                    request
+                    for request in self._undispatched
+                    if id(request) not in dispatched
+                ]
+
+    def _on_worker_done(
+        self, queue: "asyncio.Queue[_PendingRequest]", worker: asyncio.Task
+    ) -> None:
+        """워커가 종료되면 대기 중인 요청을 모두 실패 처리
+
+        (호출자가 deadline까지 대기하지 않도록, 다음 요청에서 워커 재시작)
+        """
+        if worker.cancelled():
+            error: BaseException = RuntimeError("OCR 마이크로 배칭 워커가 취소됨")
+        else:
+            error = worker.exception() or RuntimeError(
+                "OCR 마이크로 배칭 워커가 종료됨"
+            )
+        logger.error(f"마이크로 배칭 워커 종료, 대기 요청 실패 처리: {error}")
+
+        pending, self._undispatched = self._undispatched, []
+        while not queue.empty():
+            pending.append(queue.get_nowait())
+        QUEUE_DEPTH.set(0)
+        for request in pending:
+            if not request.future.done():
+                request.future.set_exception(error)
+
+    def _on_batch_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        self._inflight.release()
+
+    async def _collect_batch(self) -> List[_PendingRequest]:
+        """첫 요청 도착 후 max_wait 또는 max_batch_size까지 요청 수집"""
+        batch = [await self._queue.get()]
+        deadline = time.perf_counter() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run_batch(self, key: BatchKey, requests: List[_PendingRequest]) -> None:
+        """한 그룹을 한 번의 predict_batch로 처리하고 결과 전달"""
+        lang, use_angle_cls, confidence_threshold = key
+        started_at = time.perf_counter()
+
+        for request in requests:
+            wait = started_at - request.enqueued_at
+            QUEUE_WAIT_SECONDS.observe(wait)
+            self._recent_waits.append(wait)
+        BATCH_SIZE.observe(len(requests))
+        self._batch_sizes[len(requests)] += 1
+        self._total_requests += len(requests)
+        self._total_batches += 1
+
+        try:
+            # 추론은 전용 실행기에서 수행되므로 다음 배치 수집이 막히지 않음
+            results = await get_inference_executor().predict_batch(
+                [request.image_data for request in requests],
+                confidence_threshold=confidence_threshold,
+                lang=lang,
+                use_angle_cls=use_angle_cls,
+            )
+        except Exception as e:
+            logger.error(f"마이크로 배치 추론 실패: {str(e)}", exc_info=True)
+            for request in requests:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+
+        if len(results) != len(requests):
+            # 결과 순서를 신뢰할 수 없으므로 그룹 전체를 실패 처리
+            # (결과를 못 받은 요청이 deadline까지 대기하지 않도록)
+            error = RuntimeError(
+                f"predict_batch 결과 수 불일치: 입력 {len(requests)}개, "
+                f"결과 {len(results)}개"
+            )
+            logger.error(f"마이크로 배치 추론 실패: {error}")
+            for request in requests:
+                if not request.future.done():
+                    request.future.set_exception(error)
+            return
+
+        for request, result in zip(requests, results):
+            # 호출자가 취소된 경우 결과는 버림
+            if not request.future.done():
+                request.future.set_result(result)
+
+    def stats(self) -> dict:
+        """튜닝용 통계 스냅샷"""
+        waits = sorted(self._recent_waits)
+
+        def percentile(p: float) -> float:
+            if not waits:
+                return 0.0
+            return waits[min(len(waits) - 1, int(len(waits) * p))] * 1000
+
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "total_requests": self._total_requests,
+            "total_batches": self._total_batches,
+            "avg_batch_size": (
+                self._total_requests / self._total_batches
+                if self._total_batches
+                else 0.0
+            ),
+            "batch_size_histogram": dict(sorted(self._batch_sizes.items())),
+            "wait_ms_p50": percentile(0.5),
+            "wait_ms_p95": percentile(0.95),
+            "wait_ms_max": waits[-1] * 1000 if waits else 0.0,
+        }
+
+
+# 싱글톤 인스턴스
+_batcher_instance: Optional[OCRMicroBatcher] = None
+
+
+def get_ocr_micro_batcher() -> OCRMicroBatcher:
+    """OCR 마이크로 배칭 스케줄러 (싱글톤 패턴)"""
+    global _batcher_instance
+    if _batcher_instance is None:
+        _batcher_instance = OCRMicroBatcher()
+    return _batcher_instance
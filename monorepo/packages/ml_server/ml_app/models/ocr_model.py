@@ -1,6 +1,7 @@
 # app/domains/ocr/services/ocr_model.py
 # OCRResultDTO는 api_server의 도메인 스키마이므로 직접 정의하거나 shared로 이동 필요
 # from shared.schemas.ocr import OCRResultDTO
+import threading
 from typing import List, Optional
 
 from ml_app.engines.ocr.base import BaseOCREngine
@@ -16,10 +17,16 @@ logger = get_logger(__name__)
 class OCRModel(BaseModel):
     """OCR 모델 클래스 (Strategy Pattern)"""
 
-    def __init__(self, use_angle_cls: bool = True, lang: str = "korean"):
+    def __init__(
+        self,
+        use_angle_cls: bool = True,
+        lang: str = "korean",
+        engine_type: Optional[str] = None,
+    ):
         super().__init__()
         self.use_angle_cls = use_angle_cls
         self.lang = lang
+        self.engine_type = engine_type or settings.OCR_ENGINE
         self.engine: Optional[BaseOCREngine] = None
         self.is_loading = False  # 로딩 중 상태 추가
 
@@ -29,7 +36,7 @@ class OCRModel(BaseModel):
         try:
             # Factory를 통해 적절한 엔진 생성
             self.engine = OCREngineFactory.create_engine(
-                engine_type=settings.OCR_ENGINE,
+                engine_type=self.engine_type,
                 use_angle_cls=self.use_angle_cls,
                 lang=self.lang,
             )
@@ -60,22 +67,47 @@ class OCRModel(BaseModel):
         # 엔진에 위임
         return self.engine.predict(input_data, confidence_threshold)
 
+    def unload_model(self) -> None:
+        """엔진 해제 (모델 풀에서 설정이 축출될 때 호출)"""
+        self.engine = None
+        self.is_loaded = False
+
     def predict_batch(
         self, input_data: List[bytes], confidence_threshold: float = 0.5
     ) -> List[OCRExtractDTO]:
-        """OCR 텍스트 추출 실행"""
+        """OCR 배치 텍스트 추출 실행 (입력 순서와 동일한 결과 리스트 반환)"""
+        if not self.is_loaded or self.engine is None:
+            return [
+                OCRExtractDTO(text_boxes=[], error="Model not loaded")
+                for _ in input_data
+            ]
+
+        if not input_data:
+            return []
+
         # 엔진에 위임
         return self.engine.predict_batch(input_data, confidence_threshold)
 
 
 # 싱글톤 인스턴스
 _ocr_instance: Optional[OCRModel] = None
+# 추론 스레드에서 동시에 최초 호출될 때 중복 로드 방지
+_ocr_instance_lock = threading.Lock()
 
 
 def get_ocr_model(use_angle_cls: bool = True, lang: str = "korean") -> OCRModel:
-    """OCR 모델 의존성 주입 함수 (싱글톤 패턴)"""
+    """OCR 모델 의존성 주입 함수 (싱글톤 패턴)
+
+    Note:
+        최초 호출의 설정으로 하나만 생성됩니다.
+        설정별 모델/복제본이 필요한 추론 경로는 OCRModelPool을 사용하세요.
+    """
     global _ocr_instance
     if _ocr_instance is None:
-        _ocr_instance = OCRModel(use_angle_cls=use_angle_cls, lang=lang)
-        _ocr_instance.load_model()
+        with _ocr_instance_lock:
+            if _ocr_instance is None:
+                instance = OCRModel(use_angle_cls=use_angle_cls, lang=lang)
+                instance.load_model()
+                # 로드가 끝난 뒤에 공개 (잠금 없는 경로에서 미로드 모델을 받지 않도록)
+                _ocr_instance = instance
     return _ocr_instance
@@ -0,0 +1,307 @@
+"""OCR 모델 풀
+
+(engine, lang, use_angle_cls) 설정별로 로드된 OCRModel 복제본을 관리합니다.
+
+- 설정마다 최대 N개의 복제본을 두고 checkout/checkin으로 하나씩 빌려 씀
+  (한 복제본은 동시에 한 스레드만 사용하므로 엔진 스레드 안전성이 필요 없음)
+- 설정 수 제한/메모리 예산을 넘으면 사용 중이 아닌 설정을 LRU 순으로 축출
+- 메모리 사용량은 복제본 로드 전후의 RSS 차이로 추정 (GPU 메모리는 포함되지 않음)
+  로드는 한 번에 하나씩만 실행해 다른 로드의 메모리가 섞이지 않게 함
+
+process 모드 추론 실행기에서는 워커 프로세스마다 별도의 풀을 가집니다.
+"""
+
+import gc
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from ml_app.models.ocr_model import OCRModel
+from shared.config import settings
+from shared.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# (engine, lang, use_angle_cls)
+PoolKey = Tuple[str, str, bool]
+
+
+def _current_rss_bytes() -> int:
+    """현재 프로세스 RSS (Linux 외 환경에서는 0)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+class _ReplicaSet:
+    """한 설정(key)의 복제본 묶음"""
+
+    def __init__(self, key: PoolKey):
+        self.key = key
+        self.idle: List[OCRModel] = []
+        self.total = 0  # 로딩 중 포함 생성된 복제본 수
+        self.loading = 0
+        self.in_use = 0
+        self.memory_bytes = 0
+        self.last_used = time.monotonic()
+
+    @property
+    def evictable(self) -> bool:
+        return self.in_use == 0 and self.loading == 0
+
+
+class OCRModelPool:
+    """설정별 OCR 모델 복제본 풀"""
+
+    def __init__(
+        self,
+        replicas: Optional[int] = None,
+        max_configs: Optional[int] = None,
+        memory_budget_mb: Optional[int] = None,
+    ):
+        self.replicas = max(1, replicas or settings.OCR_MODEL_REPLICAS)
+        self.max_configs = max(1, max_configs or settings.OCR_MODEL_POOL_MAX_CONFIGS)
+        budget_mb = (
+            memory_budget_mb
+            if memory_budget_mb is not None
+            else settings.OCR_MODEL_MEMORY_BUDGET_MB
+        )
+        self.memory_budget = budget_mb * 1024 * 1024  # 0이면 제한 없음
+
+        self._cond = threading.Condition()
+        self._sets: "OrderedDict[PoolKey, _ReplicaSet]" = OrderedDict()
+        # 복제본 로드 직렬화 (동시 로드 시 RSS 차이에 서로의 메모리가 섞임)
+        self._load_lock = threading.Lock()
+        # 엔진별 복제본 1개의 메모리 추정치 (처음 로드할 때 측정)
+        self._replica_estimates: Dict[str, int] = {}
+
+    def make_key(
+        self, use_angle_cls: bool, lang: str, engine_type: Optional[str] = None
+    ) -> PoolKey:
+        return ((engine_type or settings.OCR_ENGINE).lower(), lang, use_angle_cls)
+
+    @contextmanager
+    def checkout(
+        self,
+        use_angle_cls: bool = True,
+        lang: str = "korean",
+        engine_type: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[OCRModel]:
+        """설정에 맞는 모델 복제본을 빌려 쓰고 자동으로 반납
+
+        Raises:
+            TimeoutError: timeout 동안 사용 가능한 복제본이 없을 때
+        """
+        key = self.make_key(use_angle_cls, lang, engine_type)
+        model = self._acquire(
+            key, timeout if timeout is not None else settings.OCR_MODEL_CHECKOUT_TIMEOUT
+        )
+        try:
+            yield model
+        finally:
+            self._release(key, model)
+
+    def _acquire(self, key: PoolKey, timeout: float) -> OCRModel:
+        deadline = time.monotonic() + timeout
+
+        with self._cond:
+            while True:
+                replica_set = self._get_or_create_set(key)
+                replica_set.last_used = time.monotonic()
+
+                if replica_set.idle:
+                    replica_set.in_use += 1
+                    return replica_set.idle.pop()
+
+                if replica_set.total < self.replicas and self._reserve_memory(
+                    replica_set
+                ):
+                    # 락 밖에서 로드하도록 자리만 예약
+                    replica_set.total += 1
+                    replica_set.loading += 1
+                    replica_set.in_use += 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._cond.wait(remaining):
+                    raise TimeoutError(
+                        f"OCR 모델 checkout 타임아웃: key={key}, "
+                        f"replicas={replica_set.total}, in_use={replica_set.in_use}"
+                    )
+
+        return self._load_replica(replica_set)
+
+    def _load_replica(self, replica_set: _ReplicaSet) -> OCRModel:
+        """새 복제본 로드 (풀 락 밖, 로드 락 안에서 실행)"""
+        engine_type, lang, use_angle_cls = replica_set.key
+        with self._load_lock:
+            rss_before = _current_rss_bytes()
+            try:
+                model = OCRModel(
+                    use_angle_cls=use_angle_cls, lang=lang, engine_type=engine_type
+                )
+                model.load_model()
+            except Exception:
+                with self._cond:
+                    replica_set.total -= 1
+                    replica_set.loading -= 1
+                    replica_set.in_use -= 1
+                    self._cond.notify_all()
+                raise
+            used = max(0, _current_rss_bytes() - rss_before)
+
+        with self._cond:
+            replica_set.loading -= 1
+            replica_set.memory_bytes += used
+            self._replica_estimates.setdefault(engine_type, used)
+
+        logger.info(
+            f"OCR 모델 복제본 로드: key={replica_set.key}, "
+            f"{replica_set.total}/{self.replicas}, ~{used / 1024 / 1024:.0f}MB"
+        )
+        return model
+
+    def _release(self, key: PoolKey, model: OCRModel) -> None:
+        with self._cond:
+            replica_set = self._sets.get(key)
+            replica_set.in_use -= 1
+            if model.is_loaded:
+                replica_set.idle.append(model)
+            else:
+                # 로드 실패한 복제본은 버리고 다음 checkout에서 다시 로드
+                replica_set.total -= 1
+            self._cond.notify_all()
+
+    def _get_or_create_set(self, key: PoolKey) -> _ReplicaSet:
+        """설정 묶음 조회 (없으면 설정 수 제한에 맞춰 LRU 축출 후 생성)"""
+        replica_set = self._sets.get(key)
+        if replica_set is None:
+            while len(self._sets) >= self.max_configs:
+                if not self._evict_lru(exclude=key):
+                    logger.warning(
+                        f"OCR 모델 풀 설정 수 초과 (모두 사용 중): "
+                        f"{len(self._sets)}/{self.max_configs}"
+                    )
+                    break
+            replica_set = _ReplicaSet(key)
+            self._sets[key] = replica_set
+        self._sets.move_to_end(key)
+        return replica_set
+
+    def _reserve_memory(self, replica_set: _ReplicaSet) -> bool:
+        """새 복제본을 올릴 메모리 여유 확인 (부족하면 LRU 축출 시도)"""
+        if not self.memory_budget:
+            return True
+
+        estimate = self._replica_estimates.get(replica_set.key[0], 0)
+        while self._used_memory() + estimate > self.memory_budget:
+            if not self._evict_lru(exclude=replica_set.key):
+                break
+
+        if self._used_memory() + estimate <= self.memory_budget:
+            return True
+
+        # 복제본이 하나도 없으면 예산을 넘더라도 최소 1개는 로드
+        if replica_set.total == 0:
+            logger.warning(
+                f"OCR 모델 메모리 예산 초과 상태로 로드: key={replica_set.key}, "
+                f"budget={self.memory_budget / 1024 / 1024:.0f}MB"
+            )
+            return True
+        return False
+
+    def _used_memory(self) -> int:
+        return sum(replica_set.memory_bytes for replica_set in self._sets.values())
+
+    def _evict_lru(self, exclude: PoolKey) -> bool:
+        """사용 중이 아닌 설정 중 가장 오래 안 쓴 설정 축출"""
+        for key, replica_set in self._sets.items():
+            if key == exclude or not replica_set.evictable:
+                continue
+
+            for model in replica_set.idle:
+                model.unload_model()
+            del self._sets[key]
+            gc.collect()
+
+            logger.info(
+                f"OCR 모델 설정 축출 (LRU): key={key}, "
+                f"복제본 {replica_set.total}개, "
+                f"~{replica_set.memory_bytes / 1024 / 1024:.0f}MB 해제"
+            )
+            return True
+        return False
+
+    def warmup(
+        self,
+        use_angle_cls: bool = True,
+        lang: str = "korean",
+        engine_type: Optional[str] = None,
+    ) -> bool:
+        """설정의 복제본을 replicas 개수만큼 미리 로드
+
+        Returns:
+            로드된 복제본이 하나 이상 있는지 여부
+        """
+        key = self.make_key(use_angle_cls, lang, engine_type)
+        models = []
+        try:
+            for _ in range(self.replicas):
+                models.append(self._acquire(key, settings.OCR_MODEL_CHECKOUT_TIMEOUT))
+        finally:
+            for model in models:
+                self._release(key, model)
+        return any(model.is_loaded for model in models)
+
+    def model_status(self) -> dict:
+        """헬스 체크용 상태 (하나라도 로드되어 있으면 is_loaded)"""
+        with self._cond:
+            sets = list(self._sets.values())
+            return {
+                "is_loaded": any(s.total - s.loading > 0 for s in sets),
+                "is_loading": any(s.loading > 0 for s in sets),
+            }
+
+    def stats(self) -> dict:
+        """설정별 복제본/메모리 현황"""
+        with self._cond:
+            return {
+                "replicas_per_config": self.replicas,
+                "max_configs": self.max_configs,
+                "memory_budget_mb": self.memory_budget / 1024 / 1024,
+                "used_memory_mb": self._used_memory() / 1024 / 1024,
+                "configs": [
+                    {
+                        "engine": s.key[0],
+                        "lang": s.key[1],
+                        "use_angle_cls": s.key[2],
+                        "replicas": s.total,
+                        "idle": len(s.idle),
+                        "in_use": s.in_use,
+                        "loading": s.loading,
+                        "memory_mb": s.memory_bytes / 1024 / 1024,
+                    }
+                    for s in self._sets.values()
+                ],
+            }
+
+
+# 싱글톤 인스턴스 (프로세스당 1개)
+_pool_instance: Optional[OCRModelPool] = None
+_pool_instance_lock = threading.Lock()
+
+
+def get_ocr_model_pool() -> OCRModelPool:
+    """OCR 모델 풀 (싱글톤 패턴)"""
+    global _pool_instance
+    if _pool_instance is None:
+        with _pool_instance_lock:
+            if _pool_instance is None:
+                _pool_instance = OCRModelPool()
+    return _pool_instance
@@ -0,0 +1,275 @@
+"""OCR 결과 캐시 (이미지 내용 주소 기반)
+
+이미지 바이트의 해시 + (캐시 버전, engine, det/rec 모델, lang, use_angle_cls,
+confidence_threshold)를 키로 OCR 결과를 캐시하여, 다시 업로드된 PDF나
+반복 페이지의 재추론을 건너뜁니다.
+
+- 1차: 프로세스 내 LRU (항목 수 / 전체 크기(UTF-8 바이트) 제한)
+- 2차: Redis (TTL, 항목 크기 제한) - 서버 인스턴스/워커 프로세스 간 공유
+  (asyncio 클라이언트)
+- 캐시 오류는 요청을 실패시키지 않고 미스로 처리
+- 에러가 있는 결과는 캐시하지 않음
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from prometheus_client import Counter
+from shared.config import settings
+from shared.core.logging import get_logger
+from shared.schemas.ocr_db import OCRExtractDTO
+from shared.service.redis_service import get_redis_service
+
+logger = get_logger(__name__)
+
+# === Prometheus 메트릭 ===
+CACHE_LOOKUPS = Counter(
+    "ocr_result_cache_lookups_total",
+    "OCR 결과 캐시 조회 수 (result=memory_hit/redis_hit/miss)",
+    ["result"],
+)
+CACHE_BYTES_SAVED = Counter(
+    "ocr_result_cache_bytes_saved_total",
+    "캐시 적중으로 추론을 건너뛴 이미지 바이트 합계",
+)
+
+KEY_PREFIX = "ocr:result"
+
+PredictFn = Callable[[List[bytes]], Awaitable[List[OCRExtractDTO]]]
+
+
+class OCRResultCache:
+    """2계층(메모리 LRU + Redis) OCR 결과 캐시"""
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[int] = None,
+        use_redis: Optional[bool] = None,
+        enabled: Optional[bool] = None,
+    ):
+        self.enabled = (
+            enabled if enabled is not None else settings.OCR_RESULT_CACHE_ENABLED
+        )
+        self.max_entries = max_entries or settings.OCR_RESULT_CACHE_MAX_ENTRIES
+        self.max_bytes = max_bytes or settings.OCR_RESULT_CACHE_MAX_MB * 1024 * 1024
+        self.ttl = ttl or settings.OCR_RESULT_CACHE_TTL
+        self.redis_max_entry_bytes = settings.OCR_RESULT_CACHE_REDIS_MAX_ENTRY_KB * 1024
+        self.use_redis = (
+            use_redis if use_redis is not None else settings.OCR_RESULT_CACHE_REDIS
+        )
+
+        self._lock = threading.Lock()
+        # 키 -> (결과 JSON, UTF-8 바이트 크기)
+        self._memory: "OrderedDict[str, Tuple[str, int]]" = OrderedDict()
+        self._memory_bytes = 0
+
+        # 통계
+        self._memory_hits = 0
+        self._redis_hits = 0
+        self._misses = 0
+        self._bytes_saved = 0
+
+    def make_key(
+        self,
+        image_data: bytes,
+        lang: str,
+        use_angle_cls: bool,
+        confidence_threshold: float,
+        engine_type: Optional[str] = None,
+    ) -> str:
+        """이미지 내용 해시 + 모델/추론 설정으로 캐시 키 생성
+
+        Redis 항목은 배포 후에도 TTL 동안 남으므로 det/rec 모델과 캐시 버전
+        (OCR_RESULT_CACHE_VERSION)을 키에 포함해, 모델이 바뀌면 이전 결과를
+        재사용하지 않습니다.
+        """
+        digest = hashlib.sha256(image_data).hexdigest()
+        engine = (engine_type or settings.OCR_ENGINE).lower()
+        det = settings.OCR_DET or "-"
+        rec = settings.OCR_REC or "-"
+        return (
+            f"{KEY_PREFIX}:v{settings.OCR_RESULT_CACHE_VERSION}:{engine}:"
+            f"{det}:{rec}:{lang}:{int(use_angle_cls)}:"
+            f"{confidence_threshold:g}:{digest}"
+        )
+
+    async def cached_predict(
+        self,
+        image_datas: List[bytes],
+        lang: str,
+        use_angle_cls: bool,
+        confidence_threshold: float,
+        predict_fn: PredictFn,
+    ) -> List[OCRExtractDTO]:
+        """캐시 적중 이미지는 건너뛰고 미스만 predict_fn으로 추론
+
+        Args:
+            image_datas: 이미지 데이터 리스트
+            predict_fn: 미스 이미지 리스트를 받아 같은 순서의 결과를 반환하는 함수
+
+        Returns:
+            입력 순서와 동일한 OCRExtractDTO 리스트
+        """
+        if not self.enabled:
+            return await predict_fn(image_datas)
+
+        keys = [
+            self.make_key(data, lang, use_angle_cls, confidence_threshold)
+            for data in image_datas
+        ]
+        results = await self.get_many(keys, [len(data) for data in image_datas])
+
+        miss_indices = [idx for idx, result in enumerate(results) if result is None]
+        if miss_indices:
+            predicted = await predict_fn([image_datas[idx] for idx in miss_indices])
+            for idx, result in zip(miss_indices, predicted):
+                results[idx] = result
+            await self.set_many(
+                {
+                    keys[idx]: results[idx]
+                    for idx in miss_indices
+                    if results[idx] is not None and not results[idx].error
+                }
+            )
+
+        return results
+
+    async def get_many(
+        self, keys: List[str], image_sizes: List[int]
+    ) -> List[Optional[OCRExtractDTO]]:
+        """키 리스트 조회 (메모리 → Redis 순)"""
+        payloads: List[Optional[str]] = [self._memory_get(key) for key in keys]
+        for payload in payloads:
+            if payload is not None:
+                self._record("memory_hit")
+
+        missing = [idx for idx, payload in enumerate(payloads) if payload is None]
+        if missing and self.use_redis:
+            redis_payloads = await self._redis_mget([keys[idx] for idx in missing])
+            for idx, payload in zip(missing, redis_payloads):
+                if payload is not None:
+                    payloads[idx] = payload
+                    self._memory_put(keys[idx], payload)
+                    self._record("redis_hit")
+
+        results: List[Optional[OCRExtractDTO]] = []
+        for payload, size in zip(payloads, image_sizes):
+            if payload is None:
+                self._record("miss")
+                results.append(None)
+                continue
+            with self._lock:
+                self._bytes_saved += size
+            CACHE_BYTES_SAVED.inc(size)
+            results.append(OCRExtractDTO.model_validate_json(payload))
+        return results
+
+    async def set_many(self, entries: Dict[str, OCRExtractDTO]) -> None:
+        """결과 저장 (메모리 + Redis)"""
+        if not entries:
+            return
+
+        # 한글 등 멀티바이트 문자가 있으므로 크기 제한은 바이트 기준
+        payloads: Dict[str, Tuple[str, int]] = {}
+        for key, dto in entries.items():
+            payload = dto.model_dump_json()
+            payloads[key] = (payload, len(payload.encode()))
+        for key, (payload, size) in payloads.items():
+            self._memory_put(key, payload, size)
+
+        if self.use_redis:
+            await self._redis_mset(payloads)
+
+    # === 메모리 계층 (LRU) ===
+    def _memory_get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            self._memory.move_to_end(key)
+            return entry[0]
+
+    def _memory_put(self, key: str, payload: str, size: Optional[int] = None) -> None:
+        if size is None:
+            size = len(payload.encode())
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= previous[1]
+            self._memory[key] = (payload, size)
+            self._memory_bytes += size
+
+            while (
+                len(self._memory) > self.max_entries
+                or self._memory_bytes > self.max_bytes
+            ):
+                _, (_, evicted_size) = self._memory.popitem(last=False)
+                self._memory_bytes -= evicted_size
+
+    # === Redis 계층 ===
+    @staticmethod
+    def _get_redis_client():
+        # async 커넥션 풀은 이벤트 루프별이므로 호출마다 현재 루프의 클라이언트 사용
+        return get_redis_service().get_async_redis_client(decode_responses=True)
+
+    async def _redis_mget(self, keys: List[str]) -> List[Optional[str]]:
+        try:
+            return await self._get_redis_client().mget(keys)
+        except Exception as e:
+            logger.warning(f"OCR 결과 캐시 Redis 조회 실패 (미스로 처리): {e}")
+            return [None] * len(keys)
+
+    async def _redis_mset(self, payloads: Dict[str, Tuple[str, int]]) -> None:
+        try:
+            pipe = self._get_redis_client().pipeline(transaction=False)
+            for key, (payload, size) in payloads.items():
+                if size <= self.redis_max_entry_bytes:
+                    pipe.set(key, payload, ex=self.ttl)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"OCR 결과 캐시 Redis 저장 실패: {e}")
+
+    def _record(self, result: str) -> None:
+        CACHE_LOOKUPS.labels(result=result).inc()
+        with self._lock:
+            if result == "memory_hit":
+                self._memory_hits += 1
+            elif result == "redis_hit":
+                self._redis_hits += 1
+            else:
+                self._misses += 1
+
+    def stats(self) -> dict:
+        """적중률/절약 바이트 통계"""
+        with self._lock:
+            hits = self._memory_hits + self._redis_hits
+            lookups = hits + self._misses
+            return {
+                "lookups": lookups,
+                "memory_hits": self._memory_hits,
+                "redis_hits": self._redis_hits,
+                "misses": self._misses,
+                "hit_ratio": hits / lookups if lookups else 0.0,
+                "bytes_saved": self._bytes_saved,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+            }
+
+
+# 싱글톤 인스턴스
+_cache_instance: Optional[OCRResultCache] = None
+
+
+def get_ocr_result_cache() -> OCRResultCache:
+    """OCR 결과 캐시 (싱글톤 패턴)"""
+    global _cache_instance
+    if _cache_instance is None:
+        _cache_instance = OCRResultCache()
+    return _cache_instance
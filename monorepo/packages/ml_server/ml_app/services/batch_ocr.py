@@ -0,0 +1,82 @@
+"""배치 OCR 실행
+
+BentoML HTTP API와 gRPC 서비스가 공유하는 배치 처리 로직입니다.
+이미지를 동시에 프리페치하고, 도착한 묶음 단위로 (결과 캐시를 거쳐) 배치 추론합니다.
+"""
+
+from typing import List
+
+from ml_app.models.inference_executor import get_inference_executor
+from ml_app.models.ocr_result_cache import get_ocr_result_cache
+from ml_app.services.image_prefetcher import ImagePrefetcher
+from shared.core.logging import get_logger
+from shared.schemas.ocr_db import OCRExtractDTO
+from shared.utils.storage_base import StorageProvider
+
+logger = get_logger(__name__)
+
+
+async def extract_text_batch(
+    storage: StorageProvider,
+    private_imgs: List[str],
+    language: str,
+    confidence_threshold: float,
+    use_angle_cls: bool,
+) -> List[OCRExtractDTO]:
+    """배치 이미지에서 텍스트 추출
+
+    Args:
+        storage: 이미지 다운로드용 스토리지
+        private_imgs: 이미지 경로 리스트
+        language: OCR 언어
+        confidence_threshold: 신뢰도 임계값
+        use_angle_cls: 텍스트 각도 분류 사용 여부
+
+    Returns:
+        입력 순서대로의 OCR 결과 (실패한 이미지는 error="true")
+    """
+    results: List[OCRExtractDTO | None] = [None] * len(private_imgs)
+
+    # 이미지를 동시에 프리페치하고, 도착한 묶음 단위로 배치 추론
+    # (이전 묶음을 추론하는 동안 나머지 이미지 다운로드가 계속 진행됨)
+    executor = get_inference_executor()
+    cache = get_ocr_result_cache()
+    prefetcher = ImagePrefetcher(storage)
+    async for ready in prefetcher.iter_ready(private_imgs):
+        downloaded = []
+        for item in ready:
+            if item.data is None:
+                # 다운로드 실패는 개별 에러로 기록
+                results[item.index] = OCRExtractDTO(text_boxes=[], error="true")
+            else:
+                downloaded.append(item)
+
+        if not downloaded:
+            continue
+
+        try:
+            # 캐시 적중 이미지는 건너뛰고, 나머지만 전용 실행기에서 추론
+            # (이벤트 루프 블로킹 방지)
+            batch_results = await cache.cached_predict(
+                [item.data for item in downloaded],
+                lang=language,
+                use_angle_cls=use_angle_cls,
+                confidence_threshold=confidence_threshold,
+                predict_fn=lambda image_datas: executor.predict_batch(
+                    image_datas,
+                    confidence_threshold=confidence_threshold,
+                    lang=language,
+                    use_angle_cls=use_angle_cls,
+                ),
+            )
+        except Exception as e:
+            logger.error(f"배치 추론 실패: {str(e)}", exc_info=True)
+            batch_results = [
+                OCRExtractDTO(text_boxes=[], error="true") for _ in downloaded
+            ]
+
+        # 입력 순서대로 결과 매핑
+        for item, result in zip(downloaded, batch_results):
+            results[item.index] = result
+
+    return [result or OCRExtractDTO(text_boxes=[], error="true") for result in results]
@@ -7,7 +7,10 @@ BentoML을 사용한 OCR 모델 서빙
 from typing import List
 
 import bentoml
-from ml_app.models.ocr_model import get_ocr_model
+from ml_app.models.inference_executor import get_inference_executor
+from ml_app.models.ocr_micro_batcher import get_ocr_micro_batcher
+from ml_app.models.ocr_result_cache import get_ocr_result_cache
+from ml_app.services.batch_ocr import extract_text_batch
 from pydantic import BaseModel, Field
 from shared.core.logging import get_logger
 from shared.schemas.ocr_db import OCRExtractDTO
@@ -84,6 +87,17 @@ class OCRBentoService:
         self.storage = SupabaseStorage()
         logger.info(f"OCRBentoService 초기화: engine={self.engine_type}")
 
+    @bentoml.on_startup
+    async def warmup(self) -> None:
+        """추론 실행기 워밍업 (모델 미리 로드)"""
+        loaded = await get_inference_executor().warmup()
+        logger.info(f"OCR 추론 실행기 워밍업 완료: model_loaded={loaded}")
+
+    @bentoml.on_shutdown
+    def shutdown(self) -> None:
+        """추론 실행기 종료"""
+        get_inference_executor().shutdown()
+
     @bentoml.api
     async def extract_text(
         self,
@@ -105,14 +119,12 @@ class OCRBentoService:
             logger.info(
                 f"OCR 요청: lang={request_data.language}, size={len(image_data)}"
             )
-            # PIL 이미지를 바이트로 변환
-
-            # OCR 모델 실행
-            model = get_ocr_model(
-                use_angle_cls=request_data.use_angle_cls, lang=request_data.language
-            )
-            result = model.predict(
-                image_data, confidence_threshold=request_data.confidence_threshold
+            # OCR 모델 실행 (결과 캐시 확인 후, 동시 요청과 마이크로 배치로 묶여 처리됨)
+            result = await get_ocr_micro_batcher().submit(
+                image_data,
+                confidence_threshold=request_data.confidence_threshold,
+                lang=request_data.language,
+                use_angle_cls=request_data.use_angle_cls,
             )
 
             return result
@@ -136,62 +148,45 @@ class OCRBentoService:
         Returns:
             배치 OCR 결과
         """
-        results = []
-        success_count = 0
-        failed_count = 0
+        total = len(private_imgs)
 
-        logger.info(
-            f"배치 OCR 요청: 이미지 수={len(private_imgs)},lang={request_data.language}"
-        )
+        logger.info(f"배치 OCR 요청: 이미지 수={total},lang={request_data.language}")
 
-        # 각 이미지를 순차적으로 처리
-        for idx, private_img in enumerate(private_imgs):
-            try:
-                # 이미지 로드
-
-                image_data = await self.storage.download(private_img)
-                # image_data = await get_common_service().load_image(private_img)
-
-                # OCR 모델 실행
-                model = get_ocr_model(
-                    use_angle_cls=request_data.use_angle_cls,
-                    lang=request_data.language,
-                )
-                result = model.predict(
-                    image_data,
-                    confidence_threshold=request_data.confidence_threshold,
-                )
-
-                results.append(result)
-                success_count += 1
-                logger.info(f"이미지 {idx + 1}/{len(private_imgs)} 처리 성공")
-
-            except Exception as e:
-                failed_count += 1
-                logger.error(
-                    f"이미지 {idx + 1}/{len(private_imgs)} 처리 실패: {str(e)}",
-                    exc_info=True,
-                )
-                # 실패한 경우 빈 결과 추가
-                results.append(
-                    OCRExtractDTO(
-                        text_boxes=[],
-                        error="true",
-                    )
-                )
+        final_results = await extract_text_batch(
+            self.storage,
+            private_imgs,
+            language=request_data.language,
+            confidence_threshold=request_data.confidence_threshold,
+            use_angle_cls=request_data.use_angle_cls,
+        )
+        failed_count = sum(1 for result in final_results if result.error)
+        success_count = total - failed_count
 
         logger.info(
-            f"배치 OCR 완료: 총 {len(private_imgs)}개, "
+            f"배치 OCR 완료: 총 {total}개, "
             f"성공 {success_count}개, 실패 {failed_count}개"
         )
 
         return BatchOCRResponse(
-            results=results,
-            total_processed=len(private_imgs),
+            results=final_results,
+            total_processed=total,
             total_success=success_count,
             total_failed=failed_count,
         )
 
+    @bentoml.api
+    async def batching_stats(self) -> dict:
+        """마이크로 배칭 통계 (대기열 길이, 배치 크기 분포, 대기 시간)
+
+        Prometheus 메트릭(/metrics)과 같은 값을 튜닝용 스냅샷으로 제공
+        """
+        return get_ocr_micro_batcher().stats()
+
+    @bentoml.api
+    async def cache_stats(self) -> dict:
+        """OCR 결과 캐시 통계 (적중률, 추론을 건너뛴 이미지 바이트)"""
+        return get_ocr_result_cache().stats()
+
     @bentoml.api
     async def health_check(self) -> HealthCheckResponse:
         """헬스 체크
@@ -200,12 +195,13 @@ class OCRBentoService:
             헬스 체크 결과
         """
         try:
-            model = get_ocr_model()
+            # 추론 실행기를 기다리지 않고 상태만 조회 (추론 포화 시에도 즉시 응답)
+            model_status = get_inference_executor().model_status()
 
             # 상태 결정
-            if model.is_loading:
+            if model_status["is_loading"]:
                 status = "loading"
-            elif model.is_loaded:
+            elif model_status["is_loaded"]:
                 status = "healthy"
             else:
                 status = "unhealthy"
@@ -213,8 +209,8 @@ class OCRBentoService:
             return HealthCheckResponse(
                 status=status,
                 engine_type=self.engine_type,
-                model_loaded=model.is_loaded,
-                model_loading=model.is_loading,
+                model_loaded=model_status["is_loaded"],
+                model_loading=model_status["is_loading"],
                 version="1.0.0",
             )
 
@@ -2,9 +2,12 @@
 """OCR gRPC 서비스 구현"""
 
 import grpc
-from ml_app.models.ocr_model import get_ocr_model
+from ml_app.models.inference_executor import get_inference_executor
+from ml_app.models.ocr_micro_batcher import get_ocr_micro_batcher
+from ml_app.services.batch_ocr import extract_text_batch
 from shared.core.logging import get_logger
 from shared.grpc.generated import common_pb2, ocr_pb2, ocr_pb2_grpc  # type: ignore
+from shared.grpc.ocr_converters import ocr_result_to_proto
 from shared.service.common_service import CommonService
 from shared.utils.supabase_storage import SupabaseStorage
 
@@ -12,14 +15,17 @@ logger = get_logger(__name__)
 
 
 class OCRServiceServicer(ocr_pb2_grpc.OCRServiceServicer):
-    """OCR gRPC 서비스"""
+    """OCR gRPC 서비스
+
+    메서드 이름은 생성된 베이스 클래스와 같은 RPC 이름(CamelCase)을 사용합니다.
+    """
 
     def __init__(self):
         self.common_service = CommonService()
         self.storage = SupabaseStorage()
         logger.info("OCR gRPC 서비스 초기화 완료")
 
-    async def extract_text(
+    async def ExtractText(  # noqa: N802
         self, request: ocr_pb2.OCRRequest, context: grpc.aio.ServicerContext
     ) -> ocr_pb2.OCRResponse:
         """단일 이미지 OCR 추출
@@ -37,29 +43,22 @@ class OCRServiceServicer(ocr_pb2_grpc.OCRServiceServicer):
             # 1. 이미지 로드
             image_data = await self.storage.download(request.private_image_path)
 
-            # 2. OCR 모델 실행
-            model = get_ocr_model(
-                use_angle_cls=request.use_angle_cls if request.use_angle_cls else True,
-                lang=request.language if request.language else "korean",
-            )
-
-            model.predict(
+            # 2. OCR 모델 실행 (캐시 미스만 마이크로 배치로 묶여 추론됨)
+            # proto3 스칼라는 0/false와 미설정을 구분할 수 없으므로 그대로 사용
+            # (클라이언트가 항상 값을 채워 보냄, BatchExtractText와 동일)
+            result = await get_ocr_micro_batcher().submit(
                 image_data,
-                confidence_threshold=request.confidence_threshold
-                if request.confidence_threshold
-                else 0.5,
-            )
-
-            # 3. Protobuf 응답 생성
-            response = ocr_pb2.OCRResponse(
-                status=common_pb2.STATUS_SUCCESS,
-                text="",  # 전체 텍스트는 text_boxes에서 추출
-                overall_confidence=0.0,
+                confidence_threshold=request.confidence_threshold,
+                lang=request.language or "korean",
+                use_angle_cls=request.use_angle_cls,
             )
 
-            # 4. 텍스트 박스 변환
+            # 3. Protobuf 응답 생성 (텍스트 박스 + packed bbox 좌표)
+            response = ocr_result_to_proto(result)
 
-            logger.info(f"gRPC OCR 완료: {len(response.text_boxes)} 텍스트 박스")
+            logger.info(
+                f"gRPC OCR 완료: {len(response.packed_boxes.texts)} 텍스트 박스"
+            )
             return response
 
         except Exception as e:
@@ -75,7 +74,7 @@ class OCRServiceServicer(ocr_pb2_grpc.OCRServiceServicer):
                 ),
             )
 
-    async def extract_text_batch(
+    async def ExtractTextBatch(  # noqa: N802
         self, request: ocr_pb2.OCRBatchRequest, context: grpc.aio.ServicerContext
     ):
         """배치 이미지 OCR 추출 (Server Streaming)
@@ -120,7 +119,46 @@ class OCRServiceServicer(ocr_pb2_grpc.OCRServiceServicer):
 
         logger.info(f"gRPC 배치 OCR 완료: {batch_id}")
 
-    async def check_health(
+    async def BatchExtractText(  # noqa: N802
+        self, request: ocr_pb2.OCRBatchRequest, context: grpc.aio.ServicerContext
+    ) -> ocr_pb2.OCRBatchResponse:
+        """배치 이미지 OCR 추출 (단일 응답)
+
+        BentoML extract_text_batch와 같은 경로(동시 프리페치 + 배치 추론)로
+        처리하고 결과를 한 번에 반환합니다.
+
+        Args:
+            request: 배치 요청
+            context: gRPC 컨텍스트
+
+        Returns:
+            배치 응답 (results는 image_paths 순서)
+        """
+        total = len(request.image_paths)
+        language = request.language or "korean"
+        logger.info(f"gRPC 배치 OCR 요청: 이미지 수={total}, lang={language}")
+
+        results = await extract_text_batch(
+            self.storage,
+            [image_path.private_path for image_path in request.image_paths],
+            language=language,
+            confidence_threshold=request.confidence_threshold,
+            use_angle_cls=request.use_angle_cls,
+        )
+
+        failed_count = sum(1 for result in results if result.error)
+        logger.info(
+            f"gRPC 배치 OCR 완료: 총 {total}개, "
+            f"성공 {total - failed_count}개, 실패 {failed_count}개"
+        )
+        return ocr_pb2.OCRBatchResponse(
+            results=[ocr_result_to_proto(result) for result in results],
+            total_processed=total,
+            total_success=total - failed_count,
+            total_failed=failed_count,
+        )
+
+    async def CheckHealth(  # noqa: N802
         self, request: ocr_pb2.HealthCheckRequest, context: grpc.aio.ServicerContext
     ) -> ocr_pb2.HealthCheckResponse:
         """헬스 체크
@@ -135,14 +173,15 @@ class OCRServiceServicer(ocr_pb2_grpc.OCRServiceServicer):
         from shared.config import settings
 
         try:
-            model = get_ocr_model()
+            # 추론 실행기를 기다리지 않고 상태만 조회 (추론 포화 시에도 즉시 응답)
+            model_status = get_inference_executor().model_status()
 
             return ocr_pb2.HealthCheckResponse(
                 status=common_pb2.STATUS_SUCCESS
-                if model.is_loaded
+                if model_status["is_loaded"]
                 else common_pb2.STATUS_FAILURE,
                 engine_type=settings.OCR_ENGINE,
-                model_loaded=model.is_loaded,
+                model_loaded=model_status["is_loaded"],
                 version="1.0.0",
             )
         except Exception as e:
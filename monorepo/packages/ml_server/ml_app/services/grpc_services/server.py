@@ -16,13 +16,12 @@ logger = get_logger(__name__)
 async def serve():
     """gRPC 서버 시작"""
 
-    # 0. OCR 모델 미리 로드
+    # 0. OCR 모델 미리 로드 (추론 실행기 안에서 로드하여 이벤트 루프 블로킹 방지)
     logger.info("📦 OCR 모델 미리 로드 시작...")
-    from ml_app.models.ocr_model import get_ocr_model
+    from ml_app.models.inference_executor import get_inference_executor
 
     try:
-        ocr_model = get_ocr_model()
-        if ocr_model.is_loaded:
+        if await get_inference_executor().warmup():
             logger.info("✅ OCR 모델 미리 로드 완료")
         else:
             logger.warning(
@@ -0,0 +1,85 @@
+"""배치 OCR용 이미지 프리페처
+
+배치의 모든 이미지를 동시성 제한 안에서 동시에 다운로드하고,
+도착한 순서대로 묶어서 넘겨 다운로드와 추론이 겹치도록 합니다.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import AsyncIterator, List, Optional
+
+from shared.config import settings
+from shared.core.logging import get_logger
+from shared.utils.storage_base import StorageProvider
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class PrefetchedImage:
+    """프리페치 결과 (성공 시 data, 실패 시 error)"""
+
+    index: int
+    path: str
+    data: Optional[bytes] = None
+    error: Optional[str] = None
+
+
+class ImagePrefetcher:
+    """동시성 제한이 있는 이미지 프리페처"""
+
+    def __init__(self, storage: StorageProvider, concurrency: Optional[int] = None):
+        self.storage = storage
+        self.concurrency = max(1, concurrency or settings.OCR_PREFETCH_CONCURRENCY)
+
+    async def iter_ready(
+        self, paths: List[str]
+    ) -> AsyncIterator[List[PrefetchedImage]]:
+        """다운로드가 끝난 이미지를 도착 순서대로 묶어서 반환
+
+        소비자가 이전 묶음을 처리하는 동안 도착한 이미지는 다음 묶음에
+        한꺼번에 담기므로, 추론이 느릴수록 배치가 자연스럽게 커집니다.
+
+        Args:
+            paths: 다운로드할 이미지 경로 리스트
+
+        Yields:
+            PrefetchedImage 리스트 (index는 paths 기준 입력 순서)
+        """
+        if not paths:
+            return
+
+        queue: asyncio.Queue[PrefetchedImage] = asyncio.Queue()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(index: int, path: str) -> None:
+            async with semaphore:
+                try:
+                    data = await self.storage.download(path)
+                    queue.put_nowait(PrefetchedImage(index=index, path=path, data=data))
+                except Exception as e:
+                    logger.error(
+                        f"이미지 {index + 1}/{len(paths)} 다운로드 실패: {str(e)}",
+                        exc_info=True,
+                    )
+                    queue.put_nowait(
+                        PrefetchedImage(index=index, path=path, error=str(e))
+                    )
+
+        tasks = [
+            asyncio.create_task(fetch(index, path)) for index, path in enumerate(paths)
+        ]
+
+        try:
+            received = 0
+            while received < len(paths):
+                ready = [await queue.get()]
+                while not queue.empty():
+                    ready.append(queue.get_nowait())
+                received += len(ready)
+                yield ready
+        finally:
+            # 소비자가 중간에 중단한 경우 남은 다운로드 취소
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
@@ -17,7 +17,7 @@ _sym_db = _symbol_database.Default()
 
 from . import common_pb2 as common__pb2
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\tocr.proto\x12\x03ocr\x1a\x0c\x63ommon.proto\"\xad\x01\n\nOCRRequest\x12\x19\n\x11public_image_path\x18\x01 \x01(\t\x12\x1a\n\x12private_image_path\x18\x02 \x01(\t\x12\x10\n\x08language\x18\x03 \x01(\t\x12\x1c\n\x14\x63onfidence_threshold\x18\x04 \x01(\x02\x12\x15\n\ruse_angle_cls\x18\x05 \x01(\x08\x12!\n\x07options\x18\x06 \x01(\x0b\x32\x10.common.Metadata\"\xbf\x01\n\x0bOCRResponse\x12\x1e\n\x06status\x18\x01 \x01(\x0e\x32\x0e.common.Status\x12\x0c\n\x04text\x18\x02 \x01(\t\x12\x1a\n\x12overall_confidence\x18\x03 \x01(\x02\x12 \n\ntext_boxes\x18\x04 \x03(\x0b\x32\x0c.ocr.TextBox\x12\"\n\x08metadata\x18\x05 \x01(\x0b\x32\x10.common.Metadata\x12 \n\x05\x65rror\x18\x06 \x01(\x0b\x32\x11.common.ErrorInfo\"N\n\x07TextBox\x12\x0c\n\x04text\x18\x01 \x01(\t\x12\x12\n\nconfidence\x18\x02 \x01(\x02\x12!\n\x04\x62\x62ox\x18\x03 \x01(\x0b\x32\x13.common.BoundingBox\"}\n\x0fOCRBatchRequest\x12#\n\x0bimage_paths\x18\x01 \x03(\x0b\x32\x0e.ocr.ImagePath\x12\x10\n\x08language\x18\x02 \x01(\t\x12\x1c\n\x14\x63onfidence_threshold\x18\x03 \x01(\x02\x12\x15\n\ruse_angle_cls\x18\x04 \x01(\x08\"6\n\tImagePath\x12\x13\n\x0bpublic_path\x18\x01 \x01(\t\x12\x14\n\x0cprivate_path\x18\x02 \x01(\t\"\x9b\x01\n\x10OCRBatchProgress\x12\x10\n\x08\x62\x61tch_id\x18\x01 \x01(\t\x12\x14\n\x0ctotal_images\x18\x02 \x01(\x05\x12\x18\n\x10processed_images\x18\x03 \x01(\x05\x12(\n\x0e\x63urrent_result\x18\x04 \x01(\x0b\x32\x10.ocr.OCRResponse\x12\x1b\n\x13progress_percentage\x18\x05 \x01(\x02\"*\n\x12HealthCheckRequest\x12\x14\n\x0cservice_name\x18\x01 \x01(\t\"q\n\x13HealthCheckResponse\x12\x1e\n\x06status\x18\x01 \x01(\x0e\x32\x0e.common.Status\x12\x13\n\x0b\x65ngine_type\x18\x02 \x01(\t\x12\x14\n\x0cmodel_loaded\x18\x03 \x01(\x08\x12\x0f\n\x07version\x18\x04 \x01(\t2\xc3\x01\n\nOCRService\x12\x30\n\x0b\x45xtractText\x12\x0f.ocr.OCRRequest\x1a\x10.ocr.OCRResponse\x12\x41\n\x10\x45xtractTextBatch\x12\x14.ocr.OCRBatchRequest\x1a\x15.ocr.OCRBatchProgress0\x01\x12@\n\x0b\x43heckHealth\x12\x17.ocr.HealthCheckRequest\x1a\x18.ocr.HealthCheckResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\tocr.proto\x12\x03ocr\x1a\x0c\x63ommon.proto\"\xad\x01\n\nOCRRequest\x12\x19\n\x11public_image_path\x18\x01 \x01(\t\x12\x1a\n\x12private_image_path\x18\x02 \x01(\t\x12\x10\n\x08language\x18\x03 \x01(\t\x12\x1c\n\x14\x63onfidence_threshold\x18\x04 \x01(\x02\x12\x15\n\ruse_angle_cls\x18\x05 \x01(\x08\x12!\n\x07options\x18\x06 \x01(\x0b\x32\x10.common.Metadata\"\xeb\x01\n\x0bOCRResponse\x12\x1e\n\x06status\x18\x01 \x01(\x0e\x32\x0e.common.Status\x12\x0c\n\x04text\x18\x02 \x01(\t\x12\x1a\n\x12overall_confidence\x18\x03 \x01(\x02\x12 \n\ntext_boxes\x18\x04 \x03(\x0b\x32\x0c.ocr.TextBox\x12\"\n\x08metadata\x18\x05 \x01(\x0b\x32\x10.common.Metadata\x12 \n\x05\x65rror\x18\x06 \x01(\x0b\x32\x11.common.ErrorInfo\x12*\n\x0cpacked_boxes\x18\x07 \x01(\x0b\x32\x14.ocr.PackedTextBoxes\"N\n\x07TextBox\x12\x0c\n\x04text\x18\x01 \x01(\t\x12\x12\n\nconfidence\x18\x02 \x01(\x02\x12!\n\x04\x62\x62ox\x18\x03 \x01(\x0b\x32\x13.common.BoundingBox\"J\n\x0fPackedTextBoxes\x12\r\n\x05texts\x18\x01 \x03(\t\x12\x13\n\x0b\x63onfidences\x18\x02 \x01(\x0c\x12\x13\n\x0b\x63oordinates\x18\x03 \x01(\x0c\"}\n\x0fOCRBatchRequest\x12#\n\x0bimage_paths\x18\x01 \x03(\x0b\x32\x0e.ocr.ImagePath\x12\x10\n\x08language\x18\x02 \x01(\t\x12\x1c\n\x14\x63onfidence_threshold\x18\x03 \x01(\x02\x12\x15\n\ruse_angle_cls\x18\x04 \x01(\x08\"6\n\tImagePath\x12\x13\n\x0bpublic_path\x18\x01 \x01(\t\x12\x14\n\x0cprivate_path\x18\x02 \x01(\t\"{\n\x10OCRBatchResponse\x12!\n\x07results\x18\x01 \x03(\x0b\x32\x10.ocr.OCRResponse\x12\x17\n\x0ftotal_processed\x18\x02 \x01(\x05\x12\x15\n\rtotal_success\x18\x03 \x01(\x05\x12\x14\n\x0ctotal_failed\x18\x04 \x01(\x05\"\x9b\x01\n\x10OCRBatchProgress\x12\x10\n\x08\x62\x61tch_id\x18\x01 \x01(\t\x12\x14\n\x0ctotal_images\x18\x02 \x01(\x05\x12\x18\n\x10processed_images\x18\x03 \x01(\x05\x12(\n\x0e\x63urrent_result\x18\x04 \x01(\x0b\x32\x10.ocr.OCRResponse\x12\x1b\n\x13progress_percentage\x18\x05 \x01(\x02\"*\n\x12HealthCheckRequest\x12\x14\n\x0cservice_name\x18\x01 \x01(\t\"q\n\x13HealthCheckResponse\x12\x1e\n\x06status\x18\x01 \x01(\x0e\x32\x0e.common.Status\x12\x13\n\x0b\x65ngine_type\x18\x02 \x01(\t\x12\x14\n\x0cmodel_loaded\x18\x03 \x01(\x08\x12\x0f\n\x07version\x18\x04 \x01(\t2\x84\x02\n\nOCRService\x12\x30\n\x0b\x45xtractText\x12\x0f.ocr.OCRRequest\x1a\x10.ocr.OCRResponse\x12\x41\n\x10\x45xtractTextBatch\x12\x14.ocr.OCRBatchRequest\x1a\x15.ocr.OCRBatchProgress0\x01\x12?\n\x10\x42\x61tchExtractText\x12\x14.ocr.OCRBatchRequest\x1a\x15.ocr.OCRBatchResponse\x12@\n\x0b\x43heckHealth\x12\x17.ocr.HealthCheckRequest\x1a\x18.ocr.HealthCheckResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -27,19 +27,23 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_OCRREQUEST']._serialized_start=33
   _globals['_OCRREQUEST']._serialized_end=206
   _globals['_OCRRESPONSE']._serialized_start=209
-  _globals['_OCRRESPONSE']._serialized_end=400
-  _globals['_TEXTBOX']._serialized_start=402
-  _globals['_TEXTBOX']._serialized_end=480
-  _globals['_OCRBATCHREQUEST']._serialized_start=482
-  _globals['_OCRBATCHREQUEST']._serialized_end=607
-  _globals['_IMAGEPATH']._serialized_start=609
-  _globals['_IMAGEPATH']._serialized_end=663
-  _globals['_OCRBATCHPROGRESS']._serialized_start=666
-  _globals['_OCRBATCHPROGRESS']._serialized_end=821
-  _globals['_HEALTHCHECKREQUEST']._serialized_start=823
-  _globals['_HEALTHCHECKREQUEST']._serialized_end=865
-  _globals['_HEALTHCHECKRESPONSE']._serialized_start=867
-  _globals['_HEALTHCHECKRESPONSE']._serialized_end=980
-  _globals['_OCRSERVICE']._serialized_start=983
-  _globals['_OCRSERVICE']._serialized_end=1178
+  _globals['_OCRRESPONSE']._serialized_end=444
+  _globals['_TEXTBOX']._serialized_start=446
+  _globals['_TEXTBOX']._serialized_end=524
+  _globals['_PACKEDTEXTBOXES']._serialized_start=526
+  _globals['_PACKEDTEXTBOXES']._serialized_end=600
+  _globals['_OCRBATCHREQUEST']._serialized_start=602
+  _globals['_OCRBATCHREQUEST']._serialized_end=727
+  _globals['_IMAGEPATH']._serialized_start=729
+  _globals['_IMAGEPATH']._serialized_end=783
+  _globals['_OCRBATCHRESPONSE']._serialized_start=785
+  _globals['_OCRBATCHRESPONSE']._serialized_end=908
+  _globals['_OCRBATCHPROGRESS']._serialized_start=911
+  _globals['_OCRBATCHPROGRESS']._serialized_end=1066
+  _globals['_HEALTHCHECKREQUEST']._serialized_start=1068
+  _globals['_HEALTHCHECKREQUEST']._serialized_end=1110
+  _globals['_HEALTHCHECKRESPONSE']._serialized_start=1112
+  _globals['_HEALTHCHECKRESPONSE']._serialized_end=1225
+  _globals['_OCRSERVICE']._serialized_start=1228
+  _globals['_OCRSERVICE']._serialized_end=1488
 # @@protoc_insertion_point(module_scope)
@@ -29,20 +29,22 @@ class OCRRequest(_message.Message):
     def __init__(self, public_image_path: _Optional[str] = ..., private_image_path: _Optional[str] = ..., language: _Optional[str] = ..., confidence_threshold: _Optional[float] = ..., use_angle_cls: bool = ..., options: _Optional[_Union[_common_pb2.Metadata, _Mapping]] = ...) -> None: ...
 
 class OCRResponse(_message.Message):
-    __slots__ = ("status", "text", "overall_confidence", "text_boxes", "metadata", "error")
+    __slots__ = ("status", "text", "overall_confidence", "text_boxes", "metadata", "error", "packed_boxes")
     STATUS_FIELD_NUMBER: _ClassVar[int]
     TEXT_FIELD_NUMBER: _ClassVar[int]
     OVERALL_CONFIDENCE_FIELD_NUMBER: _ClassVar[int]
     TEXT_BOXES_FIELD_NUMBER: _ClassVar[int]
     METADATA_FIELD_NUMBER: _ClassVar[int]
     ERROR_FIELD_NUMBER: _ClassVar[int]
+    PACKED_BOXES_FIELD_NUMBER: _ClassVar[int]
     status: _common_pb2.Status
     text: str
     overall_confidence: float
     text_boxes: _containers.RepeatedCompositeFieldContainer[TextBox]
     metadata: _common_pb2.Metadata
     error: _common_pb2.ErrorInfo
-    def __init__(self, status: _Optional[_Union[_common_pb2.Status, str]] = ..., text: _Optional[str] = ..., overall_confidence: _Optional[float] = ..., text_boxes: _Optional[_Iterable[_Union[TextBox, _Mapping]]] = ..., metadata: _Optional[_Union[_common_pb2.Metadata, _Mapping]] = ..., error: _Optional[_Union[_common_pb2.ErrorInfo, _Mapping]] = ...) -> None: ...
+    packed_boxes: PackedTextBoxes
+    def __init__(self, status: _Optional[_Union[_common_pb2.Status, str]] = ..., text: _Optional[str] = ..., overall_confidence: _Optional[float] = ..., text_boxes: _Optional[_Iterable[_Union[TextBox, _Mapping]]] = ..., metadata: _Optional[_Union[_common_pb2.Metadata, _Mapping]] = ..., error: _Optional[_Union[_common_pb2.ErrorInfo, _Mapping]] = ..., packed_boxes: _Optional[_Union[PackedTextBoxes, _Mapping]] = ...) -> None: ...
 
 class TextBox(_message.Message):
     __slots__ = ("text", "confidence", "bbox")
@@ -54,6 +56,16 @@ class TextBox(_message.Message):
     bbox: _common_pb2.BoundingBox
     def __init__(self, text: _Optional[str] = ..., confidence: _Optional[float] = ..., bbox: _Optional[_Union[_common_pb2.BoundingBox, _Mapping]] = ...) -> None: ...
 
+class PackedTextBoxes(_message.Message):
+    __slots__ = ("texts", "confidences", "coordinates")
+    TEXTS_FIELD_NUMBER: _ClassVar[int]
+    CONFIDENCES_FIELD_NUMBER: _ClassVar[int]
+    COORDINATES_FIELD_NUMBER: _ClassVar[int]
+    texts: _containers.RepeatedScalarFieldContainer[str]
+    confidences: bytes
+    coordinates: bytes
+    def __init__(self, texts: _Optional[_Iterable[str]] = ..., confidences: _Optional[bytes] = ..., coordinates: _Optional[bytes] = ...) -> None: ...
+
 class OCRBatchRequest(_message.Message):
     __slots__ = ("image_paths", "language", "confidence_threshold", "use_angle_cls")
     IMAGE_PATHS_FIELD_NUMBER: _ClassVar[int]
@@ -74,6 +86,18 @@ class ImagePath(_message.Message):
     private_path: str
     def __init__(self, public_path: _Optional[str] = ..., private_path: _Optional[str] = ...) -> None: ...
 
+class OCRBatchResponse(_message.Message):
+    __slots__ = ("results", "total_processed", "total_success", "total_failed")
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_PROCESSED_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_FAILED_FIELD_NUMBER: _ClassVar[int]
+    results: _containers.RepeatedCompositeFieldContainer[OCRResponse]
+    total_processed: int
+    total_success: int
+    total_failed: int
+    def __init__(self, results: _Optional[_Iterable[_Union[OCRResponse, _Mapping]]] = ..., total_processed: _Optional[int] = ..., total_success: _Optional[int] = ..., total_failed: _Optional[int] = ...) -> None: ...
+
 class OCRBatchProgress(_message.Message):
     __slots__ = ("batch_id", "total_images", "processed_images", "current_result", "progress_percentage")
     BATCH_ID_FIELD_NUMBER: _ClassVar[int]
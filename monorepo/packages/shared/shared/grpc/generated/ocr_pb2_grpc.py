@@ -33,6 +33,11 @@ class OCRServiceStub(object):
                 request_serializer=ocr__pb2.OCRBatchRequest.SerializeToString,
                 response_deserializer=ocr__pb2.OCRBatchProgress.FromString,
                 )
+        self.BatchExtractText = channel.unary_unary(
+                '/ocr.OCRService/BatchExtractText',
+                request_serializer=ocr__pb2.OCRBatchRequest.SerializeToString,
+                response_deserializer=ocr__pb2.OCRBatchResponse.FromString,
+                )
         self.CheckHealth = channel.unary_unary(
                 '/ocr.OCRService/CheckHealth',
                 request_serializer=ocr__pb2.HealthCheckRequest.SerializeToString,
@@ -61,6 +66,13 @@ class OCRServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def BatchExtractText(self, request, context):
+        """배치 이미지 OCR 추출 (단일 응답, 이미지 동시 다운로드 + 배치 추론)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def CheckHealth(self, request, context):
         """상태 확인
         """
@@ -72,17 +84,22 @@ class OCRServiceServicer(object):
 def add_OCRServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
             'ExtractText': grpc.unary_unary_rpc_method_handler(
-                    servicer.extract_text,  # Python snake_case method
+                    servicer.ExtractText,
                     request_deserializer=ocr__pb2.OCRRequest.FromString,
                     response_serializer=ocr__pb2.OCRResponse.SerializeToString,
             ),
             'ExtractTextBatch': grpc.unary_stream_rpc_method_handler(
-                    servicer.extract_text_batch,  # Python snake_case method
+                    servicer.ExtractTextBatch,
                     request_deserializer=ocr__pb2.OCRBatchRequest.FromString,
                     response_serializer=ocr__pb2.OCRBatchProgress.SerializeToString,
             ),
+            'BatchExtractText': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchExtractText,
+                    request_deserializer=ocr__pb2.OCRBatchRequest.FromString,
+                    response_serializer=ocr__pb2.OCRBatchResponse.SerializeToString,
+            ),
             'CheckHealth': grpc.unary_unary_rpc_method_handler(
-                    servicer.check_health,  # Python snake_case method
+                    servicer.CheckHealth,
                     request_deserializer=ocr__pb2.HealthCheckRequest.FromString,
                     response_serializer=ocr__pb2.HealthCheckResponse.SerializeToString,
             ),
@@ -155,6 +172,33 @@ class OCRService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def BatchExtractText(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/ocr.OCRService/BatchExtractText',
+            ocr__pb2.OCRBatchRequest.SerializeToString,
+            ocr__pb2.OCRBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def CheckHealth(request,
             target,
@@ -0,0 +1,136 @@
+"""OCR 결과 ↔ Protobuf 변환
+
+ML 서버(gRPC 서비스)와 Celery 워커(gRPC 클라이언트)가 같은 규칙으로
+OCRExtractDTO와 ocr_pb2.OCRResponse를 변환합니다.
+
+텍스트 박스는 PackedTextBoxes(열 단위)로 인코딩합니다. 텍스트는 repeated
+string, 신뢰도와 4점 좌표는 float32 배열 bytes에 담아 박스마다 TextBox
+메시지를 만들지 않습니다. (protobuf 순수 Python 구현에서 박스 300개 페이지의
+직렬화 비용 대부분이 메시지 생성이므로) 4점이 아닌 박스가 있으면
+기존 text_boxes(BoundingBox.coordinates 평탄화)로 인코딩합니다.
+"""
+
+import sys
+from array import array
+from typing import List
+
+from ..schemas.ocr_db import OCRExtractDTO
+from ..schemas.ocr_text_box import OCRTextBoxCreate
+from .generated import common_pb2, ocr_pb2
+
+
+def flatten_bbox(bbox: List[List[float]]) -> List[float]:
+    """[[x, y], ...] → [x1, y1, x2, y2, ...]"""
+    return [coord for point in bbox for coord in point[:2]]
+
+
+def unflatten_bbox(coordinates) -> List[List[float]]:
+    """[x1, y1, x2, y2, ...] → [[x, y], ...] (홀수 개면 마지막 값은 버림)"""
+    coords = list(coordinates)
+    return [[coords[i], coords[i + 1]] for i in range(0, len(coords) - 1, 2)]
+
+
+def _pack_floats(values: List[float]) -> bytes:
+    packed = array("f", values)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _unpack_floats(data: bytes) -> List[float]:
+    unpacked = array("f")
+    unpacked.frombytes(data)
+    if sys.byteorder != "little":
+        unpacked.byteswap()
+    return unpacked.tolist()
+
+
+def pack_text_boxes(boxes: List[OCRTextBoxCreate]) -> ocr_pb2.PackedTextBoxes:
+    """텍스트 박스 리스트 → PackedTextBoxes (모든 박스가 4점이어야 함)"""
+    return ocr_pb2.PackedTextBoxes(
+        texts=[box.text for box in boxes],
+        confidences=_pack_floats([box.confidence for box in boxes]),
+        coordinates=_pack_floats(
+            [coord for box in boxes for coord in flatten_bbox(box.bbox)]
+        ),
+    )
+
+
+def unpack_text_boxes(packed: ocr_pb2.PackedTextBoxes) -> List[dict]:
+    """PackedTextBoxes → 텍스트 박스 dict 리스트 (OCRTextBoxCreate 필드)"""
+    confidences = _unpack_floats(packed.confidences)
+    coords = _unpack_floats(packed.coordinates)
+    return [
+        {
+            "text": text,
+            "confidence": confidences[i],
+            "bbox": [[coords[j], coords[j + 1]] for j in range(i * 8, i * 8 + 8, 2)],
+        }
+        for i, text in enumerate(packed.texts)
+    ]
+
+
+def ocr_result_to_proto(result: OCRExtractDTO) -> ocr_pb2.OCRResponse:
+    """OCRExtractDTO → OCRResponse
+
+    Args:
+        result: OCR 결과 (error가 있으면 STATUS_FAILURE)
+
+    Returns:
+        OCR 응답 메시지
+    """
+    if result.error:
+        return ocr_pb2.OCRResponse(
+            status=common_pb2.STATUS_FAILURE,
+            error=common_pb2.ErrorInfo(code="OCR_ERROR", message=result.error),
+        )
+
+    boxes = result.text_boxes
+    response = ocr_pb2.OCRResponse(
+        status=common_pb2.STATUS_SUCCESS,
+        text="\n".join(box.text for box in boxes),
+        overall_confidence=(
+            sum(box.confidence for box in boxes) / len(boxes) if boxes else 0.0
+        ),
+    )
+    if all(len(box.bbox) == 4 for box in boxes):
+        response.packed_boxes.CopyFrom(pack_text_boxes(boxes))
+    else:
+        response.text_boxes.extend(
+            ocr_pb2.TextBox(
+                text=box.text,
+                confidence=box.confidence,
+                bbox=common_pb2.BoundingBox(coordinates=flatten_bbox(box.bbox)),
+            )
+            for box in boxes
+        )
+    return response
+
+
+def ocr_result_from_proto(response: ocr_pb2.OCRResponse) -> OCRExtractDTO:
+    """OCRResponse → OCRExtractDTO
+
+    Args:
+        response: OCR 응답 메시지
+
+    Returns:
+        OCR 결과 (STATUS_SUCCESS가 아니면 error에 메시지 기록)
+    """
+    if response.status != common_pb2.STATUS_SUCCESS:
+        return OCRExtractDTO(
+            text_boxes=[], error=response.error.message or "Unknown error"
+        )
+
+    if response.HasField("packed_boxes"):
+        return OCRExtractDTO(text_boxes=unpack_text_boxes(response.packed_boxes))
+
+    return OCRExtractDTO(
+        text_boxes=[
+            {
+                "text": box.text,
+                "confidence": box.confidence,
+                "bbox": unflatten_bbox(box.bbox.coordinates),
+            }
+            for box in response.text_boxes
+        ]
+    )
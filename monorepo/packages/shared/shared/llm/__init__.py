@@ -0,0 +1,25 @@
+"""LLM 공통 모듈
+
+Celery 워커(LLMClient)와 API 서버(LLMService)가 공유하는 LLM 호출 컴포넌트입니다.
+- LLMResponseCache: 결정적 요청(temperature 0)의 응답 캐시 (메모리 LRU + Redis)
+- LLMModelRegistry: 모델 목록 TTL 캐시 + 모델별 지연 통계 (서버 URL별 싱글톤)
+- OCRPromptBuilder: OCR 결과 → 읽기 순서 줄 텍스트 프롬프트 (토큰 예산 분할)
+"""
+
+from .model_registry import (
+    LLMModelRegistry,
+    get_llm_model_registry,
+    is_model_not_found,
+)
+from .prompt_builder import OCRPromptBuilder, estimate_tokens
+from .response_cache import LLMResponseCache, get_llm_response_cache
+
+__all__ = [
+    "LLMModelRegistry",
+    "get_llm_model_registry",
+    "is_model_not_found",
+    "OCRPromptBuilder",
+    "estimate_tokens",
+    "LLMResponseCache",
+    "get_llm_response_cache",
+]
@@ -0,0 +1,357 @@
+"""LLM 모델 레지스트리
+
+model을 지정하지 않은 요청마다 /v1/models를 호출하던 것을 TTL 캐시로 대체합니다.
+
+- TTL 안에서는 캐시된 모델 목록을 그대로 사용
+- TTL이 지나면 캐시된 목록을 반환하면서 백그라운드에서 갱신 (요청 지연 없음)
+- 404 / model-not-found 오류가 나면 무효화하여 다음 요청에서 바로 다시 조회
+- 모델별 요청 지연(EWMA)을 기록하여 기본 모델을 관측 성능으로 선택 가능
+  (LLM_DEFAULT_MODEL_STRATEGY=fastest)
+  - 응답 길이가 다른 요청을 비교할 수 있도록 완성 토큰당 지연으로 비교
+  - 표본이 부족하거나 오래된(LLM_MODEL_STATS_MAX_AGE) 모델은 일정 비율
+    (LLM_MODEL_EXPLORE_RATIO)로 라우팅하여 통계를 다시 수집
+
+서버 URL마다 인스턴스 하나를 두고 Celery 워커(LLMClient)와 API 서버(LLMService)가
+같은 방식으로 사용합니다.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+import openai
+from prometheus_client import Histogram
+
+from ..config import settings
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# === Prometheus 메트릭 ===
+LLM_REQUEST_SECONDS = Histogram(
+    "llm_request_seconds",
+    "LLM 채팅 완성 요청 소요 시간 (outcome=success/error)",
+    ["model", "outcome"],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0),
+)
+LLM_TIME_TO_FIRST_TOKEN_SECONDS = Histogram(
+    "llm_time_to_first_token_seconds",
+    "스트리밍 요청의 첫 토큰까지 걸린 시간",
+    ["model"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+# 지연 EWMA 가중치 (최근 요청 비중)
+_EWMA_ALPHA = 0.2
+# fastest 전략에서 후보로 인정할 최소 성공 요청 수 (통계가 오래되면 다시 셈)
+_MIN_SAMPLES = 5
+
+
+def is_model_not_found(error: BaseException) -> bool:
+    """모델이 없어서 실패한 요청인지 확인 (vLLM은 404 또는 400으로 응답)"""
+    if isinstance(error, openai.NotFoundError):
+        return True
+    if isinstance(error, openai.BadRequestError):
+        message = str(error).lower()
+        return "does not exist" in message or "model not found" in message
+    return False
+
+
+def _ewma(previous: Optional[float], value: float) -> float:
+    if previous is None:
+        return value
+    return _EWMA_ALPHA * value + (1 - _EWMA_ALPHA) * previous
+
+
+@dataclass
+class ModelStats:
+    """모델별 요청 통계
+
+    requests/errors는 누적값이고, samples와 EWMA는 통계가 오래되면
+    (마지막 성공 후 max_age 경과) 다음 성공 요청부터 다시 시작합니다.
+    """
+
+    requests: int = 0
+    errors: int = 0
+    samples: int = 0
+    ewma_seconds: Optional[float] = None
+    ewma_seconds_per_token: Optional[float] = None
+    last_seconds: Optional[float] = None
+    last_success_at: Optional[float] = None
+
+    def is_stale(self, now: float, max_age: float) -> bool:
+        return self.last_success_at is None or now - self.last_success_at > max_age
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "samples": self.samples,
+            "ewma_seconds": self.ewma_seconds,
+            "ewma_seconds_per_token": self.ewma_seconds_per_token,
+            "last_seconds": self.last_seconds,
+            "age_seconds": (
+                time.monotonic() - self.last_success_at
+                if self.last_success_at is not None
+                else None
+            ),
+        }
+
+
+class LLMModelRegistry:
+    """서버 하나의 모델 목록 TTL 캐시 + 모델별 지연 통계"""
+
+    def __init__(
+        self,
+        server_url: str,
+        api_key: str = "EMPTY",
+        ttl: Optional[float] = None,
+        strategy: Optional[str] = None,
+        explore_ratio: Optional[float] = None,
+        stats_max_age: Optional[float] = None,
+    ):
+        """
+        Args:
+            server_url: OpenAI 호환 서버 URL (/v1까지)
+            api_key: API 키
+            ttl: 모델 목록 캐시 TTL (초, 지나면 백그라운드 갱신)
+            strategy: 기본 모델 선택 전략 (first/fastest)
+            explore_ratio: fastest 전략에서 표본 부족/오래된 모델로 보낼 요청 비율
+            stats_max_age: 마지막 성공 후 이 시간(초)이 지나면 통계를 오래된 것으로 봄
+        """
+        self.server_url = server_url.rstrip("/")
+        self.api_key = api_key
+        self.ttl = ttl if ttl is not None else settings.LLM_MODEL_CACHE_TTL
+        self.strategy = strategy or settings.LLM_DEFAULT_MODEL_STRATEGY
+        self.explore_ratio = (
+            explore_ratio
+            if explore_ratio is not None
+            else settings.LLM_MODEL_EXPLORE_RATIO
+        )
+        self.stats_max_age = (
+            stats_max_age
+            if stats_max_age is not None
+            else settings.LLM_MODEL_STATS_MAX_AGE
+        )
+
+        self._models: Optional[List[str]] = None
+        self._fetched_at = 0.0
+        self._stats: Dict[str, ModelStats] = {}
+        self._stats_lock = threading.Lock()
+
+        # asyncio 객체는 이벤트 루프에 묶이므로 루프가 바뀌면 다시 만듦
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._fetch_lock: Optional[asyncio.Lock] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def _bind_loop(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._fetch_lock is None or self._loop is not loop:
+            self._loop = loop
+            self._fetch_lock = asyncio.Lock()
+            self._refresh_task = None
+        return self._fetch_lock
+
+    async def _fetch(self) -> List[str]:
+        """/models 조회 후 캐시 갱신"""
+        async with httpx.AsyncClient(timeout=settings.LLM_TIMEOUT) as client:
+            response = await client.get(
+                f"{self.server_url}/models",
+                headers={"Authorization": f"Bearer {self.api_key}"},
+            )
+            response.raise_for_status()
+        models = [model["id"] for model in response.json().get("data", [])]
+        self._models = models
+        self._fetched_at = time.monotonic()
+        logger.info(f"📚 LLM 모델 목록 갱신: {models}")
+        return models
+
+    async def get_models(self, force_refresh: bool = False) -> List[str]:
+        """모델 목록 (캐시 우선)
+
+        Args:
+            force_refresh: 캐시를 무시하고 서버에서 다시 조회
+
+        Returns:
+            모델 ID 리스트
+
+        Raises:
+            httpx.HTTPError: 캐시가 없는 상태에서 조회 실패
+        """
+        lock = self._bind_loop()
+        models = self._models
+        if models is not None and not force_refresh:
+            if time.monotonic() - self._fetched_at >= self.ttl:
+                self._schedule_refresh()
+            return models
+
+        async with lock:
+            # 대기하는 동안 다른 요청이 이미 조회했으면 그 결과 사용
+            if self._models is not None and not force_refresh:
+                return self._models
+            return await self._fetch()
+
+    def _schedule_refresh(self) -> None:
+        """만료된 목록의 백그라운드 갱신 (이미 진행 중이면 생략)"""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self._refresh_task = asyncio.create_task(self._background_refresh())
+
+    async def _background_refresh(self) -> None:
+        lock = self._bind_loop()
+        try:
+            async with lock:
+                await self._fetch()
+        except Exception as e:
+            # 갱신 실패 시 기존 목록을 계속 사용하고 다음 요청에서 재시도
+            logger.warning(f"⚠️ LLM 모델 목록 백그라운드 갱신 실패: {e}")
+
+    def invalidate(self) -> None:
+        """캐시 무효화 (다음 요청에서 서버에서 다시 조회)"""
+        if self._models is not None:
+            logger.info(f"🗑️ LLM 모델 목록 캐시 무효화: {self.server_url}")
+        self._models = None
+        self._fetched_at = 0.0
+
+    async def resolve(self, model: Optional[str] = None) -> str:
+        """요청에 사용할 모델 결정 (지정 모델 또는 기본 모델)
+
+        Raises:
+            ValueError: 사용 가능한 모델이 없음
+        """
+        if model:
+            return model
+
+        models = await self.get_models()
+        if not models:
+            raise ValueError("사용 가능한 모델이 없습니다")
+
+        if self.strategy == "fastest":
+            return self._fastest(models)
+        return models[0]
+
+    def _fastest(self, models: List[str]) -> str:
+        """관측 성능 기준 모델 선택 (표본 부족/오래된 모델 탐색 포함)
+
+        - 최근 표본이 충분한 모델이 없으면 표본 부족/오래된 모델 중 무작위 선택
+        - 있으면 explore_ratio 비율로 표본 부족/오래된 모델을, 나머지는
+          완성 토큰당 EWMA 지연이 가장 짧은 모델을 선택
+          (토큰 정보가 없는 통계만 있으면 요청당 EWMA 지연으로 비교)
+        """
+        now = time.monotonic()
+        # (토큰당 EWMA 지연, 요청당 EWMA 지연, 모델)
+        fresh: List[Tuple[Optional[float], float, str]] = []
+        explore: List[str] = []
+        with self._stats_lock:
+            for model in models:
+                stats = self._stats.get(model)
+                if (
+                    stats is not None
+                    and stats.samples >= _MIN_SAMPLES
+                    and stats.ewma_seconds is not None
+                    and not stats.is_stale(now, self.stats_max_age)
+                ):
+                    fresh.append(
+                        (stats.ewma_seconds_per_token, stats.ewma_seconds, model)
+                    )
+                else:
+                    explore.append(model)
+
+        if explore and (not fresh or random.random() < self.explore_ratio):
+            model = random.choice(explore)
+            logger.debug(f"LLM 모델 탐색 라우팅: {model}")
+            return model
+
+        per_token = [
+            (seconds_per_token, model)
+            for seconds_per_token, _, model in fresh
+            if seconds_per_token is not None
+        ]
+        if per_token:
+            return min(per_token)[1]
+        return min((seconds, model) for _, seconds, model in fresh)[1]
+
+    def record(
+        self,
+        model: str,
+        seconds: float,
+        error: Optional[BaseException] = None,
+        completion_tokens: Optional[int] = None,
+    ) -> None:
+        """요청 결과 기록 (모델 없음 오류면 캐시 무효화)
+
+        Args:
+            model: 모델 ID
+            seconds: 요청 소요 시간
+            error: 실패한 요청의 예외
+            completion_tokens: 생성된 토큰 수 (토큰당 지연 계산용, 없으면 생략)
+        """
+        LLM_REQUEST_SECONDS.labels(model, "error" if error else "success").observe(
+            seconds
+        )
+        now = time.monotonic()
+        with self._stats_lock:
+            stats = self._stats.setdefault(model, ModelStats())
+            stats.requests += 1
+            if error is not None:
+                stats.errors += 1
+            else:
+                if stats.is_stale(now, self.stats_max_age):
+                    # 오래된 통계는 현재 성능을 반영하지 못하므로 새로 시작
+                    stats.samples = 0
+                    stats.ewma_seconds = None
+                    stats.ewma_seconds_per_token = None
+                stats.samples += 1
+                stats.last_seconds = seconds
+                stats.last_success_at = now
+                stats.ewma_seconds = _ewma(stats.ewma_seconds, seconds)
+                if completion_tokens:
+                    stats.ewma_seconds_per_token = _ewma(
+                        stats.ewma_seconds_per_token, seconds / completion_tokens
+                    )
+
+        if error is not None and is_model_not_found(error):
+            logger.warning(f"⚠️ 모델을 찾을 수 없음 ({model}), 모델 목록 재조회 예정")
+            self.invalidate()
+
+    def stats(self) -> dict:
+        """캐시 상태와 모델별 지연 통계"""
+        with self._stats_lock:
+            per_model = {model: s.to_dict() for model, s in self._stats.items()}
+        return {
+            "models": self._models,
+            "age_seconds": (
+                time.monotonic() - self._fetched_at
+                if self._models is not None
+                else None
+            ),
+            "ttl": self.ttl,
+            "strategy": self.strategy,
+            "explore_ratio": self.explore_ratio,
+            "stats_max_age": self.stats_max_age,
+            "per_model": per_model,
+        }
+
+
+# 서버 URL별 인스턴스
+_registries: Dict[str, LLMModelRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_llm_model_registry(
+    server_url: Optional[str] = None, api_key: Optional[str] = None
+) -> LLMModelRegistry:
+    """LLM 모델 레지스트리 (서버 URL별 싱글톤)"""
+    server_url = server_url or settings.LLM_SERVER_URL
+    with _registries_lock:
+        registry = _registries.get(server_url)
+        if registry is None:
+            registry = LLMModelRegistry(
+                server_url, api_key=api_key or settings.LLM_API_KEY
+            )
+            _registries[server_url] = registry
+        return registry
@@ -0,0 +1,158 @@
+"""OCR 결과 → LLM 프롬프트 변환
+
+OCRExtractDTO를 그대로 json.dumps하면 박스마다 bbox 좌표 8개와 신뢰도가
+프롬프트 토큰으로 들어갑니다. 여기서는 텍스트 박스를 읽기 순서(위→아래,
+왼쪽→오른쪽)의 줄 단위 텍스트로 렌더링하고, 필요하면 줄마다 대략적인 위치만
+붙입니다. 토큰 예산을 넘는 페이지는 줄 경계에서 여러 세그먼트로 나눕니다.
+
+토큰 수는 토크나이저 없이 추정합니다. (ASCII 4자당 1토큰, 그 외 문자는 1자당
+1토큰 - 한글이 섞인 OCR 텍스트에서 실제보다 약간 크게 잡히는 보수적인 값)
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import List, Sequence
+
+from ..schemas.ocr_db import OCRExtractDTO
+from ..schemas.ocr_text_box import OCRTextBoxCreate
+
+# 좌표 표기 격자 (페이지 크기 기준 0 ~ GRID-1)
+GRID = 100
+
+
+def estimate_tokens(text: str) -> int:
+    """프롬프트 토큰 수 추정 (ASCII 4자당 1토큰, 그 외 문자 1자당 1토큰)"""
+    ascii_chars = sum(1 for ch in text if ch.isascii())
+    return math.ceil(ascii_chars / 4) + (len(text) - ascii_chars)
+
+
+@dataclass
+class _Line:
+    """같은 줄로 묶인 텍스트 박스"""
+
+    y: float
+    height: float
+    boxes: List[OCRTextBoxCreate] = field(default_factory=list)
+
+
+def _box_bounds(box: OCRTextBoxCreate):
+    xs = [point[0] for point in box.bbox]
+    ys = [point[1] for point in box.bbox]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def group_lines(boxes: Sequence[OCRTextBoxCreate]) -> List[List[OCRTextBoxCreate]]:
+    """텍스트 박스를 읽기 순서의 줄로 묶기
+
+    박스 세로 중심이 현재 줄 중심에서 줄 높이의 절반 이내면 같은 줄로 봅니다.
+    줄은 위→아래, 줄 안의 박스는 왼쪽→오른쪽으로 정렬합니다.
+    """
+    placed = [box for box in boxes if box.bbox]
+    placed.sort(key=lambda box: _box_bounds(box)[1])
+
+    lines: List[_Line] = []
+    for box in placed:
+        _, top, _, bottom = _box_bounds(box)
+        center, height = (top + bottom) / 2, max(bottom - top, 1.0)
+        line = lines[-1] if lines else None
+        if line is not None and abs(center - line.y) <= max(line.height, height) / 2:
+            # 줄 중심/높이는 박스 평균으로 갱신
+            count = len(line.boxes)
+            line.y = (line.y * count + center) / (count + 1)
+            line.height = (line.height * count + height) / (count + 1)
+            line.boxes.append(box)
+        else:
+            lines.append(_Line(y=center, height=height, boxes=[box]))
+
+    return [sorted(line.boxes, key=lambda box: _box_bounds(box)[0]) for line in lines]
+
+
+def render_page_lines(page: OCRExtractDTO, include_coords: bool = False) -> List[str]:
+    """페이지를 읽기 순서의 줄 텍스트 리스트로 렌더링
+
+    Args:
+        page: OCR 결과
+        include_coords: 줄 앞에 대략적인 위치 [x,y] 표기 여부
+            (페이지 내 텍스트 영역 기준 0~99 격자, 줄 첫 박스의 왼쪽 위)
+
+    Returns:
+        줄 텍스트 리스트 (박스 사이는 공백 하나)
+    """
+    lines = group_lines(page.text_boxes)
+    if not lines:
+        return []
+
+    if include_coords:
+        bounds = [_box_bounds(box) for line in lines for box in line]
+        min_x = min(b[0] for b in bounds)
+        min_y = min(b[1] for b in bounds)
+        width = max(max(b[2] for b in bounds) - min_x, 1.0)
+        height = max(max(b[3] for b in bounds) - min_y, 1.0)
+
+    rendered = []
+    for line in lines:
+        text = " ".join(box.text.strip() for box in line if box.text.strip())
+        if not text:
+            continue
+        if include_coords:
+            left, top, _, _ = _box_bounds(line[0])
+            x = min(GRID - 1, int((left - min_x) / width * GRID))
+            y = min(GRID - 1, int((top - min_y) / height * GRID))
+            text = f"[{x},{y}] {text}"
+        rendered.append(text)
+    return rendered
+
+
+def split_lines(lines: Sequence[str], max_tokens: int) -> List[str]:
+    """줄 리스트를 토큰 예산 이하의 세그먼트 텍스트로 분할
+
+    줄 경계에서 나누며, 예산보다 긴 줄 하나는 단독 세그먼트가 됩니다.
+    """
+    segments: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+    for line in lines:
+        tokens = estimate_tokens(line) + 1  # 줄바꿈
+        if current and current_tokens + tokens > max_tokens:
+            segments.append("\n".join(current))
+            current, current_tokens = [], 0
+        current.append(line)
+        current_tokens += tokens
+    if current:
+        segments.append("\n".join(current))
+    return segments
+
+
+class OCRPromptBuilder:
+    """OCR 결과 페이지 → 토큰 예산 이하의 프롬프트 세그먼트"""
+
+    def __init__(self, max_tokens: int, include_coords: bool = False):
+        """
+        Args:
+            max_tokens: 세그먼트당 최대 프롬프트 토큰 (추정치)
+            include_coords: 줄 앞에 대략적인 위치 [x,y] 표기 여부
+        """
+        if max_tokens <= 0:
+            raise ValueError("max_tokens는 0보다 커야 합니다")
+        self.max_tokens = max_tokens
+        self.include_coords = include_coords
+
+    def render_page(self, page: OCRExtractDTO) -> str:
+        """페이지 전체를 한 덩어리 텍스트로 렌더링 (예산 무시)"""
+        return "\n".join(render_page_lines(page, self.include_coords))
+
+    def build_segments(self, page: OCRExtractDTO) -> List[str]:
+        """페이지를 토큰 예산 이하의 세그먼트로 렌더링
+
+        Returns:
+            세그먼트 텍스트 리스트 (텍스트가 없는 페이지는 빈 리스트)
+        """
+        return split_lines(
+            render_page_lines(page, self.include_coords), self.max_tokens
+        )
+
+    @staticmethod
+    def merge_outputs(outputs: Sequence[str | None]) -> str | None:
+        """세그먼트별 LLM 응답을 페이지 응답 하나로 병합 (빈 응답 제외)"""
+        parts = [output.strip() for output in outputs if output and output.strip()]
+        return "\n".join(parts) if parts else None
@@ -0,0 +1,253 @@
+"""LLM 응답 캐시 (프롬프트 해시 기반)
+
+모델 + 메시지 + 샘플링 파라미터의 해시를 키로 ChatCompletion 응답을 캐시하여,
+같은 템플릿 문서나 재처리 배치처럼 프롬프트가 동일한 요청의 생성을 건너뜁니다.
+
+- 결정적 요청(temperature 0, n=1, 비스트리밍)만 캐시 (그 외는 bypass)
+- 1차: 프로세스 내 LRU (항목 수 / 전체 크기(UTF-8 바이트) 제한)
+- 2차: Redis (TTL, 항목 크기 제한) - 워커 프로세스/API 서버 간 공유, asyncio 클라이언트
+- 캐시 오류는 요청을 실패시키지 않고 미스로 처리
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from openai.types.chat import ChatCompletion
+from prometheus_client import Counter
+
+from ..config import settings
+from ..core.logging import get_logger
+from ..service.redis_service import get_redis_service
+
+logger = get_logger(__name__)
+
+# === Prometheus 메트릭 ===
+CACHE_LOOKUPS = Counter(
+    "llm_response_cache_lookups_total",
+    "LLM 응답 캐시 조회 수 (result=memory_hit/redis_hit/miss/bypass)",
+    ["result"],
+)
+CACHE_TOKENS_SAVED = Counter(
+    "llm_response_cache_tokens_saved_total",
+    "캐시 적중으로 생성을 건너뛴 토큰 합계 (usage.total_tokens)",
+)
+
+KEY_PREFIX = "llm:response"
+
+CompletionFn = Callable[[], Awaitable[ChatCompletion]]
+
+
+class LLMResponseCache:
+    """2계층(메모리 LRU + Redis) LLM 응답 캐시"""
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[int] = None,
+        use_redis: Optional[bool] = None,
+        enabled: Optional[bool] = None,
+    ):
+        self.enabled = (
+            enabled if enabled is not None else settings.LLM_RESPONSE_CACHE_ENABLED
+        )
+        self.max_entries = max_entries or settings.LLM_RESPONSE_CACHE_MAX_ENTRIES
+        self.max_bytes = max_bytes or settings.LLM_RESPONSE_CACHE_MAX_MB * 1024 * 1024
+        self.ttl = ttl or settings.LLM_RESPONSE_CACHE_TTL
+        self.redis_max_entry_bytes = (
+            settings.LLM_RESPONSE_CACHE_REDIS_MAX_ENTRY_KB * 1024
+        )
+        self.use_redis = (
+            use_redis if use_redis is not None else settings.LLM_RESPONSE_CACHE_REDIS
+        )
+
+        self._lock = threading.Lock()
+        # 키 -> (응답 JSON, UTF-8 바이트 크기)
+        self._memory: "OrderedDict[str, Tuple[str, int]]" = OrderedDict()
+        self._memory_bytes = 0
+
+        # 통계
+        self._memory_hits = 0
+        self._redis_hits = 0
+        self._misses = 0
+        self._bypasses = 0
+        self._tokens_saved = 0
+
+    @staticmethod
+    def is_cacheable(params: Dict[str, Any]) -> bool:
+        """결정적 샘플링 설정인지 확인 (temperature 0, n=1, 비스트리밍)"""
+        return (
+            params.get("temperature") == 0
+            and not params.get("stream")
+            and params.get("n") in (None, 1)
+        )
+
+    def make_key(
+        self, model: str, messages: List[Dict[str, Any]], params: Dict[str, Any]
+    ) -> str:
+        """모델 + 메시지 + 샘플링 파라미터 해시로 캐시 키 생성"""
+        canonical = json.dumps(
+            {"model": model, "messages": messages, "params": params},
+            ensure_ascii=False,
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        digest = hashlib.sha256(canonical.encode()).hexdigest()
+        return f"{KEY_PREFIX}:{digest}"
+
+    async def cached_completion(
+        self,
+        model: str,
+        messages: List[Dict[str, Any]],
+        params: Dict[str, Any],
+        completion_fn: CompletionFn,
+    ) -> ChatCompletion:
+        """캐시 적중이면 저장된 응답을, 미스면 completion_fn 결과를 저장 후 반환
+
+        Args:
+            model: 모델 ID
+            messages: 메시지 리스트
+            params: 샘플링 파라미터 (temperature, max_tokens 등 요청 인자 전체)
+            completion_fn: 실제 LLM 호출 (미스일 때만 실행)
+
+        Returns:
+            ChatCompletion 응답
+        """
+        if not self.enabled or not self.is_cacheable(params):
+            self._record("bypass")
+            return await completion_fn()
+
+        key = self.make_key(model, messages, params)
+        cached = await self.get(key)
+        if cached is not None:
+            return cached
+
+        response = await completion_fn()
+        if response.choices and response.choices[0].finish_reason != "length":
+            # 최대 토큰에서 잘린 응답은 저장하지 않음
+            await self.set(key, response)
+        return response
+
+    async def get(self, key: str) -> Optional[ChatCompletion]:
+        """키 조회 (메모리 → Redis 순)"""
+        payload = self._memory_get(key)
+        if payload is not None:
+            self._record("memory_hit")
+        elif self.use_redis:
+            payload = await self._redis_get(key)
+            if payload is not None:
+                self._memory_put(key, payload)
+                self._record("redis_hit")
+
+        if payload is None:
+            self._record("miss")
+            return None
+
+        response = ChatCompletion.model_validate_json(payload)
+        tokens = response.usage.total_tokens if response.usage else 0
+        with self._lock:
+            self._tokens_saved += tokens
+        CACHE_TOKENS_SAVED.inc(tokens)
+        return response
+
+    async def set(self, key: str, response: ChatCompletion) -> None:
+        """응답 저장 (메모리 + Redis)"""
+        payload = response.model_dump_json()
+        # 한글 등 멀티바이트 문자가 있으므로 크기 제한은 바이트 기준
+        size = len(payload.encode())
+        self._memory_put(key, payload, size)
+        if self.use_redis and size <= self.redis_max_entry_bytes:
+            await self._redis_set(key, payload)
+
+    # === 메모리 계층 (LRU) ===
+    def _memory_get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            self._memory.move_to_end(key)
+            return entry[0]
+
+    def _memory_put(self, key: str, payload: str, size: Optional[int] = None) -> None:
+        if size is None:
+            size = len(payload.encode())
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= previous[1]
+            self._memory[key] = (payload, size)
+            self._memory_bytes += size
+
+            while (
+                len(self._memory) > self.max_entries
+                or self._memory_bytes > self.max_bytes
+            ):
+                _, (_, evicted_size) = self._memory.popitem(last=False)
+                self._memory_bytes -= evicted_size
+
+    # === Redis 계층 ===
+    @staticmethod
+    def _get_redis_client():
+        # async 커넥션 풀은 이벤트 루프별이므로 호출마다 현재 루프의 클라이언트 사용
+        return get_redis_service().get_async_redis_client(decode_responses=True)
+
+    async def _redis_get(self, key: str) -> Optional[str]:
+        try:
+            return await self._get_redis_client().get(key)
+        except Exception as e:
+            logger.warning(f"LLM 응답 캐시 Redis 조회 실패 (미스로 처리): {e}")
+            return None
+
+    async def _redis_set(self, key: str, payload: str) -> None:
+        try:
+            await self._get_redis_client().set(key, payload, ex=self.ttl)
+        except Exception as e:
+            logger.warning(f"LLM 응답 캐시 Redis 저장 실패: {e}")
+
+    def _record(self, result: str) -> None:
+        CACHE_LOOKUPS.labels(result=result).inc()
+        with self._lock:
+            if result == "memory_hit":
+                self._memory_hits += 1
+            elif result == "redis_hit":
+                self._redis_hits += 1
+            elif result == "bypass":
+                self._bypasses += 1
+            else:
+                self._misses += 1
+
+    def stats(self) -> dict:
+        """적중률/절약 토큰 통계"""
+        with self._lock:
+            hits = self._memory_hits + self._redis_hits
+            lookups = hits + self._misses
+            return {
+                "lookups": lookups,
+                "memory_hits": self._memory_hits,
+                "redis_hits": self._redis_hits,
+                "misses": self._misses,
+                "bypasses": self._bypasses,
+                "hit_ratio": hits / lookups if lookups else 0.0,
+                "tokens_saved": self._tokens_saved,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+            }
+
+
+# 싱글톤 인스턴스
+_cache_instance: Optional[LLMResponseCache] = None
+
+
+def get_llm_response_cache() -> LLMResponseCache:
+    """LLM 응답 캐시 (싱글톤 패턴)"""
+    global _cache_instance
+    if _cache_instance is None:
+        _cache_instance = LLMResponseCache()
+    return _cache_instance
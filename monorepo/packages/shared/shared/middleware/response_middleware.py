@@ -19,6 +19,10 @@ class ResponseLogMiddleware(BaseHTTPMiddleware):
         try:
             response = await call_next(request)
 
+            # SSE 등 스트리밍 응답은 본문을 모으지 않고 그대로 전달
+            if response.headers.get("content-type", "").startswith("text/event-stream"):
+                return response
+
             # 응답 본문을 읽기 위한 준비
             response_body = b""
             async for chunk in response.body_iterator:
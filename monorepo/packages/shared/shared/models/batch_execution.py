@@ -9,6 +9,9 @@ from shared.schemas.enums import ProcessStatus
 
 from .base import Base
 
+# 실패 이미지가 포함된 채로 완료된 배치의 오류 메시지
+FAILURE_MESSAGE = "Batch completed with failures."
+
 
 class BatchExecution(Base):
     """
@@ -114,6 +117,23 @@ class BatchExecution(Base):
             f",progress={self.completed_images}/{self.total_images})>"
         )
 
+    @staticmethod
+    def resolve_completion(
+        total_images: int, completed_images: int, failed_images: int
+    ) -> Optional[bool]:
+        """카운터 값으로 배치 완료 여부 판단
+
+        Returns:
+            None(진행 중), True(모두 성공), False(실패 포함 완료)
+        """
+        total_processed = completed_images + failed_images
+
+        # 총 처리 수가 총 이미지 수보다 크거나 같으면 완료
+        if total_images > 0 and total_processed >= total_images:
+            # 실패한 이미지가 하나라도 있으면 배치 상태는 'FAILURE'
+            return failed_images == 0
+        return None
+
     def _check_and_complete_execution(self):
         """
         처리된 이미지(완료+실패)가 총 이미지 수에 도달했는지 확인하고
@@ -123,16 +143,13 @@ class BatchExecution(Base):
         if self.status in {ProcessStatus.SUCCESS, ProcessStatus.FAILURE}:
             return
 
-        total_processed = self.completed_images + self.failed_images
-        total_images = self.total_images
-
-        # 총 처리 수가 총 이미지 수보다 크거나 같으면 완료 처리
-        if total_images > 0 and total_processed >= total_images:
-            # 실패한 이미지가 하나라도 있으면 배치 상태는 'FAILURE'
-            success = self.failed_images == 0
+        success = self.resolve_completion(
+            self.total_images, self.completed_images, self.failed_images
+        )
+        if success is not None:
             self.complete_execution(
                 success=success,
-                error_message="Batch completed with failures." if not success else None,
+                error_message=FAILURE_MESSAGE if not success else None,
             )
 
     def increment_completed_images(self, count: int = 1):
@@ -5,10 +5,18 @@
 - PipelineStage: 스테이지 추상 기본 클래스
 - PipelineOrchestrator: 파이프라인 실행 조율
 - PipelineCacheService: Redis 기반 컨텍스트 캐시 서비스
+- AsyncPipelineCacheService: asyncio 컨텍스트 캐시 서비스 (API 서버용)
+- PipelineContextCodec: 컨텍스트 직렬화 코덱 (버전 헤더 + msgpack/압축)
 - Exceptions: 파이프라인 관련 예외 처리
 """
 
-from .cache import PipelineCacheService, get_pipeline_cache_service
+from .cache import (
+    AsyncPipelineCacheService,
+    PipelineCacheService,
+    get_async_pipeline_cache_service,
+    get_pipeline_cache_service,
+)
+from .codec import PipelineContextCodec, get_pipeline_context_codec
 from .context import LLMResult, OCRResult, PipelineContext
 from .exceptions import PipelineError, StageError
 from .orchestrator import PipelineOrchestrator
@@ -22,6 +30,10 @@ __all__ = [
     "PipelineOrchestrator",
     "PipelineCacheService",
     "get_pipeline_cache_service",
+    "AsyncPipelineCacheService",
+    "get_async_pipeline_cache_service",
+    "PipelineContextCodec",
+    "get_pipeline_context_codec",
     "StageError",
     "PipelineError",
 ]
@@ -1,29 +1,45 @@
 """파이프라인 컨텍스트 캐시 서비스
 
 Redis를 사용하여 PipelineContext를 저장/조회하는 서비스
+
+배치별 chain ID를 정렬 집합(pipeline:batch:{batch_id}:chains)으로 색인하여,
+배치 전체 조회 시 키스페이스 SCAN 없이 MGET 한 번으로 가져옵니다.
+색인 도입 전에 저장된 컨텍스트는 배치당 한 번만 SCAN하여 색인에 채웁니다.
+값은 PipelineContextCodec(버전 헤더 + msgpack/압축)으로 저장합니다.
+
+Celery 체인에서는 claim-check 방식으로 {batch_id, chain_execution_id}만 전달하고
+컨텍스트 본문은 이 캐시를 통해 저장/조회합니다. (PIPELINE_CLAIM_CHECK)
+
+API 서버(이벤트 루프)에서는 AsyncPipelineCacheService를 사용합니다.
+Redis I/O는 asyncio 클라이언트로, 코덱 인코딩/디코딩은 스레드로 넘겨
+Redis 지연이 다른 HTTP 요청을 막지 않게 합니다.
 """
 
-import json
-from typing import Optional
+import asyncio
+import time
+from typing import List, Optional
 
 import redis
+import redis.asyncio as aioredis
 
+from ..config import settings
 from ..core.logging import get_logger
 from ..service.redis_service import get_redis_service
+from .codec import PipelineContextCodec, get_pipeline_context_codec
 from .context import PipelineContext
 
 logger = get_logger(__name__)
 
+# claim-check payload 키 (이 키만 있으면 컨텍스트 본문 대신 참조로 간주)
+CLAIM_KEYS = frozenset({"batch_id", "chain_execution_id"})
 
-class PipelineCacheService:
-    """파이프라인 컨텍스트 Redis 캐시 서비스"""
+# 색인 백필 표시 / 백필한 색인의 TTL (컨텍스트 기본 TTL과 동일)
+_BACKFILL_TTL = 86400
+_SCAN_COUNT = 500
 
-    def __init__(self, redis_client: Optional[redis.Redis] = None):
-        """
-        Args:
-            redis_client: Redis 클라이언트 (None일 경우 기본 클라이언트 사용)
-        """
-        self.redis_client = redis_client or get_redis_service().get_redis_client()
+
+class _PipelineCacheKeys:
+    """sync/async 캐시 서비스 공통 키 규칙"""
 
     def _get_key(self, batch_id: str, chain_id: str) -> str:
         """Redis 키 생성
@@ -37,6 +53,58 @@ class PipelineCacheService:
         """
         return f"pipeline:batch:{batch_id}:chain:{chain_id}"
 
+    def _get_index_key(self, batch_id: str) -> str:
+        """배치별 chain ID 색인 키 (정렬 집합, score=최초 저장 시각)
+
+        Args:
+            batch_id: 배치 ID
+
+        Returns:
+            Redis 키
+        """
+        return f"pipeline:batch:{batch_id}:chains"
+
+    def _get_backfill_key(self, batch_id: str) -> str:
+        """색인 백필(SCAN) 완료 표시 키"""
+        return f"pipeline:batch:{batch_id}:chains:backfilled"
+
+    def _get_chain_pattern(self, batch_id: str) -> str:
+        """배치의 컨텍스트 키 SCAN 패턴"""
+        return self._get_key(batch_id, "*")
+
+    @staticmethod
+    def _chain_id_from_key(key) -> str:
+        if isinstance(key, bytes):
+            key = key.decode()
+        return key.rsplit(":", 1)[-1]
+
+    @staticmethod
+    def _decode_chain_ids(members: list) -> List[str]:
+        return [
+            member.decode() if isinstance(member, bytes) else member
+            for member in members
+        ]
+
+
+class PipelineCacheService(_PipelineCacheKeys):
+    """파이프라인 컨텍스트 Redis 캐시 서비스"""
+
+    def __init__(
+        self,
+        redis_client: Optional[redis.Redis] = None,
+        codec: Optional[PipelineContextCodec] = None,
+    ):
+        """
+        Args:
+            redis_client: 바이너리 Redis 클라이언트 (decode_responses=False,
+                None일 경우 기본 클라이언트 사용)
+            codec: 컨텍스트 코덱 (None일 경우 설정 기반 기본 코덱 사용)
+        """
+        self.redis_client = (
+            redis_client or get_redis_service().get_binary_redis_client()
+        )
+        self.codec = codec or get_pipeline_context_codec()
+
     def save_context(self, context: PipelineContext, ttl: int = 86400) -> None:
         """Context를 Redis에 저장
 
@@ -44,8 +112,16 @@ class PipelineCacheService:
             context: 파이프라인 컨텍스트
             ttl: Time To Live (초, 기본 24시간)
         """
-        key = self._get_key(context.batch_id, str(context.chain_execution_id))
-        self.redis_client.set(key, context.model_dump_json(), ex=ttl)
+        chain_id = str(context.chain_execution_id)
+        key = self._get_key(context.batch_id, chain_id)
+        index_key = self._get_index_key(context.batch_id)
+
+        # 컨텍스트 저장과 색인 갱신을 한 번의 왕복으로 처리
+        pipe = self.redis_client.pipeline(transaction=True)
+        pipe.set(key, self.codec.encode(context), ex=ttl)
+        pipe.zadd(index_key, {chain_id: time.time()}, nx=True)
+        pipe.expire(index_key, ttl)
+        pipe.execute()
         logger.debug(f"✅ 컨텍스트 저장: {key} (TTL: {ttl}s)")
 
     def load_context(self, batch_id: str, chain_id: str) -> PipelineContext:
@@ -67,14 +143,32 @@ class PipelineCacheService:
         if not data:
             raise ValueError(f"Context not found in Redis: {key}")
 
-        # JSON 문자열을 딕셔너리로 파싱
-        if isinstance(data, str):
-            data_dict = json.loads(data)
-        else:
-            data_dict = data
-
         logger.debug(f"✅ 컨텍스트 로드: {key}")
-        return PipelineContext(**data_dict)  # type: ignore
+        return self.codec.decode(data)  # type: ignore
+
+    def _backfill_index(self, batch_id: str) -> None:
+        """색인 도입 전에 저장된 컨텍스트를 SCAN으로 찾아 색인에 추가 (배치당 1회)"""
+        if not self.redis_client.set(
+            self._get_backfill_key(batch_id), 1, nx=True, ex=_BACKFILL_TTL
+        ):
+            return
+
+        chain_ids = [
+            self._chain_id_from_key(key)
+            for key in self.redis_client.scan_iter(
+                match=self._get_chain_pattern(batch_id), count=_SCAN_COUNT
+            )
+        ]
+        if not chain_ids:
+            return
+
+        index_key = self._get_index_key(batch_id)
+        now = time.time()
+        pipe = self.redis_client.pipeline(transaction=True)
+        pipe.zadd(index_key, {chain_id: now for chain_id in chain_ids}, nx=True)
+        pipe.expire(index_key, _BACKFILL_TTL)
+        pipe.execute()
+        logger.info(f"🗂️ 컨텍스트 색인 백필: {len(chain_ids)}개 (batch_id: {batch_id})")
 
     def load_all_by_batch_id(self, batch_id: str) -> list[PipelineContext]:
         """batch_id로 모든 Context 조회
@@ -88,20 +182,25 @@ class PipelineCacheService:
         Raises:
             ValueError: batch_id에 해당하는 Context가 없을 때
         """
-        pattern = f"pipeline:batch:{batch_id}:chain:*"
+        self._backfill_index(batch_id)
+        index_key = self._get_index_key(batch_id)
+        chain_ids = self._decode_chain_ids(self.redis_client.zrange(index_key, 0, -1))
         contexts = []
 
-        # SCAN을 사용하여 패턴에 맞는 모든 키 조회
-        for key in self.redis_client.scan_iter(match=pattern, count=100):
-            data = self.redis_client.get(key)
-            if data:
-                # JSON 문자열을 딕셔너리로 파싱
-                if isinstance(data, str):
-                    data_dict = json.loads(data)
-                else:
-                    data_dict = data
+        if chain_ids:
+            # 색인된 chain의 컨텍스트를 MGET 한 번으로 조회
+            keys = [self._get_key(batch_id, chain_id) for chain_id in chain_ids]
+            expired = []
+            for chain_id, data in zip(chain_ids, self.redis_client.mget(keys)):
+                if not data:
+                    # TTL로 만료된 컨텍스트는 색인에서도 제거
+                    expired.append(chain_id)
+                    continue
+
+                contexts.append(self.codec.decode(data))  # type: ignore
 
-                contexts.append(PipelineContext(**data_dict))  # type: ignore
+            if expired:
+                self.redis_client.zrem(index_key, *expired)
 
         if not contexts:
             raise ValueError(f"No contexts found for batch_id: {batch_id}")
@@ -122,10 +221,56 @@ class PipelineCacheService:
             삭제 성공 여부
         """
         key = self._get_key(batch_id, chain_id)
-        result = self.redis_client.delete(key)
+        pipe = self.redis_client.pipeline(transaction=True)
+        pipe.delete(key)
+        pipe.zrem(self._get_index_key(batch_id), chain_id)
+        result, _ = pipe.execute()
         logger.debug(f"✅ 컨텍스트 삭제: {key}")
         return int(result) > 0  # type: ignore
 
+    def to_task_payload(self, context: PipelineContext) -> dict:
+        """Celery 태스크 간에 전달할 payload 생성
+
+        컨텍스트는 모드와 관계없이 항상 Redis에 저장합니다. (상태 조회/재개용)
+        claim-check 모드에서는 참조만 반환하여 OCR 결과 같은 큰 데이터가
+        브로커/결과 백엔드를 거치지 않게 합니다.
+
+        Args:
+            context: 파이프라인 컨텍스트
+
+        Returns:
+            {batch_id, chain_execution_id} 또는 (claim-check 비활성 시) 전체 dict
+        """
+        self.save_context(context)
+        if not settings.PIPELINE_CLAIM_CHECK:
+            return context.model_dump()
+
+        return {
+            "batch_id": context.batch_id,
+            "chain_execution_id": context.chain_execution_id,
+        }
+
+    def from_task_payload(self, payload: dict) -> PipelineContext:
+        """Celery 태스크 payload에서 컨텍스트 복원
+
+        claim-check 참조면 Redis에서 로드하고, 전체 dict면 그대로 변환합니다.
+        (배포 중 이전 형식으로 큐에 들어간 태스크도 처리)
+
+        Args:
+            payload: to_task_payload의 반환값
+
+        Returns:
+            파이프라인 컨텍스트
+
+        Raises:
+            ValueError: 참조한 Context가 Redis에 없을 때
+        """
+        if payload.keys() == CLAIM_KEYS:
+            return self.load_context(
+                payload["batch_id"], str(payload["chain_execution_id"])
+            )
+        return PipelineContext(**payload)
+
     def exists(self, batch_id: str, chain_id: str) -> bool:
         """Context 존재 여부 확인
 
@@ -140,8 +285,175 @@ class PipelineCacheService:
         return int(self.redis_client.exists(key)) > 0  # type: ignore
 
 
+class AsyncPipelineCacheService(_PipelineCacheKeys):
+    """파이프라인 컨텍스트 Redis 캐시 서비스 (asyncio)
+
+    PipelineCacheService와 같은 키/색인/코덱을 사용하므로 서로 저장한
+    컨텍스트를 그대로 읽을 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[aioredis.Redis] = None,
+        codec: Optional[PipelineContextCodec] = None,
+    ):
+        """
+        Args:
+            redis_client: 바이너리 asyncio Redis 클라이언트 (None일 경우
+                현재 이벤트 루프의 공유 풀 클라이언트를 호출 시점에 사용)
+            codec: 컨텍스트 코덱 (None일 경우 설정 기반 기본 코덱 사용)
+        """
+        self._redis_client = redis_client
+        self.codec = codec or get_pipeline_context_codec()
+
+    @property
+    def redis_client(self) -> aioredis.Redis:
+        if self._redis_client is not None:
+            return self._redis_client
+        return get_redis_service().get_async_redis_client(decode_responses=False)
+
+    async def save_context(self, context: PipelineContext, ttl: int = 86400) -> None:
+        """Context를 Redis에 저장
+
+        Args:
+            context: 파이프라인 컨텍스트
+            ttl: Time To Live (초, 기본 24시간)
+        """
+        chain_id = str(context.chain_execution_id)
+        key = self._get_key(context.batch_id, chain_id)
+        index_key = self._get_index_key(context.batch_id)
+        data = await asyncio.to_thread(self.codec.encode, context)
+
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            pipe.set(key, data, ex=ttl)
+            pipe.zadd(index_key, {chain_id: time.time()}, nx=True)
+            pipe.expire(index_key, ttl)
+            await pipe.execute()
+        logger.debug(f"✅ 컨텍스트 저장: {key} (TTL: {ttl}s)")
+
+    async def load_context(self, batch_id: str, chain_id: str) -> PipelineContext:
+        """Redis에서 Context 로드
+
+        Args:
+            batch_id: 배치 ID
+            chain_id: 체인 ID
+
+        Returns:
+            파이프라인 컨텍스트
+
+        Raises:
+            ValueError: Context가 Redis에 없을 때
+        """
+        key = self._get_key(batch_id, chain_id)
+        data = await self.redis_client.get(key)
+
+        if not data:
+            raise ValueError(f"Context not found in Redis: {key}")
+
+        logger.debug(f"✅ 컨텍스트 로드: {key}")
+        return await asyncio.to_thread(self.codec.decode, data)
+
+    async def _backfill_index(self, client: aioredis.Redis, batch_id: str) -> None:
+        """색인 도입 전에 저장된 컨텍스트를 SCAN으로 찾아 색인에 추가 (배치당 1회)"""
+        if not await client.set(
+            self._get_backfill_key(batch_id), 1, nx=True, ex=_BACKFILL_TTL
+        ):
+            return
+
+        chain_ids = [
+            self._chain_id_from_key(key)
+            async for key in client.scan_iter(
+                match=self._get_chain_pattern(batch_id), count=_SCAN_COUNT
+            )
+        ]
+        if not chain_ids:
+            return
+
+        index_key = self._get_index_key(batch_id)
+        now = time.time()
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.zadd(index_key, {chain_id: now for chain_id in chain_ids}, nx=True)
+            pipe.expire(index_key, _BACKFILL_TTL)
+            await pipe.execute()
+        logger.info(f"🗂️ 컨텍스트 색인 백필: {len(chain_ids)}개 (batch_id: {batch_id})")
+
+    async def load_all_by_batch_id(self, batch_id: str) -> list[PipelineContext]:
+        """batch_id로 모든 Context 조회
+
+        Args:
+            batch_id: 배치 ID
+
+        Returns:
+            파이프라인 컨텍스트 리스트
+
+        Raises:
+            ValueError: batch_id에 해당하는 Context가 없을 때
+        """
+        client = self.redis_client
+        await self._backfill_index(client, batch_id)
+        index_key = self._get_index_key(batch_id)
+        chain_ids = self._decode_chain_ids(await client.zrange(index_key, 0, -1))
+        contexts: list[PipelineContext] = []
+
+        if chain_ids:
+            keys = [self._get_key(batch_id, chain_id) for chain_id in chain_ids]
+            values = await client.mget(keys)
+            expired = [
+                chain_id for chain_id, data in zip(chain_ids, values) if not data
+            ]
+            payloads = [data for data in values if data]
+
+            # 디코딩은 CPU 작업이므로 이벤트 루프 밖에서 한 번에 처리
+            contexts = await asyncio.to_thread(
+                lambda: [self.codec.decode(data) for data in payloads]
+            )
+
+            if expired:
+                await client.zrem(index_key, *expired)
+
+        if not contexts:
+            raise ValueError(f"No contexts found for batch_id: {batch_id}")
+
+        logger.debug(
+            f"✅ 배치 컨텍스트 조회: {len(contexts)}개 발견 (batch_id: {batch_id})"
+        )
+        return contexts
+
+    async def delete_context(self, batch_id: str, chain_id: str) -> bool:
+        """Context를 Redis에서 삭제
+
+        Args:
+            batch_id: 배치 ID
+            chain_id: 체인 ID
+
+        Returns:
+            삭제 성공 여부
+        """
+        key = self._get_key(batch_id, chain_id)
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.zrem(self._get_index_key(batch_id), chain_id)
+            result, _ = await pipe.execute()
+        logger.debug(f"✅ 컨텍스트 삭제: {key}")
+        return int(result) > 0
+
+    async def exists(self, batch_id: str, chain_id: str) -> bool:
+        """Context 존재 여부 확인
+
+        Args:
+            batch_id: 배치 ID
+            chain_id: 체인 ID
+
+        Returns:
+            존재 여부
+        """
+        key = self._get_key(batch_id, chain_id)
+        return int(await self.redis_client.exists(key)) > 0
+
+
 # 전역 싱글톤 인스턴스
 _pipeline_cache_service: Optional[PipelineCacheService] = None
+_async_pipeline_cache_service: Optional[AsyncPipelineCacheService] = None
 
 
 def get_pipeline_cache_service() -> PipelineCacheService:
@@ -150,3 +462,11 @@ def get_pipeline_cache_service() -> PipelineCacheService:
     if _pipeline_cache_service is None:
         _pipeline_cache_service = PipelineCacheService()
     return _pipeline_cache_service
+
+
+def get_async_pipeline_cache_service() -> AsyncPipelineCacheService:
+    """AsyncPipelineCacheService 싱글톤 인스턴스 반환"""
+    global _async_pipeline_cache_service
+    if _async_pipeline_cache_service is None:
+        _async_pipeline_cache_service = AsyncPipelineCacheService()
+    return _async_pipeline_cache_service
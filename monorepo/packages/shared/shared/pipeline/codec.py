@@ -0,0 +1,276 @@
+"""PipelineContext 직렬화 코덱
+
+Redis에 저장하는 PipelineContext의 인코딩/디코딩을 담당합니다.
+
+저장 형식: [헤더 6바이트][본문]
+    - 헤더: MAGIC(3) + 버전(1) + 포맷 ID(1) + 압축 ID(1)
+    - 헤더가 없는 값은 이전 버전의 model_dump_json() 결과로 보고 JSON으로 디코딩
+
+msgpack 포맷은 텍스트 박스를 열 단위로 묶어 저장합니다.
+(텍스트 리스트 + confidence/bbox 좌표는 float64 배열 바이트)
+디코딩 시 상위 필드만 검증하고, 자체 인코딩한 텍스트 박스는 검증 없이 생성합니다.
+
+압축(zstd/lz4)은 패키지가 설치된 경우에만, 본문이 임계값 이상일 때 적용됩니다.
+"""
+
+import json
+from array import array
+from typing import Any, Dict, List, Optional
+
+import msgpack
+
+from ..config import settings
+from ..core.logging import get_logger
+from ..schemas.ocr_db import OCRExtractDTO, OCRTextBoxCreate
+from .context import PipelineContext
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성 (shared[compression])
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # 선택 의존성 (shared[compression])
+    lz4_frame = None
+
+logger = get_logger(__name__)
+
+MAGIC = b"\xa7PC"
+CODEC_VERSION = 1
+HEADER_SIZE = len(MAGIC) + 3
+
+# 포맷 ID
+FORMAT_JSON = 0
+FORMAT_MSGPACK = 1
+
+# 압축 ID
+COMPRESSION_NONE = 0
+COMPRESSION_ZSTD = 1
+COMPRESSION_LZ4 = 2
+
+# OCR 결과 필드 (msgpack 포맷에서 열 단위로 따로 저장)
+_OCR_FIELDS = {"ocr_result", "ocr_results"}
+_DEFAULT_POINTS = 4
+
+
+class ContextFormat:
+    """컨텍스트 본문 포맷 기본 클래스"""
+
+    format_id: int
+    name: str
+
+    def dumps(self, context: PipelineContext) -> bytes:
+        raise NotImplementedError
+
+    def loads(self, payload: bytes) -> PipelineContext:
+        raise NotImplementedError
+
+
+class JSONContextFormat(ContextFormat):
+    """model_dump_json 기반 포맷 (이전 저장 형식과 동일)"""
+
+    format_id = FORMAT_JSON
+    name = "json"
+
+    def dumps(self, context: PipelineContext) -> bytes:
+        return context.model_dump_json().encode()
+
+    def loads(self, payload: bytes) -> PipelineContext:
+        return PipelineContext(**json.loads(payload))
+
+
+class MsgpackContextFormat(ContextFormat):
+    """msgpack + 텍스트 박스 열 단위 패킹 포맷"""
+
+    format_id = FORMAT_MSGPACK
+    name = "msgpack"
+
+    def dumps(self, context: PipelineContext) -> bytes:
+        data = context.model_dump(mode="json", exclude=_OCR_FIELDS)
+        if context.ocr_result is not None:
+            data["ocr_result"] = _pack_page(context.ocr_result)
+        if context.ocr_results is not None:
+            data["ocr_results"] = [_pack_page(page) for page in context.ocr_results]
+        return msgpack.packb(data, use_bin_type=True)
+
+    def loads(self, payload: bytes) -> PipelineContext:
+        data = msgpack.unpackb(payload, raw=False)
+        ocr_result = data.pop("ocr_result", None)
+        ocr_results = data.pop("ocr_results", None)
+
+        # 상위 필드는 검증, 대량의 텍스트 박스는 검증 없이 생성
+        context = PipelineContext.model_validate(data)
+        if ocr_result is not None:
+            context.ocr_result = _unpack_page(ocr_result)
+        if ocr_results is not None:
+            context.ocr_results = [_unpack_page(page) for page in ocr_results]
+        return context
+
+
+def _pack_page(page: OCRExtractDTO) -> Dict[str, Any]:
+    """OCR 페이지 결과를 열 단위로 패킹"""
+    boxes = page.text_boxes
+    points = [len(box.bbox) for box in boxes]
+    coords = array("d", (v for box in boxes for point in box.bbox for v in point))
+    packed: Dict[str, Any] = {
+        "e": page.error,
+        "t": [box.text for box in boxes],
+        "c": array("d", (box.confidence for box in boxes)).tobytes(),
+        "b": coords.tobytes(),
+    }
+    # 모두 4점 bbox가 아닐 때만 점 개수 저장
+    if any(count != _DEFAULT_POINTS for count in points):
+        packed["n"] = points
+    ids = [box.ocr_execution_id for box in boxes]
+    if any(box_id is not None for box_id in ids):
+        packed["i"] = ids
+    return packed
+
+
+def _unpack_page(packed: Dict[str, Any]) -> OCRExtractDTO:
+    """열 단위 패킹을 OCR 페이지 결과로 복원"""
+    texts: List[str] = packed["t"]
+    confidences = array("d")
+    confidences.frombytes(packed["c"])
+    raw_coords = array("d")
+    raw_coords.frombytes(packed["b"])
+    coords = raw_coords.tolist()
+    points = packed.get("n") or [_DEFAULT_POINTS] * len(texts)
+    ids = packed.get("i") or [None] * len(texts)
+
+    boxes = []
+    o = 0
+    for text, confidence, count, box_id in zip(texts, confidences, points, ids):
+        if count == _DEFAULT_POINTS:
+            c = coords
+            bbox = [
+                [c[o], c[o + 1]],
+                [c[o + 2], c[o + 3]],
+                [c[o + 4], c[o + 5]],
+                [c[o + 6], c[o + 7]],
+            ]
+        else:
+            bbox = [[coords[i], coords[i + 1]] for i in range(o, o + count * 2, 2)]
+        o += count * 2
+        # 코덱이 직접 인코딩한 값이므로 검증 없이 생성
+        # (model_construct는 기본값/private 속성 등 모델 정의를 그대로 따름)
+        boxes.append(
+            OCRTextBoxCreate.model_construct(
+                ocr_execution_id=box_id,
+                text=text,
+                confidence=confidence,
+                bbox=bbox,
+            )
+        )
+    return OCRExtractDTO.model_construct(error=packed["e"], text_boxes=boxes)
+
+
+_FORMATS: Dict[int, ContextFormat] = {
+    fmt.format_id: fmt for fmt in (JSONContextFormat(), MsgpackContextFormat())
+}
+
+
+def _compressors() -> Dict[int, Any]:
+    """사용 가능한 압축기 {ID: (compress, decompress)}"""
+    available: Dict[int, Any] = {}
+    if zstandard is not None:
+        # (De)Compressor 객체는 스레드 간 공유할 수 없으므로 호출마다 생성
+        available[COMPRESSION_ZSTD] = (
+            lambda body: zstandard.ZstdCompressor(level=3).compress(body),
+            lambda body: zstandard.ZstdDecompressor().decompress(body),
+        )
+    if lz4_frame is not None:
+        available[COMPRESSION_LZ4] = (lz4_frame.compress, lz4_frame.decompress)
+    return available
+
+
+_COMPRESSION_NAMES = {
+    "none": COMPRESSION_NONE,
+    "zstd": COMPRESSION_ZSTD,
+    "lz4": COMPRESSION_LZ4,
+}
+
+
+class PipelineContextCodec:
+    """버전 헤더가 붙은 PipelineContext 코덱"""
+
+    def __init__(
+        self,
+        format_name: Optional[str] = None,
+        compression: Optional[str] = None,
+        compress_min_bytes: Optional[int] = None,
+    ):
+        format_name = (format_name or settings.PIPELINE_CONTEXT_FORMAT).lower()
+        formats = {fmt.name: fmt for fmt in _FORMATS.values()}
+        if format_name not in formats:
+            raise ValueError(f"지원하지 않는 컨텍스트 포맷: {format_name}")
+        self.format = formats[format_name]
+
+        self._compressors = _compressors()
+        compression = (compression or settings.PIPELINE_CONTEXT_COMPRESSION).lower()
+        self.compression_id = _COMPRESSION_NAMES.get(compression, COMPRESSION_NONE)
+        if (
+            self.compression_id != COMPRESSION_NONE
+            and self.compression_id not in self._compressors
+        ):
+            logger.warning(
+                f"⚠️ 컨텍스트 압축 패키지 없음 ({compression}), 압축 없이 저장합니다"
+            )
+            self.compression_id = COMPRESSION_NONE
+
+        self.compress_min_bytes = (
+            compress_min_bytes
+            if compress_min_bytes is not None
+            else settings.PIPELINE_CONTEXT_COMPRESS_MIN_BYTES
+        )
+
+    def encode(self, context: PipelineContext) -> bytes:
+        """컨텍스트 → 헤더 + (압축된) 본문"""
+        body = self.format.dumps(context)
+        compression_id = COMPRESSION_NONE
+        if (
+            self.compression_id != COMPRESSION_NONE
+            and len(body) >= self.compress_min_bytes
+        ):
+            compress, _ = self._compressors[self.compression_id]
+            body = compress(body)
+            compression_id = self.compression_id
+
+        header = MAGIC + bytes([CODEC_VERSION, self.format.format_id, compression_id])
+        return header + body
+
+    def decode(self, data: bytes | str) -> PipelineContext:
+        """저장된 값 → 컨텍스트 (헤더 없는 이전 JSON 값도 지원)"""
+        if isinstance(data, str):
+            data = data.encode()
+
+        if not data.startswith(MAGIC):
+            return _FORMATS[FORMAT_JSON].loads(data)
+
+        version, format_id, compression_id = data[len(MAGIC) : HEADER_SIZE]
+        if version > CODEC_VERSION:
+            raise ValueError(f"지원하지 않는 컨텍스트 코덱 버전: {version}")
+
+        body = data[HEADER_SIZE:]
+        if compression_id != COMPRESSION_NONE:
+            if compression_id not in self._compressors:
+                raise ValueError(f"컨텍스트 압축 해제 불가 (압축 ID={compression_id})")
+            _, decompress = self._compressors[compression_id]
+            body = decompress(body)
+
+        if format_id not in _FORMATS:
+            raise ValueError(f"지원하지 않는 컨텍스트 포맷 ID: {format_id}")
+        return _FORMATS[format_id].loads(body)
+
+
+# 전역 싱글톤 인스턴스
+_context_codec: Optional[PipelineContextCodec] = None
+
+
+def get_pipeline_context_codec() -> PipelineContextCodec:
+    """PipelineContextCodec 싱글톤 인스턴스 반환"""
+    global _context_codec
+    if _context_codec is None:
+        _context_codec = PipelineContextCodec()
+    return _context_codec
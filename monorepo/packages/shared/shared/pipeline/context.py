@@ -62,8 +62,10 @@ class PipelineContext(BaseModel):
         layout_result: 레이아웃 분석 결과
         status: 현재 파이프라인 상태
         current_stage: 현재 실행 중인 스테이지
+        completed_stages: 완료된 스테이지 이름 목록 (체크포인트 재개용)
         error: 에러 메시지
         retry_count: 재시도 횟수
+        stage_timings: 스테이지 실행별 단계 소요 시간 기록
         created_at: 생성 시간
         updated_at: 마지막 업데이트 시간
     """
@@ -104,8 +106,15 @@ class PipelineContext(BaseModel):
     current_stage: Optional[str] = Field(
         default=None, description="현재 실행 중인 스테이지"
     )
+    completed_stages: list[str] = Field(
+        default_factory=list, description="완료된 스테이지 이름 목록"
+    )
     error: Optional[str] = Field(default=None, description="에러 메시지")
     retry_count: int = Field(default=0, description="재시도 횟수")
+    stage_timings: list[Dict[str, Any]] = Field(
+        default_factory=list,
+        description="스테이지별 소요 시간 (queue_wait_ms, phases_ms 등)",
+    )
 
     # 타임스탬프
     created_at: datetime = Field(
@@ -0,0 +1,186 @@
+"""파이프라인 스테이지 계측
+
+PipelineStage.run의 단계별(검증/실행/저장) 소요 시간과 Celery 큐 대기 시간을
+Prometheus 히스토그램으로 내보내고, 같은 값을 PipelineContext.stage_timings에
+기록하여 배치 하나의 임계 경로를 재구성할 수 있게 합니다.
+
+큐 대기 시간은 발행 시 메시지 헤더에 기록한 sent_at(before_task_publish)과
+task_prerun 시점의 차이입니다. (countdown/eta 재시도는 eta부터 계산)
+"""
+
+import os
+import socket
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional
+
+from prometheus_client import (
+    CollectorRegistry,
+    Histogram,
+    multiprocess,
+    start_http_server,
+)
+
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 메시지 헤더 키 (발행 시각, epoch 초)
+SENT_AT_HEADER = "sent_at"
+
+_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+)
+
+# === Prometheus 메트릭 ===
+STAGE_PHASE_SECONDS = Histogram(
+    "pipeline_stage_phase_seconds",
+    "스테이지 단계별 소요 시간 (phase=validate_input/execute/validate_output/...)",
+    ["stage", "phase", "outcome"],
+    buckets=_LATENCY_BUCKETS,
+)
+STAGE_SECONDS = Histogram(
+    "pipeline_stage_seconds",
+    "스테이지 전체 소요 시간",
+    ["stage", "outcome"],
+    buckets=_LATENCY_BUCKETS,
+)
+TASK_QUEUE_WAIT_SECONDS = Histogram(
+    "pipeline_task_queue_wait_seconds",
+    "Celery 태스크 발행부터 워커 실행 시작까지 대기 시간",
+    ["task"],
+    buckets=_LATENCY_BUCKETS,
+)
+ML_CLIENT_REQUEST_SECONDS = Histogram(
+    "ml_client_request_seconds",
+    "ML 서버 HTTP 요청 구간별 시간 (phase=connect/ttfb/total, connect는 새 연결만)",
+    ["endpoint", "phase"],
+    buckets=_LATENCY_BUCKETS,
+)
+
+# 현재 태스크의 큐 대기 시간 (task_prerun에서 설정, 첫 스테이지가 소비)
+_queue_wait: ContextVar[Optional[float]] = ContextVar(
+    "pipeline_queue_wait", default=None
+)
+
+
+def record_queue_wait(
+    task_name: str, sent_at: Any, eta: Any = None, now: Optional[float] = None
+) -> Optional[float]:
+    """큐 대기 시간 기록 (task_prerun에서 호출)
+
+    Args:
+        task_name: Celery 태스크 이름
+        sent_at: 발행 시각 헤더 값 (epoch 초)
+        eta: 태스크 eta (ISO 문자열 또는 datetime, 재시도 countdown 포함)
+        now: 현재 시각 (테스트용)
+
+    Returns:
+        대기 시간 (초), 발행 시각이 없으면 None
+    """
+    if sent_at is None:
+        _queue_wait.set(None)
+        return None
+
+    now = time.time() if now is None else now
+    ready_at = float(sent_at)
+    if eta:
+        if isinstance(eta, str):
+            eta = datetime.fromisoformat(eta)
+        ready_at = max(ready_at, eta.timestamp())
+
+    wait = max(0.0, now - ready_at)
+    TASK_QUEUE_WAIT_SECONDS.labels(task=task_name).observe(wait)
+    _queue_wait.set(wait)
+    return wait
+
+
+def consume_queue_wait() -> Optional[float]:
+    """현재 태스크의 큐 대기 시간을 한 번만 반환 (연속 실행 시 첫 스테이지에만)"""
+    wait = _queue_wait.get()
+    if wait is not None:
+        _queue_wait.set(None)
+    return wait
+
+
+class StageTimer:
+    """스테이지 1회 실행의 단계별 타이머
+
+    span()으로 측정한 구간은 Prometheus에 기록하고, to_record()로
+    PipelineContext.stage_timings에 저장할 dict를 만듭니다.
+    """
+
+    def __init__(self, stage_name: str):
+        self.stage_name = stage_name
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.queue_wait = consume_queue_wait()
+
+    @contextmanager
+    def span(self, phase: str) -> Iterator[None]:
+        """구간 측정 (예외 발생 시 outcome=failure로 기록 후 전파)"""
+        start = time.perf_counter()
+        outcome = "success"
+        try:
+            yield
+        except BaseException:
+            outcome = "failure"
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            self.phases[phase] = self.phases.get(phase, 0.0) + elapsed
+            STAGE_PHASE_SECONDS.labels(
+                stage=self.stage_name, phase=phase, outcome=outcome
+            ).observe(elapsed)
+
+    def finish(self, outcome: str) -> Dict[str, Any]:
+        """전체 소요 시간 기록 후 컨텍스트 저장용 dict 반환"""
+        elapsed = time.perf_counter() - self._start
+        STAGE_SECONDS.labels(stage=self.stage_name, outcome=outcome).observe(elapsed)
+        return {
+            "stage": self.stage_name,
+            "outcome": outcome,
+            "worker": f"{socket.gethostname()}:{os.getpid()}",
+            "started_at": self.started_at,
+            "queue_wait_ms": (
+                round(self.queue_wait * 1000, 3)
+                if self.queue_wait is not None
+                else None
+            ),
+            "total_ms": round(elapsed * 1000, 3),
+            "phases_ms": {
+                phase: round(seconds * 1000, 3)
+                for phase, seconds in self.phases.items()
+            },
+        }
+
+
+def start_metrics_server(port: int) -> None:
+    """Prometheus 메트릭 HTTP 서버 시작 (Celery 워커용)
+
+    PROMETHEUS_MULTIPROC_DIR가 설정되어 있으면 prefork 자식 프로세스들의
+    메트릭을 합쳐서 내보냅니다.
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        start_http_server(port, registry=registry)
+    else:
+        start_http_server(port)
+    logger.info(f"📈 Prometheus 메트릭 서버 시작: port={port}")
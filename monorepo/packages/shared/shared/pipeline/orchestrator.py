@@ -1,109 +1,132 @@
 """PipelineOrchestrator - 파이프라인 실행 조율
 
-파이프라인의 전체 실행 흐름을 관리하고 조율합니다.
-"""
-
-# import traceback
-# from typing import List, Optional
+여러 스테이지를 하나의 태스크, 하나의 이벤트 루프 안에서 순차 실행합니다.
+스테이지 사이마다 Celery 브로커를 거치지 않으므로 hop당 브로커 지연,
+직렬화, asyncio.run 비용이 없습니다.
 
-# import redis
+스테이지가 끝날 때마다 컨텍스트를 Redis에 체크포인트로 저장합니다.
+(claim-check와 같은 키, completed_stages에 완료 스테이지 기록)
+재시도 시 restore()로 체크포인트를 불러오면 완료된 스테이지는 건너뛰고
+실패한 스테이지부터 다시 실행합니다.
 
-# from shared.core.logging import get_logger
-# from shared.service.redis_service import get_redis_service
+다른 워커 풀에서 실행해야 하는 스테이지는 기존처럼 Celery chain으로 연결합니다.
+"""
 
-# from .context import PipelineContext
-# from .exceptions import PipelineError, StageError
-# from .stage import PipelineStage
+from typing import List, Optional
 
 from shared.core.logging import get_logger
+from shared.schemas.enums import ProcessStatus
 
-logger = get_logger(__name__)
-
-
-class PipelineOrchestrator:
-    pass
-
-
-#     """파이프라인 오케스트레이터
-
-#     여러 스테이지를 순차적으로 실행하고 결과를 관리합니다.
-
-#     Attributes:
-#         stages: 실행할 스테이지 리스트
-#         redis_service: Redis 클라이언트 (컨텍스트 저장용)
-#     """
-
-#     def __init__(self, stages: Optional[List[PipelineStage]] = None):
-#         self.stages = stages or []
-#         self.redis_service : redis.Redis = get_redis_service().get_redis_client()
-
-#     def add_stage(self, stage: PipelineStage) -> None:
-#         """스테이지 추가"""
-#         self.stages.append(stage)
-
-#     async def execute(self, context: PipelineContext) -> PipelineContext:
-#         """파이프라인 실행
+from .cache import PipelineCacheService, get_pipeline_cache_service
+from .context import PipelineContext
+from .exceptions import RetryableError
+from .stage import PipelineStage
 
-#         Args:
-#             context: 파이프라인 컨텍스트
-
-#         Returns:
-#             실행 완료된 컨텍스트
-
-#         Raises:
-#             PipelineError: 파이프라인 실행 중 오류 발생 시
-#         """
-#         logger.info(f"파이프라인 시작: {context.context_id}")
-
-#         try:
-#             for stage in self.stages:
-#                 logger.info(f"스테이지 실행: {stage.stage_name}")
-
-#                 # 입력 검증
-#                 if not stage.validate_input(context):
-#                     raise StageError(
-#                         stage_name=stage.stage_name,
-#                         message="입력 데이터 검증 실패"
-#                     )
-
-#                 # 스테이지 실행 전 처리
-#                 await stage.pre_execute(context)
-
-#                 # 스테이지 실행
-#                 result = await stage.execute(context)
-
-#                 # 결과 저장
-#                 context.set_stage_data(stage.stage_name, result)
-
-#                 # 스테이지 실행 후 처리
-#                 await stage.post_execute(context, result)
-
-#                 # Redis에 컨텍스트 저장
-#                 await self._save_context(context)
-
-#                 logger.info(f"스테이지 완료: {stage.stage_name}")
-
-#             logger.info(f"파이프라인 완료: {context.context_id}")
-#             return context
+logger = get_logger(__name__)
 
-#         except StageError as e:
-#             logger.error(f"스테이지 에러: {e.stage_name} - {e.message}")
-#             context.set_error(e.stage_name, e.message, traceback.format_exc())
-#             await self._save_context(context)
-#             raise PipelineError(f"파이프라인 실행 실패: {e.message}") from e
+# 재시도 대상 오류 (Celery autoretry_for와 동일하게 사용)
+RETRYABLE_EXCEPTIONS = (ConnectionError, TimeoutError, RetryableError)
 
-#         except Exception as e:
-#             logger.error(f"파이프라인 에러: {str(e)}")
-#             context.set_error("orchestrator", str(e), traceback.format_exc())
-#             await self._save_context(context)
-#             raise PipelineError(f"파이프라인 실행 실패: {str(e)}") from e
 
-#     async def _save_context(self, context: PipelineContext) -> None:
-#         """컨텍스트를 Redis에 저장"""
-#         try:
-#             await self.redis_service.set(
-#                 name=f"pipeline:{context.context_id}",
-#                 value=context.model_dump_json(),
-#             )
-#         except Exception as e:
-#             logger.error(f"컨텍스트 저장 실패: {str(e)}")
+class PipelineOrchestrator:
+    """파이프라인 오케스트레이터
+
+    여러 스테이지를 순차적으로 실행하고 스테이지마다 체크포인트를 저장합니다.
+
+    Attributes:
+        stages: 실행할 스테이지 리스트
+        cache_service: 체크포인트 저장용 컨텍스트 캐시
+        checkpoint: 스테이지 완료 시 Redis 저장 여부
+    """
+
+    def __init__(
+        self,
+        stages: Optional[List[PipelineStage]] = None,
+        cache_service: Optional[PipelineCacheService] = None,
+        checkpoint: bool = True,
+    ):
+        self.stages = stages or []
+        self.cache_service = cache_service or get_pipeline_cache_service()
+        self.checkpoint = checkpoint
+
+    def add_stage(self, stage: PipelineStage) -> None:
+        """스테이지 추가"""
+        self.stages.append(stage)
+
+    def restore(self, payload: dict) -> PipelineContext:
+        """태스크 payload에서 컨텍스트 복원 (체크포인트 우선)
+
+        재시도된 태스크의 payload가 전체 컨텍스트 dict여도 Redis에
+        체크포인트가 있으면 그것을 사용하여 완료된 스테이지를 건너뜁니다.
+
+        Args:
+            payload: to_task_payload의 반환값
+
+        Returns:
+            파이프라인 컨텍스트
+        """
+        batch_id = payload.get("batch_id", "")
+        chain_id = str(payload.get("chain_execution_id"))
+        try:
+            return self.cache_service.load_context(batch_id, chain_id)
+        except ValueError:
+            return self.cache_service.from_task_payload(payload)
+
+    async def execute(self, context: PipelineContext) -> PipelineContext:
+        """파이프라인 실행
+
+        Args:
+            context: 파이프라인 컨텍스트 (체크포인트에서 복원된 경우 포함)
+
+        Returns:
+            실행 완료된 컨텍스트
+
+        Raises:
+            Exception: 스테이지 실행 중 오류 (Celery 재시도 판단을 위해 그대로 전달)
+        """
+        chain_id = context.chain_execution_id
+        logger.info(
+            f"🚀 파이프라인 시작: chain_id={chain_id}, "
+            f"stages={[stage.stage_name for stage in self.stages]}"
+        )
+
+        for stage in self.stages:
+            if stage.stage_name in context.completed_stages:
+                logger.info(f"⏭️ 완료된 스테이지 건너뜀: {stage.stage_name}")
+                continue
+
+            try:
+                context = await stage.run(context)
+            except RETRYABLE_EXCEPTIONS:
+                # 마지막 체크포인트를 유지해야 재시도 시 이 스테이지부터 재개
+                logger.warning(
+                    f"⚠️ 스테이지 재시도 대상 오류: {stage.stage_name} "
+                    f"(chain_id={chain_id})"
+                )
+                raise
+            except Exception as e:
+                logger.error(
+                    f"❌ 스테이지 실패: {stage.stage_name} (chain_id={chain_id}): {e}"
+                )
+                context.status = ProcessStatus.FAILURE
+                self._save_checkpoint(context)
+                raise
+
+            context.completed_stages.append(stage.stage_name)
+            self._save_checkpoint(context)
+            logger.info(f"✅ 스테이지 완료: {stage.stage_name} (chain_id={chain_id})")
+
+        context.update_status(ProcessStatus.SUCCESS)
+        self._save_checkpoint(context)
+        logger.info(f"✅ 파이프라인 완료: chain_id={chain_id}")
+        return context
+
+    def _save_checkpoint(self, context: PipelineContext) -> None:
+        """컨텍스트를 Redis에 체크포인트로 저장"""
+        if not self.checkpoint:
+            return
+        try:
+            self.cache_service.save_context(context)
+        except Exception as e:
+            # 체크포인트 실패는 재개 지점만 잃을 뿐 실행 결과에는 영향 없음
+            logger.error(f"❌ 체크포인트 저장 실패: {e}")
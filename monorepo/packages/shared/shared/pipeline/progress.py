@@ -0,0 +1,342 @@
+"""배치 진행 이벤트 (Redis Streams)
+
+워커는 청크 시작/완료, 처리 이미지 수, 오류 같은 작은 진행 이벤트를
+배치별 스트림(pipeline:batch:{batch_id}:events)에 XADD로 발행합니다.
+
+API 서버는 BatchEventHub로 배치당 스트림 리더 하나만 두고 여러 SSE/WebSocket
+구독자에게 팬아웃합니다. 스트림 엔트리 ID를 SSE 이벤트 ID로 사용하므로
+재연결한 클라이언트는 Last-Event-ID 이후 이벤트부터 이어서 받습니다.
+"""
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+
+import redis
+import redis.asyncio as aioredis
+
+from ..config import settings
+from ..core.logging import get_logger
+from ..models.batch_execution import BatchExecution
+from ..service.redis_service import get_redis_service
+
+logger = get_logger(__name__)
+
+# 이벤트 종류
+EVENT_BATCH_STARTED = "batch_started"
+EVENT_CHUNK_STARTED = "chunk_started"
+EVENT_CHUNK_COMPLETED = "chunk_completed"
+EVENT_CHUNK_FAILED = "chunk_failed"
+EVENT_STAGE_COMPLETED = "stage_completed"
+EVENT_BATCH_COMPLETED = "batch_completed"
+EVENT_BATCH_FAILED = "batch_failed"
+
+# 이 이벤트 이후로는 더 발행되지 않음 (구독 종료)
+TERMINAL_EVENTS = frozenset({EVENT_BATCH_COMPLETED, EVENT_BATCH_FAILED})
+
+# XREAD BLOCK 시간 (REDIS_SOCKET_TIMEOUT보다 짧아야 함)
+_READ_BLOCK_MS = 2000
+# 구독자 큐가 가득 차면 해당 구독을 끊고 Last-Event-ID 재연결로 따라잡게 함
+_SUBSCRIBER_QUEUE_SIZE = 1000
+
+
+def events_key(batch_id: str) -> str:
+    """배치 진행 이벤트 스트림 키"""
+    return f"pipeline:batch:{batch_id}:events"
+
+
+def _parse_id(event_id: str) -> Tuple[int, int]:
+    """스트림 엔트리 ID("ms-seq")를 비교 가능한 튜플로 변환"""
+    ms, _, seq = event_id.partition("-")
+    return int(ms), int(seq or 0)
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """스트림에서 읽은 진행 이벤트"""
+
+    id: str
+    event: str
+    data: str  # JSON 문자열
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.event in TERMINAL_EVENTS
+
+    def to_sse(self) -> str:
+        """SSE 프레임 (id/event/data)"""
+        return f"id: {self.id}\nevent: {self.event}\ndata: {self.data}\n\n"
+
+    def to_dict(self) -> dict:
+        return {"id": self.id, "event": self.event, "data": json.loads(self.data)}
+
+
+class ProgressPublisher:
+    """진행 이벤트 발행기 (Celery 워커, 동기)
+
+    발행 실패는 로그만 남기고 파이프라인 처리를 막지 않습니다.
+    """
+
+    def __init__(self, redis_client: Optional[redis.Redis] = None):
+        """
+        Args:
+            redis_client: 문자열 Redis 클라이언트 (None일 경우 공유 풀 클라이언트)
+        """
+        self.redis_client = redis_client or get_redis_service().get_redis_client()
+
+    def publish(self, batch_id: Optional[str], event: str, **data) -> Optional[str]:
+        """진행 이벤트 발행
+
+        Args:
+            batch_id: 배치 ID (없으면 발행하지 않음)
+            event: 이벤트 종류 (EVENT_*)
+            **data: 이벤트 데이터 (JSON 직렬화 가능한 값)
+
+        Returns:
+            스트림 엔트리 ID (발행하지 않았거나 실패하면 None)
+        """
+        if not batch_id or not settings.PIPELINE_EVENTS_ENABLED:
+            return None
+
+        payload = json.dumps(
+            {"ts": round(time.time(), 3), **data},
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=str,
+        )
+        key = events_key(batch_id)
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.xadd(
+                key,
+                {"event": event, "data": payload},
+                maxlen=settings.PIPELINE_EVENTS_MAXLEN,
+                approximate=True,
+            )
+            pipe.expire(key, settings.PIPELINE_EVENTS_TTL)
+            event_id, _ = pipe.execute()
+            return event_id
+        except Exception as e:
+            logger.warning(
+                f"⚠️ 진행 이벤트 발행 실패 ({event}, batch_id={batch_id}): {e}"
+            )
+            return None
+
+    def publish_counters(
+        self, batch_id: Optional[str], event: str, counters, **data
+    ) -> None:
+        """카운터 갱신 결과와 함께 진행 이벤트 발행
+
+        갱신으로 배치가 완료되었으면 종료 이벤트(batch_completed/failed)도
+        이어서 발행합니다.
+
+        Args:
+            batch_id: 배치 ID
+            event: 이벤트 종류 (EVENT_CHUNK_COMPLETED 등)
+            counters: increment_counters가 반환한 Row (None이면 카운터 생략)
+            **data: 추가 이벤트 데이터
+        """
+        if counters is None:
+            self.publish(batch_id, event, **data)
+            return
+
+        totals = {
+            "total_images": counters.total_images,
+            "completed_images": counters.completed_images,
+            "failed_images": counters.failed_images,
+        }
+        self.publish(batch_id, event, **data, **totals)
+
+        success = BatchExecution.resolve_completion(
+            counters.total_images, counters.completed_images, counters.failed_images
+        )
+        if success is not None:
+            self.publish(
+                batch_id,
+                EVENT_BATCH_COMPLETED if success else EVENT_BATCH_FAILED,
+                **totals,
+            )
+
+
+def _to_events(entries: list) -> List[ProgressEvent]:
+    return [
+        ProgressEvent(id=entry_id, event=fields["event"], data=fields["data"])
+        for entry_id, fields in entries
+    ]
+
+
+class _BatchReader:
+    """배치 하나의 스트림 리더와 구독자 큐"""
+
+    def __init__(self):
+        self.queues: Set[asyncio.Queue] = set()
+        self.task: Optional[asyncio.Task] = None
+
+
+class BatchEventHub:
+    """배치별 진행 이벤트 팬아웃 허브 (API 서버, asyncio)
+
+    구독자 수와 관계없이 배치당 XREAD 연결은 하나만 사용합니다.
+    XREAD BLOCK은 연결을 오래 점유하므로 공유 풀이 아닌 리더 전용 연결을 씁니다.
+    """
+
+    def __init__(self, redis_client: Optional[aioredis.Redis] = None):
+        """
+        Args:
+            redis_client: 문자열 asyncio Redis 클라이언트 (None일 경우
+                현재 이벤트 루프의 공유 풀 클라이언트를 호출 시점에 사용)
+        """
+        self._redis_client = redis_client
+        self._readers: Dict[str, _BatchReader] = {}
+
+    @property
+    def redis_client(self) -> aioredis.Redis:
+        if self._redis_client is not None:
+            return self._redis_client
+        return get_redis_service().get_async_redis_client(decode_responses=True)
+
+    async def _range_after(self, batch_id: str, cursor: str) -> List[ProgressEvent]:
+        """cursor 이후의 저장된 이벤트 조회 (cursor 자체는 제외)"""
+        entries = await self.redis_client.xrange(events_key(batch_id), min=cursor)
+        return [event for event in _to_events(entries) if event.id != cursor]
+
+    async def subscribe(
+        self,
+        batch_id: str,
+        last_event_id: Optional[str] = None,
+        heartbeat: float = 15.0,
+    ) -> AsyncIterator[Optional[ProgressEvent]]:
+        """배치 진행 이벤트 구독
+
+        last_event_id 이후 저장된 이벤트를 먼저 재생한 뒤 실시간 이벤트를
+        이어서 전달합니다. 종료 이벤트(batch_completed/failed)를 전달하면
+        구독이 끝납니다.
+
+        Args:
+            batch_id: 배치 ID
+            last_event_id: 마지막으로 받은 이벤트 ID (없으면 처음부터)
+            heartbeat: 이벤트가 없을 때 None을 내보내는 간격 (초, 연결 유지용)
+
+        Yields:
+            진행 이벤트, 또는 heartbeat 간격 동안 이벤트가 없으면 None
+        """
+        cursor = "0-0"
+        if last_event_id:
+            try:
+                _parse_id(last_event_id)
+                cursor = last_event_id
+            except ValueError:
+                logger.warning(f"⚠️ 잘못된 Last-Event-ID 무시: {last_event_id}")
+
+        # 1. 저장된 이벤트 재생
+        for event in await self._range_after(batch_id, cursor):
+            cursor = event.id
+            yield event
+            if event.is_terminal:
+                return
+
+        # 2. 실시간 구독 등록 후, 재생과 등록 사이에 들어온 이벤트 보충
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_SUBSCRIBER_QUEUE_SIZE)
+        reader = self._readers.setdefault(batch_id, _BatchReader())
+        reader.queues.add(queue)
+        try:
+            for event in await self._range_after(batch_id, cursor):
+                cursor = event.id
+                yield event
+                if event.is_terminal:
+                    return
+
+            if reader.task is None or reader.task.done():
+                reader.task = asyncio.create_task(
+                    self._read_loop(batch_id, reader, cursor)
+                )
+
+            # 3. 리더가 전달하는 이벤트 (보충분과 중복되는 ID는 건너뜀)
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+
+                if event is None:  # 큐가 넘쳐 구독이 끊김
+                    logger.warning(f"⚠️ 진행 이벤트 구독자 지연으로 종료: {batch_id}")
+                    return
+                if _parse_id(event.id) <= _parse_id(cursor):
+                    continue
+
+                cursor = event.id
+                yield event
+                if event.is_terminal:
+                    return
+        finally:
+            reader.queues.discard(queue)
+            if not reader.queues:
+                if reader.task is not None:
+                    reader.task.cancel()
+                if self._readers.get(batch_id) is reader:
+                    del self._readers[batch_id]
+
+    async def _read_loop(self, batch_id: str, reader: _BatchReader, cursor: str):
+        """스트림을 읽어 모든 구독자 큐에 전달 (구독자가 없어지면 취소됨)"""
+        key = events_key(batch_id)
+        if self._redis_client is not None:
+            client, dedicated = self._redis_client, False
+        else:
+            client = get_redis_service().get_dedicated_async_redis_client(
+                decode_responses=True
+            )
+            dedicated = True
+
+        try:
+            while reader.queues:
+                try:
+                    response = await client.xread(
+                        {key: cursor}, block=_READ_BLOCK_MS, count=100
+                    )
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning(f"⚠️ 진행 이벤트 스트림 읽기 실패 ({batch_id}): {e}")
+                    await asyncio.sleep(1.0)
+                    continue
+
+                for _, entries in response or []:
+                    for event in _to_events(entries):
+                        cursor = event.id
+                        for queue in list(reader.queues):
+                            try:
+                                queue.put_nowait(event)
+                            except asyncio.QueueFull:
+                                # 느린 구독자는 끊고 재연결 시 Last-Event-ID로 복구
+                                reader.queues.discard(queue)
+                                queue.get_nowait()
+                                queue.put_nowait(None)
+                        if event.is_terminal:
+                            return
+        finally:
+            if dedicated:
+                await client.aclose()
+
+
+# 전역 싱글톤 인스턴스
+_progress_publisher: Optional[ProgressPublisher] = None
+_batch_event_hub: Optional[BatchEventHub] = None
+
+
+def get_progress_publisher() -> ProgressPublisher:
+    """ProgressPublisher 싱글톤 인스턴스 반환"""
+    global _progress_publisher
+    if _progress_publisher is None:
+        _progress_publisher = ProgressPublisher()
+    return _progress_publisher
+
+
+def get_batch_event_hub() -> BatchEventHub:
+    """BatchEventHub 싱글톤 인스턴스 반환"""
+    global _batch_event_hub
+    if _batch_event_hub is None:
+        _batch_event_hub = BatchEventHub()
+    return _batch_event_hub
@@ -3,7 +3,11 @@
 각 스테이지(OCR, LLM, Layout, Excel)의 기본 구조를 정의합니다.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from contextvars import ContextVar
+from typing import ContextManager, Optional
 
 from celery.beat import get_logger
 
@@ -12,9 +16,16 @@ from shared.models.task_log import TaskLog
 from shared.repository.crud.sync_crud.task_log import task_log_crud
 
 from .context import PipelineContext
+from .metrics import StageTimer
+from .progress import EVENT_STAGE_COMPLETED, get_progress_publisher
 
 logger = get_logger(__name__)
 
+# 실행 중인 run()의 타이머 (스테이지 인스턴스를 여러 태스크가 공유해도 분리됨)
+_current_timer: ContextVar[Optional[StageTimer]] = ContextVar(
+    "pipeline_stage_timer", default=None
+)
+
 
 class PipelineStage(ABC):
     """파이프라인 스테이지 추상 기본 클래스
@@ -28,6 +39,17 @@ class PipelineStage(ABC):
     def __init__(self):
         self.stage_name = self.__class__.__name__
 
+    def span(self, phase: str) -> ContextManager[None]:
+        """run() 실행 중 세부 구간 측정 (예: save_db 안의 Redis 저장)
+
+        Args:
+            phase: 구간 이름 (Prometheus phase 레이블, stage_timings 키)
+        """
+        timer = _current_timer.get()
+        if timer is None:
+            return nullcontext()
+        return timer.span(phase)
+
     @abstractmethod
     async def execute(self, context: PipelineContext) -> PipelineContext:
         """실제 처리 로직 (서브클래스에서 구현 필수)
@@ -104,7 +126,11 @@ class PipelineStage(ABC):
         1. 입력 검증
         2. 실행
         3. 출력 검증
-        4. 상태 업데이트
+        4. DB 저장
+        5. 상태 업데이트
+
+        각 단계 소요 시간은 Prometheus 히스토그램과 context.stage_timings에
+        기록됩니다.
 
         Args:
             context: 파이프라인 컨텍스트
@@ -115,23 +141,31 @@ class PipelineStage(ABC):
         Raises:
             Exception: 실행 중 오류 발생 시
         """
+        timer = StageTimer(self.stage_name)
+        timer_token = _current_timer.set(timer)
+        outcome = "failure"
         try:
             # 1. 입력 검증
-            self.validate_input(context)
+            with timer.span("validate_input"):
+                self.validate_input(context)
 
             # 2. 실행
             context.update_status(
                 status=f"{self.stage_name.lower()}_in_progress", stage=self.stage_name
             )
-            context = await self.execute(context)
+            with timer.span("execute"):
+                context = await self.execute(context)
             logger.info(f"{self.stage_name.lower()}_in_progress 실행")
             # 3. 출력 검증
-            self.validate_output(context)
+            with timer.span("validate_output"):
+                self.validate_output(context)
 
             logger.info(f"{self.stage_name.lower()}_in_progress 검증 성공")
 
             # 4. DB 저장
-            self.save_db(context)
+            with timer.span("save_db"):
+                # 동기 DB/Redis I/O는 스레드에서 실행 (공유 이벤트 루프를 막지 않음)
+                await asyncio.to_thread(self.save_db, context)
 
             # 5. 상태 업데이트
             context.update_status(
@@ -139,7 +173,7 @@ class PipelineStage(ABC):
             )
 
             logger.info(f"{self.stage_name.lower()}_in_progress 상태 업데이트")
-            return context
+            outcome = "success"
 
         except Exception as e:
             # 에러 처리
@@ -147,3 +181,19 @@ class PipelineStage(ABC):
             context.status = "failed"
             context.current_stage = self.stage_name
             raise
+
+        finally:
+            # 단계별 소요 시간을 컨텍스트에 기록 (배치 임계 경로 재구성용)
+            timing = timer.finish(outcome)
+            context.stage_timings.append(timing)
+            _current_timer.reset(timer_token)
+
+        get_progress_publisher().publish(
+            context.batch_id,
+            EVENT_STAGE_COMPLETED,
+            chain_execution_id=context.chain_execution_id,
+            stage=self.stage_name,
+            images=len(context.private_imgs or []),
+            total_ms=timing["total_ms"],
+        )
+        return context
@@ -3,10 +3,11 @@
 기본 CRUD 연산 클래스
 """
 
-from typing import Any, Dict, Generic, Optional, Type, TypeVar, Union
+from typing import Any, Dict, Generic, List, Optional, Sequence, Type, TypeVar, Union
 
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
+from sqlalchemy import Row, insert
 from sqlalchemy.orm import Session
 
 from shared.models.base import Base
@@ -15,6 +16,9 @@ ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
+# 다중 행 INSERT 한 문장에 담는 최대 행 수 (바인드 파라미터 수 제한 대비)
+BULK_INSERT_PAGE_SIZE = 500
+
 
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """기본 CRUD 연산 클래스"""
@@ -43,6 +47,47 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db.refresh(db_obj)
         return db_obj
 
+    def bulk_create(
+        self,
+        db: Session,
+        *,
+        objs_in: Sequence[Union[CreateSchemaType, Dict[str, Any]]],
+        returning: Sequence[str] = (),
+    ) -> List[Row]:
+        """여러 객체를 다중 행 INSERT로 생성
+
+        행마다 commit/refresh하지 않으며, 트랜잭션(commit/rollback)은 호출자가 관리
+
+        Args:
+            objs_in: 생성할 객체 스키마 또는 dict 목록
+            returning: RETURNING으로 돌려받을 컬럼명 (없으면 반환값 없음)
+
+        Returns:
+            returning 컬럼 값 Row 목록 (행 순서는 보장되지 않음)
+        """
+        rows = [
+            obj if isinstance(obj, dict) else obj.model_dump(by_alias=False)
+            for obj in objs_in
+        ]
+        if not rows:
+            return []
+
+        if not returning:
+            # executemany → 드라이버의 다중 행 VALUES 배치로 실행
+            db.execute(insert(self.model), rows)
+            return []
+
+        columns = [getattr(self.model, name) for name in returning]
+        results: List[Row] = []
+        for start in range(0, len(rows), BULK_INSERT_PAGE_SIZE):
+            stmt = (
+                insert(self.model)
+                .values(rows[start : start + BULK_INSERT_PAGE_SIZE])
+                .returning(*columns)
+            )
+            results.extend(db.execute(stmt).all())
+        return results
+
     def update(
         self,
         db: Session,
@@ -3,9 +3,10 @@
 from datetime import datetime
 from typing import List, Optional
 
+from sqlalchemy import Row, func, update
 from sqlalchemy.orm import Session
 
-from shared.models.batch_execution import BatchExecution
+from shared.models.batch_execution import FAILURE_MESSAGE, BatchExecution
 from shared.schemas.batch_execution import (
     BatchExecutionCreate,
     BatchExecutionResponse,
@@ -77,13 +78,91 @@ class CRUDBatchExecution(
         db.refresh(batch_exec)
         return batch_exec
 
+    def increment_counters(
+        self,
+        db: Session,
+        *,
+        batch_id: str,
+        completed_images: int = 0,
+        failed_images: int = 0,
+        completed_chunks: int = 0,
+        failed_chunks: int = 0,
+    ) -> Optional[Row]:
+        """진행 카운터를 단일 UPDATE ... RETURNING으로 원자적으로 증가
+
+        ORM 객체를 읽어 파이썬에서 더하지 않으므로 동시에 실행되는 청크 태스크 간
+        증분 유실이 없습니다. 반환된 카운터 값으로 완료 여부를 판단하고,
+        완료 상태 전환도 조건부 UPDATE로 한 번만 적용됩니다.
+
+        Returns:
+            갱신 후 (total_images, completed_images, failed_images, status) Row
+            (배치가 없으면 None)
+        """
+        stmt = (
+            update(BatchExecution)
+            .where(BatchExecution.batch_id == batch_id)
+            .values(
+                completed_images=BatchExecution.completed_images + completed_images,
+                failed_images=BatchExecution.failed_images + failed_images,
+                completed_chunks=BatchExecution.completed_chunks + completed_chunks,
+                failed_chunks=BatchExecution.failed_chunks + failed_chunks,
+                updated_at=datetime.now(),
+            )
+            .returning(
+                BatchExecution.total_images,
+                BatchExecution.completed_images,
+                BatchExecution.failed_images,
+                BatchExecution.status,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        counters = db.execute(stmt).first()
+        if counters is None:
+            db.commit()
+            return None
+
+        success = BatchExecution.resolve_completion(
+            counters.total_images, counters.completed_images, counters.failed_images
+        )
+        if success is not None:
+            self._complete_once(db, batch_id=batch_id, success=success)
+
+        db.commit()
+        return counters
+
+    def _complete_once(self, db: Session, *, batch_id: str, success: bool) -> None:
+        """아직 완료되지 않은 배치만 완료 상태로 전환 (동시 호출 시 한 번만 적용)"""
+        values = {
+            "status": (
+                ProcessStatus.SUCCESS if success else ProcessStatus.FAILURE
+            ).value,
+            "finished_at": datetime.now(),
+        }
+        if not success:
+            # 기존 오류 메시지가 없을 때만 기록
+            values["error_message"] = func.coalesce(
+                BatchExecution.error_message, FAILURE_MESSAGE
+            )
+
+        db.execute(
+            update(BatchExecution)
+            .where(
+                BatchExecution.batch_id == batch_id,
+                BatchExecution.status.notin_(
+                    [ProcessStatus.SUCCESS.value, ProcessStatus.FAILURE.value]
+                ),
+            )
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+
     def increment_completed_images(
         self, db: Session, *, batch_execution: BatchExecution, count: int = 1
     ) -> BatchExecution:
         """완료된 이미지 수 증가"""
-        batch_execution.increment_completed_images(count)
-        db.add(batch_execution)
-        db.commit()
+        self.increment_counters(
+            db, batch_id=batch_execution.batch_id, completed_images=count
+        )
         db.refresh(batch_execution)
         return batch_execution
 
@@ -91,9 +170,9 @@ class CRUDBatchExecution(
         self, db: Session, *, batch_execution: BatchExecution, count: int = 1
     ) -> BatchExecution:
         """실패한 이미지 수 증가"""
-        batch_execution.increment_failed_images(count)
-        db.add(batch_execution)
-        db.commit()
+        self.increment_counters(
+            db, batch_id=batch_execution.batch_id, failed_images=count
+        )
         db.refresh(batch_execution)
         return batch_execution
 
@@ -101,9 +180,9 @@ class CRUDBatchExecution(
         self, db: Session, *, batch_execution: BatchExecution
     ) -> BatchExecution:
         """완료된 청크 수 증가"""
-        batch_execution.increment_completed_chunks()
-        db.add(batch_execution)
-        db.commit()
+        self.increment_counters(
+            db, batch_id=batch_execution.batch_id, completed_chunks=1
+        )
         db.refresh(batch_execution)
         return batch_execution
 
@@ -111,9 +190,7 @@ class CRUDBatchExecution(
         self, db: Session, *, batch_execution: BatchExecution
     ) -> BatchExecution:
         """실패한 청크 수 증가"""
-        batch_execution.increment_failed_chunks()
-        db.add(batch_execution)
-        db.commit()
+        self.increment_counters(db, batch_id=batch_execution.batch_id, failed_chunks=1)
         db.refresh(batch_execution)
         return batch_execution
 
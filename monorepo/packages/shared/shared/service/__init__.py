@@ -6,12 +6,15 @@ Shared Package
 # Core exports
 from .base_service import BaseService
 from .common_service import CommonService, get_common_service
-from .redis_service import RedisService, get_redis_service
+from .rate_limiter import RedisTokenBucket
+from .redis_service import RedisService, close_redis_pools, get_redis_service
 
 __all__ = [
     "BaseService",
     "RedisService",
     "get_redis_service",
+    "close_redis_pools",
+    "RedisTokenBucket",
     "CommonService",
     "get_common_service",
 ]
@@ -2,15 +2,21 @@
 """공통 서비스 - 파일 저장 및 DB 저장 로직"""
 
 import asyncio
-from typing import List
-
-import fitz
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Tuple
 
+from shared.config import settings
 from shared.core.logging import get_logger
 from shared.schemas.common import ImageResponse
 from shared.service.base_service import BaseService
 from shared.utils.file_utils import get_default_storage
 from shared.utils.path_builder import StoragePathBuilder
+from shared.utils.pdf_renderer import (
+    IMAGE_FORMATS,
+    count_pages,
+    get_render_executor,
+    pdf_temp_file,
+    render_page,
+)
 
 logger = get_logger(__name__)
 
@@ -28,7 +34,32 @@ class CommonService(BaseService):
             original_filename: 원본 파일명
 
         Returns:
-            List[ImageResponse]: 변환된 이미지 정보 목록
+            List[ImageResponse]: 변환된 이미지 정보 목록 (페이지 순서)
+        """
+        # 페이지는 완료 순서로 도착하므로 페이지 순서로 정렬
+        pages = [
+            page async for page in self.stream_pdf_pages(pdf_url, original_filename)
+        ]
+        pages.sort(key=lambda page: page[0])
+
+        logger.info(f"🎉 PDF 변환 완료: 총 {len(pages)}개 이미지 생성")
+        return [image_response for _, image_response in pages]
+
+    async def stream_pdf_pages(
+        self,
+        pdf_url: str,
+        original_filename: str,
+        on_page_count: Optional[Callable[[int], Awaitable[None]]] = None,
+    ) -> AsyncIterator[Tuple[int, ImageResponse]]:
+        """PDF를 다운로드하고, 업로드가 끝난 페이지부터 순차적으로 반환
+
+        Args:
+            pdf_url: 다운로드할 PDF의 URL (경로)
+            original_filename: 원본 파일명
+            on_page_count: 렌더링 시작 전 전체 페이지 수를 전달받는 콜백
+
+        Yields:
+            (페이지 번호(1부터), ImageResponse) - 업로드 완료 순서
         """
         logger.info(f"📥 PDF 다운로드 시작: {pdf_url}")
         storage = get_default_storage()
@@ -41,55 +72,102 @@ class CommonService(BaseService):
         folder = StoragePathBuilder.extract_folder_from_path(pdf_url)
         logger.info(f"📁 이미지 저장 폴더: {folder}")
 
-        # 3. PDF 페이지별 이미지 변환 (동기 작업)
-        page_data_list = []
-        with fitz.open(stream=pdf_file_bytes, filetype="pdf") as doc:
-            total_pages = len(doc)
-            logger.info(f"📄 총 {total_pages}페이지 변환 시작")
-
-            for page_num in range(total_pages):
-                page = doc.load_page(page_num)
-
-                # 페이지를 PNG 이미지로 렌더링
-                pix = page.get_pixmap()
-                img_bytes = pix.tobytes("png")
-
-                # 이미지 경로 생성 (PathBuilder 사용)
-                image_path = StoragePathBuilder.build_image_path(
-                    folder=folder, filename=original_filename, page_num=page_num + 1
-                )
-
-                page_data_list.append(
-                    {
-                        "img_bytes": img_bytes,
-                        "image_path": image_path,
-                        "page_num": page_num + 1,
-                    }
-                )
-
-        # 4. 병렬 업로드
-        logger.info(f"🚀 {total_pages}개 페이지 병렬 업로드 시작")
-
-        async def upload_page(page_data):
-            """단일 페이지 업로드"""
-            image_response = await storage.upload(
-                file_data=page_data["img_bytes"],
-                path=page_data["image_path"],
-                content_type="image/png",
-            )
-            logger.info(
-                f"✅ '{original_filename}' {page_data['page_num']}/{total_pages} "
-                f"페이지 저장 완료: {page_data['image_path']}"
-            )
-            return image_response
+        # 3. 페이지 렌더링 + 업로드
+        async for page in self.split_pdf_pages(
+            pdf_file_bytes, folder, original_filename, on_page_count=on_page_count
+        ):
+            yield page
+
+    async def split_pdf_pages(
+        self,
+        pdf_file_bytes: bytes,
+        folder: str,
+        original_filename: str,
+        dpi: Optional[int] = None,
+        image_format: Optional[str] = None,
+        on_page_count: Optional[Callable[[int], Awaitable[None]]] = None,
+    ) -> AsyncIterator[Tuple[int, ImageResponse]]:
+        """PDF 페이지를 프로세스 풀에서 렌더링하고, 렌더링된 페이지부터 바로 업로드
+
+        렌더링되었지만 아직 업로드되지 않은 페이지 수를 PDF_RENDER_WINDOW로
+        제한하여, 문서 전체가 아닌 페이지 몇 장 분량만 메모리에 올라갑니다.
 
-        # asyncio.gather로 병렬 업로드 실행
-        image_responses = await asyncio.gather(
-            *[upload_page(page_data) for page_data in page_data_list]
-        )
+        Args:
+            pdf_file_bytes: PDF 바이트
+            folder: 이미지 저장 폴더
+            original_filename: 원본 파일명
+            dpi: 렌더링 해상도 (기본: settings.PDF_RENDER_DPI)
+            image_format: 이미지 포맷 png/jpg (기본: settings.PDF_RENDER_FORMAT)
+            on_page_count: 렌더링 시작 전 전체 페이지 수를 전달받는 콜백
 
-        logger.info(f"🎉 PDF 변환 완료: 총 {total_pages}개 이미지 병렬 생성")
-        return list(image_responses)
+        Yields:
+            (페이지 번호(1부터), ImageResponse) - 업로드 완료 순서
+        """
+        storage = get_default_storage()
+        dpi = dpi or settings.PDF_RENDER_DPI
+        image_format = (image_format or settings.PDF_RENDER_FORMAT).lower()
+        extension, content_type = IMAGE_FORMATS[image_format]
+        executor = get_render_executor()
+        loop = asyncio.get_running_loop()
+
+        with pdf_temp_file(pdf_file_bytes) as pdf_path:
+            total_pages = await loop.run_in_executor(None, count_pages, pdf_path)
+            logger.info(
+                f"📄 총 {total_pages}페이지 변환 시작 "
+                f"(dpi={dpi}, format={image_format})"
+            )
+            if on_page_count is not None:
+                await on_page_count(total_pages)
+
+            window = asyncio.Semaphore(max(1, settings.PDF_RENDER_WINDOW))
+            done: asyncio.Queue = asyncio.Queue()
+
+            async def process_page(page_index: int) -> None:
+                """단일 페이지 렌더링 → 업로드 (완료 후 window 반환)"""
+                try:
+                    img_bytes = await loop.run_in_executor(
+                        executor, render_page, pdf_path, page_index, dpi, image_format
+                    )
+                    image_path = StoragePathBuilder.build_image_path(
+                        folder=folder,
+                        filename=original_filename,
+                        page_num=page_index + 1,
+                        extension=extension,
+                    )
+                    image_response = await storage.upload(
+                        file_data=img_bytes,
+                        path=image_path,
+                        content_type=content_type,
+                    )
+                    logger.info(
+                        f"✅ '{original_filename}' {page_index + 1}/{total_pages} "
+                        f"페이지 저장 완료: {image_path}"
+                    )
+                    done.put_nowait((page_index + 1, image_response, None))
+                except Exception as e:
+                    done.put_nowait((page_index + 1, None, e))
+                finally:
+                    window.release()
+
+            async def schedule_pages() -> None:
+                for page_index in range(total_pages):
+                    await window.acquire()
+                    tasks.append(asyncio.create_task(process_page(page_index)))
+
+            tasks: List[asyncio.Task] = []
+            scheduler = asyncio.create_task(schedule_pages())
+            try:
+                for _ in range(total_pages):
+                    page_num, image_response, error = await done.get()
+                    if error is not None:
+                        logger.error(f"❌ {page_num}페이지 처리 실패: {error}")
+                        raise error
+                    yield page_num, image_response
+            finally:
+                scheduler.cancel()
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(scheduler, *tasks, return_exceptions=True)
 
 
 # 싱글톤 인스턴스
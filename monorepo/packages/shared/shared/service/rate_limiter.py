@@ -0,0 +1,118 @@
+"""Redis 토큰 버킷 속도 제한기
+
+여러 워커 프로세스/호스트가 같은 Redis 키의 버킷을 공유하여 외부 서버
+(vLLM 등)로 보내는 전체 요청 속도를 제한합니다.
+
+버킷 갱신은 Lua 스크립트 하나로 원자적으로 처리하고, 시각은 Redis 서버의
+TIME을 사용하므로 워커 간 시계 차이의 영향을 받지 않습니다.
+"""
+
+import asyncio
+from typing import Optional
+
+import redis.asyncio as aioredis
+
+from ..core.logging import get_logger
+from .redis_service import get_redis_service
+
+logger = get_logger(__name__)
+
+# KEYS[1]=버킷 키, ARGV=(초당 충전량, 최대 토큰, 요청 토큰)
+# 반환: 대기해야 할 시간(초, 문자열). 0이면 토큰을 차감하고 통과
+_TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil or ts == nil then
+    tokens = capacity
+    ts = now
+end
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local wait = 0
+if tokens >= requested then
+    tokens = tokens - requested
+else
+    wait = (requested - tokens) / rate
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000) + 1000)
+return tostring(wait)
+"""
+
+
+class RedisTokenBucket:
+    """Redis 공유 토큰 버킷 (asyncio)
+
+    Redis 오류 시에는 로그만 남기고 통과시킵니다. (속도 제한 실패가
+    파이프라인을 멈추지 않도록)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        capacity: int,
+        redis_client: Optional[aioredis.Redis] = None,
+    ):
+        """
+        Args:
+            name: 버킷 이름 (Redis 키: ratelimit:{name})
+            rate: 초당 충전 토큰 수
+            capacity: 최대 토큰 수 (순간 허용량)
+            redis_client: asyncio Redis 클라이언트 (None일 경우
+                현재 이벤트 루프의 공유 풀 클라이언트를 호출 시점에 사용)
+        """
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다")
+        self.key = f"ratelimit:{name}"
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._redis_client = redis_client
+
+    @property
+    def redis_client(self) -> aioredis.Redis:
+        if self._redis_client is not None:
+            return self._redis_client
+        return get_redis_service().get_async_redis_client(decode_responses=True)
+
+    async def try_acquire(self, tokens: int = 1) -> float:
+        """토큰 차감 시도
+
+        Returns:
+            0이면 차감 성공, 양수면 그만큼(초) 기다린 뒤 다시 시도해야 함
+        """
+        try:
+            wait = await self.redis_client.eval(
+                _TOKEN_BUCKET_SCRIPT,
+                1,
+                self.key,
+                self.rate,
+                self.capacity,
+                tokens,
+            )
+            return float(wait)
+        except Exception as e:
+            logger.warning(f"⚠️ 속도 제한 확인 실패, 제한 없이 진행 ({self.key}): {e}")
+            return 0.0
+
+    async def acquire(self, tokens: int = 1) -> float:
+        """토큰을 얻을 때까지 대기
+
+        Returns:
+            대기한 총 시간 (초)
+        """
+        waited = 0.0
+        while True:
+            wait = await self.try_acquire(tokens)
+            if wait <= 0:
+                return waited
+            await asyncio.sleep(wait)
+            waited += wait
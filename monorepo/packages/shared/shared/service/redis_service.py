@@ -1,16 +1,48 @@
 # app/services/redis_service.py
 
-from typing import Optional
+import asyncio
+import threading
+from typing import Dict, Optional, Tuple
 
 import redis
+import redis.asyncio as aioredis
 
 from ..config import settings
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 프로세스 전역 커넥션 풀 레지스트리
+# 키: (host, port, db, decode_responses)
+PoolKey = Tuple[str, int, int, bool]
+_sync_pools: Dict[PoolKey, redis.BlockingConnectionPool] = {}
+# asyncio 연결은 생성한 이벤트 루프에 묶이므로 루프별로 풀을 둠
+_async_pools: Dict[
+    Tuple[PoolKey, int],
+    Tuple[asyncio.AbstractEventLoop, aioredis.BlockingConnectionPool],
+] = {}
+_pools_lock = threading.Lock()
+
+
+def _pool_kwargs(decode_responses: bool) -> dict:
+    """sync/async 풀 공통 설정"""
+    return {
+        "max_connections": settings.REDIS_MAX_CONNECTIONS,
+        "timeout": settings.REDIS_POOL_TIMEOUT,
+        "socket_timeout": settings.REDIS_SOCKET_TIMEOUT,
+        "socket_connect_timeout": settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+        "health_check_interval": settings.REDIS_HEALTH_CHECK_INTERVAL,
+        "password": settings.REDIS_PASSWORD or None,
+        "decode_responses": decode_responses,
+    }
 
 
 class RedisService:
-    """Redis를 사용한 파이프라인 상태 관리 구현체"""
+    """Redis를 사용한 파이프라인 상태 관리 구현체
 
-    _redis_client: Optional[redis.Redis] = None
+    클라이언트는 매번 새로 만들어도 같은 (host, port, db, decode_responses)
+    조합이면 프로세스 전역 커넥션 풀을 공유합니다.
+    """
 
     def __init__(
         self,
@@ -18,34 +50,125 @@ class RedisService:
         redis_port: int = 6379,
         redis_db: int = 0,
     ):
-        self._redis_client = None
         self.redis_host = redis_host
         self.redis_port = redis_port
         self.redis_db = redis_db
 
-    def get_redis_client(self) -> redis.Redis:
-        """Redis 클라이언트 싱글톤 패턴으로 관리"""
-        if not self._redis_client:
-            self._redis_client = redis.Redis(
+    def _pool_key(self, decode_responses: bool) -> PoolKey:
+        return (self.redis_host, self.redis_port, self.redis_db, decode_responses)
+
+    def _get_sync_pool(self, decode_responses: bool) -> redis.BlockingConnectionPool:
+        key = self._pool_key(decode_responses)
+        pool = _sync_pools.get(key)
+        if pool is None:
+            with _pools_lock:
+                pool = _sync_pools.get(key)
+                if pool is None:
+                    pool = redis.BlockingConnectionPool(
+                        host=self.redis_host,
+                        port=self.redis_port,
+                        db=self.redis_db,
+                        **_pool_kwargs(decode_responses),
+                    )
+                    _sync_pools[key] = pool
+                    logger.info(
+                        f"🔌 Redis 커넥션 풀 생성: {self.redis_host}:{self.redis_port}"
+                        f"/{self.redis_db} (max={settings.REDIS_MAX_CONNECTIONS})"
+                    )
+        return pool
+
+    def _get_async_pool(
+        self, decode_responses: bool
+    ) -> aioredis.BlockingConnectionPool:
+        loop = asyncio.get_running_loop()
+        key = (self._pool_key(decode_responses), id(loop))
+        entry = _async_pools.get(key)
+        if entry is not None and entry[0] is loop:
+            return entry[1]
+
+        with _pools_lock:
+            # 닫힌 루프의 풀은 정리 (id 재사용 대비)
+            for stale_key, (stale_loop, _) in list(_async_pools.items()):
+                if stale_loop.is_closed() or stale_key == key:
+                    del _async_pools[stale_key]
+
+            pool = aioredis.BlockingConnectionPool(
                 host=self.redis_host,
                 port=self.redis_port,
                 db=self.redis_db,
-                decode_responses=True,
+                **_pool_kwargs(decode_responses),
             )
-        return self._redis_client
+            _async_pools[key] = (loop, pool)
+        return pool
+
+    def get_redis_client(self) -> redis.Redis:
+        """문자열 응답용 Redis 클라이언트 (공유 커넥션 풀)"""
+        return redis.Redis(connection_pool=self._get_sync_pool(True))
 
+    def get_binary_redis_client(self) -> redis.Redis:
+        """바이너리 값용 Redis 클라이언트 (decode_responses=False)"""
+        return redis.Redis(connection_pool=self._get_sync_pool(False))
 
-def get_redis_service():
-    return RedisService(
-        redis_host=settings.REDIS_HOST,
-        redis_port=settings.REDIS_PORT,
-        redis_db=int(settings.REDIS_DB),
-    )
+    def get_async_redis_client(self, decode_responses: bool = True) -> aioredis.Redis:
+        """asyncio Redis 클라이언트 (현재 이벤트 루프의 공유 커넥션 풀)
+
+        실행 중인 이벤트 루프 안에서 호출해야 합니다.
+        """
+        return aioredis.Redis(connection_pool=self._get_async_pool(decode_responses))
+
+    def get_dedicated_async_redis_client(
+        self, decode_responses: bool = True
+    ) -> aioredis.Redis:
+        """공유 풀을 쓰지 않는 전용 연결 asyncio 클라이언트
+
+        XREAD BLOCK처럼 연결을 오래 점유하는 명령용입니다. (풀 연결 고갈 방지)
+        사용 후 aclose()로 닫아야 합니다.
+        """
+        kwargs = _pool_kwargs(decode_responses)
+        kwargs.pop("max_connections")
+        kwargs.pop("timeout")
+        return aioredis.Redis(
+            host=self.redis_host,
+            port=self.redis_port,
+            db=self.redis_db,
+            single_connection_client=True,
+            **kwargs,
+        )
+
+
+# 전역 싱글톤 인스턴스
+_redis_service: Optional[RedisService] = None
+
+
+def get_redis_service() -> RedisService:
+    """RedisService 싱글톤 인스턴스 반환"""
+    global _redis_service
+    if _redis_service is None:
+        _redis_service = RedisService(
+            redis_host=settings.REDIS_HOST,
+            redis_port=settings.REDIS_PORT,
+            redis_db=int(settings.REDIS_DB),
+        )
+    return _redis_service
 
 
 def get_redis_client_sync():
-    return RedisService(
-        redis_host=settings.REDIS_HOST,
-        redis_port=settings.REDIS_PORT,
-        redis_db=int(settings.REDIS_DB),
-    ).get_redis_client()
+    return get_redis_service().get_redis_client()
+
+
+async def close_redis_pools() -> None:
+    """현재 이벤트 루프의 async 풀과 모든 sync 풀 연결 종료 (앱 종료 시)"""
+    loop = asyncio.get_running_loop()
+    with _pools_lock:
+        async_pools = [pool for owner, pool in _async_pools.values() if owner is loop]
+        for key, (owner, _) in list(_async_pools.items()):
+            if owner is loop:
+                del _async_pools[key]
+        sync_pools = list(_sync_pools.values())
+        _sync_pools.clear()
+
+    for pool in async_pools:
+        await pool.disconnect()
+    for pool in sync_pools:
+        pool.disconnect()
+    logger.info("✅ Redis 커넥션 풀 종료")
@@ -42,17 +42,18 @@ class StoragePathBuilder:
 
     @staticmethod
     def build_image_path(
-        folder: str, filename: str, page_num: int | None = None
+        folder: str, filename: str, page_num: int | None = None, extension: str = "png"
     ) -> str:
         """이미지 저장 경로 생성
 
         기존 폴더 구조를 유지하면서 이미지 경로 생성
-        페이지 번호가 있으면 page_{num}.png 형식 사용
+        페이지 번호가 있으면 page_{num}.{extension} 형식 사용
 
         Args:
             folder: 기존 폴더 경로 (예: 'uploads/20251113/uuid')
             filename: 원본 파일명
             page_num: 페이지 번호 (선택)
+            extension: 이미지 확장자 (기본: png)
 
         Returns:
             str: 이미지 경로
@@ -62,10 +63,10 @@ class StoragePathBuilder:
             'uploads/20251113/uuid/page_1.png'
         """
         if page_num is not None:
-            image_filename = f"page_{page_num}.png"
+            image_filename = f"page_{page_num}.{extension}"
         else:
             base_filename = filename.rsplit(".", 1)[0] if "." in filename else filename
-            image_filename = f"{base_filename}.png"
+            image_filename = f"{base_filename}.{extension}"
 
         return f"{folder}/{image_filename}"
 
@@ -0,0 +1,125 @@
+"""PDF 페이지 렌더링 유틸리티
+
+PDF 페이지를 이미지로 렌더링하는 작업을 프로세스 풀에 분산합니다.
+PDF는 임시 파일로 한 번만 기록하고, 각 워커는 경로로 문서를 열어
+필요한 페이지만 렌더링합니다. (태스크마다 PDF 바이트를 직렬화하지 않음)
+
+PyMuPDF 렌더링은 GIL을 놓지 않으므로 스레드 풀로는 코어를 하나밖에 쓰지 못합니다.
+prefork 워커의 자식은 데몬 프로세스라 자식 프로세스를 만들 수 없으므로, PDF 변환
+태스크는 CELERY_PDF_QUEUE 전용 큐로 라우팅되어 threads/solo 풀 워커에서 실행됩니다.
+그래도 프로세스를 만들 수 없으면 스레드 풀로 대체합니다. (성능 저하, error 로그)
+"""
+
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+import fitz
+
+from ..config import settings
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 포맷별 (확장자, content-type)
+IMAGE_FORMATS = {
+    "png": ("png", "image/png"),
+    "jpg": ("jpg", "image/jpeg"),
+    "jpeg": ("jpg", "image/jpeg"),
+}
+
+# 워커에서 마지막으로 연 문서 (같은 PDF의 페이지를 연속 렌더링할 때 재사용)
+# 스레드 풀로 대체된 경우에도 안전하도록 스레드별로 보관
+_worker_local = threading.local()
+
+
+def render_page(pdf_path: str, page_index: int, dpi: int, image_format: str) -> bytes:
+    """PDF 한 페이지를 이미지 바이트로 렌더링 (워커에서 실행)
+
+    Args:
+        pdf_path: PDF 임시 파일 경로
+        page_index: 0부터 시작하는 페이지 인덱스
+        dpi: 렌더링 해상도
+        image_format: 이미지 포맷 (png, jpg)
+    """
+    # 임시 파일 경로는 재사용될 수 있으므로 파일 식별 정보까지 비교
+    stat = os.stat(pdf_path)
+    doc_key = (pdf_path, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    doc = getattr(_worker_local, "doc", None)
+    if doc is None or getattr(_worker_local, "doc_key", None) != doc_key:
+        if doc is not None:
+            doc.close()
+        doc = fitz.open(pdf_path)
+        _worker_local.doc = doc
+        _worker_local.doc_key = doc_key
+
+    page = doc.load_page(page_index)
+    pix = page.get_pixmap(dpi=dpi)
+    return pix.tobytes(IMAGE_FORMATS[image_format][0])
+
+
+def count_pages(pdf_path: str) -> int:
+    """PDF 페이지 수 조회"""
+    with fitz.open(pdf_path) as doc:
+        return len(doc)
+
+
+@contextmanager
+def pdf_temp_file(pdf_bytes: bytes) -> Iterator[str]:
+    """PDF 바이트를 워커가 열 수 있는 임시 파일로 기록"""
+    fd, path = tempfile.mkstemp(suffix=".pdf")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(pdf_bytes)
+        yield path
+    finally:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+# 렌더링 실행기 (프로세스당 1개, 지연 생성)
+_render_executor: Optional[Executor] = None
+
+
+def get_render_executor() -> Executor:
+    """PDF 렌더링 실행기 (싱글톤 패턴)"""
+    global _render_executor
+    if _render_executor is None:
+        workers = max(1, settings.PDF_RENDER_WORKERS)
+        executor: Optional[ProcessPoolExecutor] = None
+        try:
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            # 데몬 프로세스 등에서는 첫 제출 시점에 실패하므로 미리 확인
+            executor.submit(os.getpid).result()
+            _render_executor = executor
+            logger.info(f"📄 PDF 렌더링 프로세스 풀 생성: workers={workers}")
+        except Exception as e:
+            if executor is not None:
+                # 일부 생성된 워커 프로세스/대기 작업 정리
+                executor.shutdown(wait=False, cancel_futures=True)
+            if multiprocessing.current_process().daemon:
+                cause = (
+                    "데몬 프로세스(prefork 풀 자식)에서 실행 중 - PDF 변환 태스크를 "
+                    f"'{settings.CELERY_PDF_QUEUE}' 큐의 threads/solo 풀 워커로 "
+                    "실행하세요"
+                )
+            else:
+                cause = str(e)
+            logger.error(
+                f"❌ PDF 렌더링 프로세스 풀 생성 실패, 스레드 풀로 대체 "
+                f"(단일 코어로 렌더링): {cause}"
+            )
+            _render_executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="pdf-render"
+            )
+    return _render_executor
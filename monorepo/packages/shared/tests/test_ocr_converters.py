@@ -0,0 +1,94 @@
+"""OCR 결과 ↔ Protobuf 변환 테스트"""
+
+import pytest
+from shared.grpc.generated import common_pb2, ocr_pb2
+from shared.grpc.ocr_converters import (
+    ocr_result_from_proto,
+    ocr_result_to_proto,
+    pack_text_boxes,
+    unpack_text_boxes,
+)
+from shared.schemas.ocr_db import OCRExtractDTO
+from shared.schemas.ocr_text_box import OCRTextBoxCreate
+
+
+def _box(text: str, x: float, y: float, confidence: float = 0.75) -> OCRTextBoxCreate:
+    # float32로 정확히 표현되는 값만 사용
+    return OCRTextBoxCreate(
+        text=text,
+        confidence=confidence,
+        bbox=[[x, y], [x + 8.5, y], [x + 8.5, y + 4.25], [x, y + 4.25]],
+    )
+
+
+def _dump(result: OCRExtractDTO) -> dict:
+    return result.model_dump()
+
+
+def test_pack_text_boxes_round_trip():
+    boxes = [_box(f"박스 {i}", i * 10.0, i * 2.5, confidence=0.5) for i in range(20)]
+
+    packed = pack_text_boxes(boxes)
+    restored = ocr_pb2.PackedTextBoxes.FromString(packed.SerializeToString())
+
+    assert list(restored.texts) == [box.text for box in boxes]
+    assert unpack_text_boxes(restored) == [
+        {"text": box.text, "confidence": box.confidence, "bbox": box.bbox}
+        for box in boxes
+    ]
+
+
+def test_pack_empty_boxes():
+    assert unpack_text_boxes(pack_text_boxes([])) == []
+
+
+def test_result_round_trip_uses_packed_boxes():
+    result = OCRExtractDTO(text_boxes=[_box("첫 줄", 1.0, 2.0), _box("둘째", 3.0, 9.5)])
+
+    response = ocr_result_to_proto(result)
+    wire = ocr_pb2.OCRResponse.FromString(response.SerializeToString())
+
+    assert wire.status == common_pb2.STATUS_SUCCESS
+    assert wire.HasField("packed_boxes")
+    assert len(wire.packed_boxes.texts) == 2
+    assert len(wire.text_boxes) == 0
+    assert wire.text == "첫 줄\n둘째"
+    assert wire.overall_confidence == pytest.approx(0.75)
+    assert _dump(ocr_result_from_proto(wire)) == _dump(result)
+
+
+def test_non_quad_bbox_falls_back_to_text_boxes():
+    result = OCRExtractDTO(
+        text_boxes=[
+            OCRTextBoxCreate(
+                text="polygon",
+                confidence=0.5,
+                bbox=[[0.0, 0.0], [2.0, 0.0], [3.0, 1.0], [2.0, 2.0], [0.0, 2.0]],
+            ),
+            _box("rect", 5.0, 5.0),
+        ]
+    )
+
+    wire = ocr_pb2.OCRResponse.FromString(
+        ocr_result_to_proto(result).SerializeToString()
+    )
+
+    assert not wire.HasField("packed_boxes")
+    assert len(wire.text_boxes) == 2
+    assert _dump(ocr_result_from_proto(wire)) == _dump(result)
+
+
+def test_error_result_round_trip():
+    wire = ocr_result_to_proto(OCRExtractDTO(text_boxes=[], error="모델 미로드"))
+
+    assert wire.status == common_pb2.STATUS_FAILURE
+    restored = ocr_result_from_proto(wire)
+    assert restored.error == "모델 미로드"
+    assert restored.text_boxes == []
+
+
+def test_empty_success_result():
+    restored = ocr_result_from_proto(ocr_result_to_proto(OCRExtractDTO()))
+
+    assert restored.error is None
+    assert restored.text_boxes == []
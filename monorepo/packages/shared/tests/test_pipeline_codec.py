@@ -0,0 +1,131 @@
+"""PipelineContextCodec 라운드트립 테스트"""
+
+import pytest
+from shared.pipeline.codec import (
+    CODEC_VERSION,
+    COMPRESSION_LZ4,
+    COMPRESSION_NONE,
+    COMPRESSION_ZSTD,
+    FORMAT_JSON,
+    FORMAT_MSGPACK,
+    HEADER_SIZE,
+    MAGIC,
+    PipelineContextCodec,
+    lz4_frame,
+    zstandard,
+)
+from shared.pipeline.context import PipelineContext
+from shared.schemas.ocr_db import OCRExtractDTO, OCRTextBoxCreate
+
+COMPRESSIONS = [
+    pytest.param("none", COMPRESSION_NONE, id="none"),
+    pytest.param(
+        "zstd",
+        COMPRESSION_ZSTD,
+        id="zstd",
+        marks=pytest.mark.skipif(zstandard is None, reason="zstandard 미설치"),
+    ),
+    pytest.param(
+        "lz4",
+        COMPRESSION_LZ4,
+        id="lz4",
+        marks=pytest.mark.skipif(lz4_frame is None, reason="lz4 미설치"),
+    ),
+]
+
+
+def _box(text: str, x: float, y: float, **kwargs) -> OCRTextBoxCreate:
+    return OCRTextBoxCreate(
+        text=text,
+        confidence=0.875,
+        bbox=[[x, y], [x + 10.5, y], [x + 10.5, y + 5.25], [x, y + 5.25]],
+        **kwargs,
+    )
+
+
+def _context() -> PipelineContext:
+    pages = [
+        OCRExtractDTO(
+            text_boxes=[_box(f"텍스트 {i}", i * 20.0, i * 7.0) for i in range(50)]
+        ),
+        OCRExtractDTO(
+            text_boxes=[
+                # 4점이 아닌 bbox, ocr_execution_id가 있는 박스
+                OCRTextBoxCreate(
+                    text="polygon",
+                    confidence=0.5,
+                    bbox=[[0.0, 0.0], [1.0, 0.0], [2.0, 1.0], [1.0, 2.0], [0.0, 1.0]],
+                    ocr_execution_id=7,
+                ),
+                _box("rect", 3.0, 4.0, ocr_execution_id=8),
+            ]
+        ),
+        OCRExtractDTO(text_boxes=[], error="이미지 디코딩 실패"),
+    ]
+    return PipelineContext(
+        batch_id="batch-1",
+        chain_execution_id=42,
+        private_imgs=["a.png", "b.png", "c.png"],
+        is_batch=True,
+        options={"lang": "korean"},
+        ocr_result=pages[0],
+        ocr_results=pages,
+    )
+
+
+@pytest.mark.parametrize("format_name", ["json", "msgpack"])
+@pytest.mark.parametrize("compression,compression_id", COMPRESSIONS)
+def test_round_trip(format_name, compression, compression_id):
+    codec = PipelineContextCodec(format_name, compression, compress_min_bytes=0)
+    context = _context()
+
+    data = codec.encode(context)
+
+    assert data.startswith(MAGIC)
+    assert data[len(MAGIC)] == CODEC_VERSION
+    assert data[len(MAGIC) + 1] == (
+        FORMAT_JSON if format_name == "json" else FORMAT_MSGPACK
+    )
+    assert data[len(MAGIC) + 2] == compression_id
+    assert codec.decode(data).model_dump() == context.model_dump()
+
+
+@pytest.mark.parametrize("compression,compression_id", COMPRESSIONS)
+def test_small_body_is_not_compressed(compression, compression_id):
+    codec = PipelineContextCodec("msgpack", compression, compress_min_bytes=1 << 30)
+
+    data = codec.encode(_context())
+
+    assert data[HEADER_SIZE - 1] == COMPRESSION_NONE
+
+
+@pytest.mark.parametrize("format_name", ["json", "msgpack"])
+def test_decodes_legacy_json_without_header(format_name):
+    codec = PipelineContextCodec(format_name, "none")
+    context = _context()
+    legacy = context.model_dump_json()
+
+    assert codec.decode(legacy).model_dump() == context.model_dump()
+    assert codec.decode(legacy.encode()).model_dump() == context.model_dump()
+
+
+def test_decoder_reads_other_configured_format():
+    context = _context()
+    data = PipelineContextCodec("msgpack", "none").encode(context)
+
+    decoded = PipelineContextCodec("json", "none").decode(data)
+
+    assert decoded.model_dump() == context.model_dump()
+
+
+def test_newer_codec_version_is_rejected():
+    data = bytearray(PipelineContextCodec("json", "none").encode(_context()))
+    data[len(MAGIC)] = CODEC_VERSION + 1
+
+    with pytest.raises(ValueError):
+        PipelineContextCodec("json", "none").decode(bytes(data))
+
+
+def test_unknown_format_name_is_rejected():
+    with pytest.raises(ValueError):
+        PipelineContextCodec("pickle", "none")
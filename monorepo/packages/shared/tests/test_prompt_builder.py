@@ -0,0 +1,65 @@
+"""OCR 프롬프트 분할 테스트"""
+
+import pytest
+from shared.llm.prompt_builder import OCRPromptBuilder, estimate_tokens, split_lines
+from shared.schemas.ocr_db import OCRExtractDTO
+from shared.schemas.ocr_text_box import OCRTextBoxCreate
+
+
+def _segment_tokens(segment: str) -> int:
+    return sum(estimate_tokens(line) + 1 for line in segment.split("\n"))
+
+
+def test_split_lines_keeps_order_and_budget():
+    lines = [f"line {i} 한글 텍스트" for i in range(100)]
+
+    segments = split_lines(lines, max_tokens=40)
+
+    assert len(segments) > 1
+    assert "\n".join(segments).split("\n") == lines
+    assert all(_segment_tokens(segment) <= 40 for segment in segments)
+
+
+def test_split_lines_fits_in_one_segment():
+    lines = ["a", "b", "c"]
+
+    assert split_lines(lines, max_tokens=1000) == ["a\nb\nc"]
+
+
+def test_split_lines_long_line_is_its_own_segment():
+    long_line = "가" * 50
+
+    segments = split_lines(["short", long_line, "tail"], max_tokens=10)
+
+    assert segments == ["short", long_line, "tail"]
+
+
+def test_split_lines_empty():
+    assert split_lines([], max_tokens=10) == []
+
+
+def _box(text: str, x: float, y: float) -> OCRTextBoxCreate:
+    return OCRTextBoxCreate(
+        text=text,
+        confidence=0.9,
+        bbox=[[x, y], [x + 40, y], [x + 40, y + 10], [x, y + 10]],
+    )
+
+
+def test_build_segments_reading_order():
+    page = OCRExtractDTO(
+        text_boxes=[
+            _box("둘째줄", 0, 30),
+            _box("오른쪽", 100, 1),
+            _box("왼쪽", 0, 0),
+        ]
+    )
+
+    segments = OCRPromptBuilder(max_tokens=1000).build_segments(page)
+
+    assert segments == ["왼쪽 오른쪽\n둘째줄"]
+
+
+def test_builder_rejects_non_positive_budget():
+    with pytest.raises(ValueError):
+        OCRPromptBuilder(max_tokens=0)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+LLM 프롬프트 토큰 비교 스크립트 (JSON 덤프 vs OCRPromptBuilder)
+
+같은 OCR 결과 페이지를 기존 방식(OCRExtractDTO.model_dump()의 json.dumps)과
+OCRPromptBuilder(읽기 순서 줄 텍스트, 좌표 표기 선택)로 렌더링했을 때의
+프롬프트 토큰 수(추정치)와 토큰 예산 기준 세그먼트 수를 비교합니다.
+- mock: Mock 엔진과 같은 페이지당 3박스
+- receipt: 영수증/청구서 형태 (40줄, 줄당 2~3박스)
+- dense: 실제 문서와 비슷한 페이지당 300박스 (60줄 x 5박스)
+
+실행 방법:
+    python scripts/bench_llm_prompt.py
+    python scripts/bench_llm_prompt.py --max-tokens 2000
+    python scripts/bench_llm_prompt.py --ocr-json ocr_results.json
+
+주의사항:
+    - 토큰 수는 estimate_tokens 추정치입니다 (실제 토크나이저와 다를 수 있음)
+    - --ocr-json은 OCRExtractDTO 형식 dict 리스트(페이지 순서)여야 합니다
+"""
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+# 패키지 경로를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "packages" / "shared"))
+
+from shared.llm.prompt_builder import OCRPromptBuilder, estimate_tokens  # noqa: E402
+from shared.schemas.ocr_db import OCRExtractDTO  # noqa: E402
+from shared.schemas.ocr_text_box import OCRTextBoxCreate  # noqa: E402
+
+WORDS = ["합계", "금액", "INVOICE", "2024-03-15", "부가세", "₩1,250,000", "품목"]
+
+
+def make_page(rng: random.Random, lines: int, boxes_per_line: int) -> OCRExtractDTO:
+    """줄 단위로 배치된 텍스트 박스 페이지 생성 (박스 순서는 섞음)"""
+    text_boxes = []
+    for row in range(lines):
+        y = 80 + row * 52 + rng.uniform(-3, 3)
+        x = 100.0
+        for _ in range(boxes_per_line):
+            w, h = rng.uniform(60, 380), rng.uniform(24, 34)
+            text_boxes.append(
+                OCRTextBoxCreate(
+                    text=" ".join(rng.choices(WORDS, k=rng.randint(1, 3))),
+                    confidence=rng.uniform(0.5, 1.0),
+                    bbox=[[x, y], [x + w, y], [x + w, y + h], [x, y + h]],
+                )
+            )
+            x += w + rng.uniform(20, 120)
+    # OCR 엔진 출력 순서는 읽기 순서와 다를 수 있음
+    rng.shuffle(text_boxes)
+    return OCRExtractDTO(text_boxes=text_boxes)
+
+
+def sample_cases() -> List[Tuple[str, List[OCRExtractDTO]]]:
+    rng = random.Random(42)
+    return [
+        ("mock", [make_page(rng, 3, 1) for _ in range(5)]),
+        ("receipt", [make_page(rng, 40, rng.randint(2, 3)) for _ in range(5)]),
+        ("dense", [make_page(rng, 60, 5) for _ in range(5)]),
+    ]
+
+
+def json_tokens(page: OCRExtractDTO) -> int:
+    """기존 LLMStage 프롬프트 (페이지 dict의 json.dumps)"""
+    return estimate_tokens(json.dumps(page.model_dump(), ensure_ascii=False))
+
+
+def report(name: str, pages: List[OCRExtractDTO], max_tokens: int) -> None:
+    plain = OCRPromptBuilder(max_tokens=max_tokens)
+    coords = OCRPromptBuilder(max_tokens=max_tokens, include_coords=True)
+
+    baseline = sum(json_tokens(page) for page in pages)
+    # json은 분할 없이 페이지당 요청 하나 (예산 초과 여부와 무관)
+    rows = [("json", baseline, "-")]
+    for label, builder in (("text", plain), ("text+xy", coords)):
+        tokens = sum(estimate_tokens(builder.render_page(page)) for page in pages)
+        segments = sum(len(builder.build_segments(page)) for page in pages)
+        rows.append((label, tokens, segments))
+
+    for label, tokens, segments in rows:
+        print(
+            f"{name:<8} {label:<8} {tokens / len(pages):>12.0f} "
+            f"{1 - tokens / baseline:>9.1%} {segments:>9}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM 프롬프트 토큰 비교")
+    parser.add_argument(
+        "--max-tokens", type=int, default=3000, help="세그먼트당 토큰 예산"
+    )
+    parser.add_argument("--ocr-json", default=None, help="OCR 결과 JSON 파일")
+    args = parser.parse_args()
+
+    if args.ocr_json:
+        raw = json.loads(Path(args.ocr_json).read_text(encoding="utf-8"))
+        cases = [("file", [OCRExtractDTO.model_validate(page) for page in raw])]
+    else:
+        cases = sample_cases()
+
+    print(f"\n📝 프롬프트 토큰 비교 (max_tokens={args.max_tokens})\n")
+    print(
+        f"{'케이스':<8} {'형식':<8} {'페이지당토큰':>12} {'감소율':>9} {'세그먼트':>9}"
+    )
+    print("-" * 52)
+    for name, pages in cases:
+        report(name, pages, args.max_tokens)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+LLM 채팅 스트리밍 벤치마크 스크립트 (/llm/chat SSE vs 일반 응답)
+
+같은 요청을 stream=false(전체 응답 대기)와 stream=true(SSE)로 보내
+첫 토큰까지의 시간(TTFT)과 전체 응답 시간을 비교하고, 스트림 도중 연결을
+끊었을 때 업스트림 생성이 중단되는지 확인합니다.
+
+1. 기본(내장 모드): 토큰을 일정 간격으로 생성하는 가짜 vLLM 서버와 LLM 라우터만
+   올린 API 서버(uvicorn)를 띄워 측정합니다. 연결 종료 시 가짜 서버가 실제로
+   생성한 토큰 수도 보고합니다.
+2. --api-url 지정 시: 실행 중인 API 서버에 요청하여 측정합니다.
+
+실행 방법:
+    python scripts/bench_llm_streaming.py
+    python scripts/bench_llm_streaming.py --tokens 200 --token-delay-ms 20
+    python scripts/bench_llm_streaming.py --api-url http://localhost:8000/api/v1 \\
+        --rounds 5
+
+주의사항:
+    - 내장 모드는 api_server 의존성(fastapi, uvicorn)이 설치된 환경에서 실행하세요
+    - --api-url 측정의 응답 캐시(use_cache)는 사용하지 않습니다
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import httpx
+
+# 패키지 경로를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "packages" / "shared"))
+sys.path.insert(0, str(project_root / "packages" / "api_server"))
+
+FAKE_MODEL = "fake-model"
+
+
+class FakeVLLMServer(ThreadingHTTPServer):
+    """토큰을 token_delay 간격으로 생성하는 OpenAI 호환 가짜 서버
+
+    generated에 마지막 요청에서 실제로 생성(전송)한 토큰 수를 기록합니다.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, tokens: int, token_delay: float):
+        super().__init__(("127.0.0.1", 0), _FakeVLLMHandler)
+        self.tokens = tokens
+        self.token_delay = token_delay
+        self.generated = 0
+        self.aborted = threading.Event()
+
+
+class _FakeVLLMHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: FakeVLLMServer
+
+    def log_message(self, *args):
+        pass
+
+    def _json(self, body: dict) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        self._json(
+            {
+                "object": "list",
+                "data": [
+                    {"id": FAKE_MODEL, "object": "model", "created": 0, "owned_by": ""}
+                ],
+            }
+        )
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server = self.server
+        server.generated = 0
+        server.aborted.clear()
+
+        if not request.get("stream"):
+            time.sleep(server.token_delay * server.tokens)
+            server.generated = server.tokens
+            self._json(
+                {
+                    "id": "bench",
+                    "object": "chat.completion",
+                    "created": 0,
+                    "model": FAKE_MODEL,
+                    "choices": [
+                        {
+                            "index": 0,
+                            "finish_reason": "stop",
+                            "message": {
+                                "role": "assistant",
+                                "content": "tok " * server.tokens,
+                            },
+                        }
+                    ],
+                }
+            )
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for i in range(server.tokens):
+                time.sleep(server.token_delay)
+                finish = "stop" if i == server.tokens - 1 else None
+                self._chunk(
+                    {
+                        "id": "bench",
+                        "object": "chat.completion.chunk",
+                        "created": 0,
+                        "model": FAKE_MODEL,
+                        "choices": [
+                            {
+                                "index": 0,
+                                "delta": {"content": "tok "},
+                                "finish_reason": finish,
+                            }
+                        ],
+                    }
+                )
+                server.generated += 1
+            self._write(b"data: [DONE]\n\n")
+            self._write(b"")
+        except (BrokenPipeError, ConnectionResetError):
+            # 클라이언트(API 서버)가 연결을 닫음 → 생성 중단
+            server.aborted.set()
+
+    def _chunk(self, body: dict) -> None:
+        self._write(f"data: {json.dumps(body)}\n\n".encode())
+
+    def _write(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+
+def start_api_server(llm_url: str) -> str:
+    """LLM 라우터만 포함한 API 서버를 백그라운드 스레드로 실행"""
+    import uvicorn
+    from fastapi import FastAPI
+    from shared.config import settings
+
+    settings.LLM_SERVER_URL = llm_url
+
+    from app.domains.llm.controllers.llm_controller import router
+
+    app = FastAPI()
+    app.include_router(router, prefix=settings.API_V1_STR)
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return f"http://127.0.0.1:{port}{settings.API_V1_STR}"
+
+
+def chat_body(stream: bool, model: Optional[str], max_tokens: int) -> dict:
+    return {
+        "messages": [{"role": "user", "content": "스트리밍 벤치마크"}],
+        "model": model,
+        "temperature": 0.7,
+        "max_tokens": max_tokens,
+        "stream": stream,
+    }
+
+
+async def measure_full(
+    client: httpx.AsyncClient, api_url: str, model: Optional[str], max_tokens: int
+) -> float:
+    start = time.perf_counter()
+    response = await client.post(
+        f"{api_url}/llm/chat", json=chat_body(False, model, max_tokens)
+    )
+    response.raise_for_status()
+    return time.perf_counter() - start
+
+
+async def measure_stream(
+    client: httpx.AsyncClient,
+    api_url: str,
+    model: Optional[str],
+    max_tokens: int,
+    stop_after: Optional[int] = None,
+) -> Tuple[Optional[float], float, int, Optional[dict]]:
+    """SSE 스트림 측정
+
+    Returns:
+        (TTFT, 전체 시간, 받은 토큰 이벤트 수, done 이벤트 데이터)
+    """
+    start = time.perf_counter()
+    ttft = None
+    tokens = 0
+    done = None
+    event = None
+    async with client.stream(
+        "POST", f"{api_url}/llm/chat", json=chat_body(True, model, max_tokens)
+    ) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if line.startswith("event: "):
+                event = line[len("event: ") :]
+            elif line.startswith("data: "):
+                data = json.loads(line[len("data: ") :])
+                if event == "token":
+                    if ttft is None:
+                        ttft = time.perf_counter() - start
+                    tokens += 1
+                    if stop_after is not None and tokens >= stop_after:
+                        break  # 연결 종료 (클라이언트 이탈)
+                elif event == "done":
+                    done = data
+                elif event == "error":
+                    raise RuntimeError(data.get("message"))
+    return ttft, time.perf_counter() - start, tokens, done
+
+
+def summarize(name: str, samples: List[float]) -> None:
+    print(
+        f"{name:<16} {statistics.median(samples) * 1000:>10.1f} "
+        f"{max(samples) * 1000:>10.1f}"
+    )
+
+
+async def run(args, api_url: str, fake: Optional[FakeVLLMServer]) -> None:
+    async with httpx.AsyncClient(timeout=120.0) as client:
+        # 워밍업 (모델 목록 캐시, 연결 수립)
+        await measure_full(client, api_url, args.model, args.tokens)
+
+        full, ttfts, stream_totals = [], [], []
+        for _ in range(args.rounds):
+            full.append(await measure_full(client, api_url, args.model, args.tokens))
+            ttft, total, _, _ = await measure_stream(
+                client, api_url, args.model, args.tokens
+            )
+            if ttft is not None:
+                ttfts.append(ttft)
+            stream_totals.append(total)
+
+        print(f"\n⏱️ 응답 시간 비교 (rounds={args.rounds}, max_tokens={args.tokens})\n")
+        print(f"{'측정':<16} {'p50(ms)':>10} {'max(ms)':>10}")
+        print("-" * 38)
+        summarize("full response", full)
+        if ttfts:
+            summarize("stream TTFT", ttfts)
+        summarize("stream total", stream_totals)
+
+        if fake is None:
+            return
+
+        # 스트림 도중 연결 종료 → 업스트림 생성 중단 확인
+        stop_after = max(1, args.tokens // 10)
+        await measure_stream(client, api_url, args.model, args.tokens, stop_after)
+        aborted = await asyncio.to_thread(fake.aborted.wait, 5.0)
+        await asyncio.sleep(fake.token_delay * 2)
+        print(
+            f"\n📴 연결 종료 테스트: {stop_after}토큰 수신 후 종료 → "
+            f"업스트림 생성 {fake.generated}/{args.tokens}토큰, "
+            f"중단={'예' if aborted else '아니오'}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM 채팅 스트리밍 벤치마크")
+    parser.add_argument("--api-url", default=None, help="API 서버 URL (/api/v1까지)")
+    parser.add_argument("--model", default=None, help="모델 ID (기본: 서버 기본 모델)")
+    parser.add_argument("--tokens", type=int, default=100, help="생성 토큰 수")
+    parser.add_argument(
+        "--token-delay-ms", type=float, default=20.0, help="내장 서버 토큰 간격"
+    )
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    fake = None
+    api_url = args.api_url
+    if api_url is None:
+        fake = FakeVLLMServer(args.tokens, args.token_delay_ms / 1000)
+        threading.Thread(target=fake.serve_forever, daemon=True).start()
+        api_url = start_api_server(f"http://127.0.0.1:{fake.server_port}/v1")
+
+    asyncio.run(run(args, api_url.rstrip("/"), fake))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+OCR 배치 추론 벤치마크 스크립트
+
+이미지별 predict 루프와 predict_batch 배치 경로의 처리량(images/sec)을 비교합니다.
+Supabase 다운로드를 제외한 순수 추론 구간만 측정합니다.
+
+실행 방법:
+    python scripts/bench_ocr_batch.py
+    python scripts/bench_ocr_batch.py --engines mock easyocr --batch-size 10 --rounds 3
+
+주의사항:
+    - easyocr 엔진은 easyocr 패키지가 설치된 환경(ml_server)에서만 측정됩니다
+    - 첫 라운드는 워밍업으로 간주하여 결과에서 제외합니다
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+import cv2
+import numpy as np
+
+# 패키지 경로를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "packages" / "shared"))
+sys.path.insert(0, str(project_root / "packages" / "ml_server"))
+
+from ml_app.engines.ocr.base import BaseOCREngine  # noqa: E402
+from ml_app.engines.ocr.OCREngineFactory import OCREngineFactory  # noqa: E402
+
+
+def make_page_images(count: int, width: int, height: int) -> List[bytes]:
+    """텍스트가 그려진 합성 페이지 이미지(PNG bytes) 생성"""
+    images = []
+    for page in range(count):
+        canvas = np.full((height, width, 3), 255, dtype=np.uint8)
+        for line in range(12):
+            y = 60 + line * 50
+            if y > height - 20:
+                break
+            cv2.putText(
+                canvas,
+                f"Page {page + 1} line {line + 1} INVOICE 2024-{line:02d}",
+                (40, y),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                0.9,
+                (0, 0, 0),
+                2,
+            )
+        ok, encoded = cv2.imencode(".png", canvas)
+        if not ok:
+            raise RuntimeError("이미지 인코딩 실패")
+        images.append(encoded.tobytes())
+    return images
+
+
+def measure(fn: Callable[[], object], rounds: int) -> List[float]:
+    """fn 실행 시간(초) 측정 (첫 실행은 워밍업)"""
+    fn()
+    durations = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def bench_engine(
+    engine: BaseOCREngine, images: List[bytes], rounds: int, threshold: float
+) -> None:
+    """루프 경로와 배치 경로 비교"""
+
+    def run_loop():
+        return [engine.predict(image, threshold) for image in images]
+
+    def run_batch():
+        return engine.predict_batch(images, threshold)
+
+    # 결과 동등성 확인 (입력 순서 유지 여부 포함)
+    loop_texts = [[b.text for b in r.text_boxes] for r in run_loop()]
+    batch_texts = [[b.text for b in r.text_boxes] for r in run_batch()]
+    same = "일치" if loop_texts == batch_texts else "불일치"
+
+    n = len(images)
+    loop_times = measure(run_loop, rounds)
+    batch_times = measure(run_batch, rounds)
+    loop_ips = n / statistics.median(loop_times)
+    batch_ips = n / statistics.median(batch_times)
+
+    print(f"\n[{engine.get_engine_name()}] 이미지 {n}장 x {rounds}회")
+    print(f"  loop  : {loop_ips:10.2f} images/sec")
+    print(f"  batch : {batch_ips:10.2f} images/sec")
+    print(f"  speedup: x{batch_ips / loop_ips:.2f}  (결과 {same})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR 배치 추론 벤치마크")
+    parser.add_argument("--engines", nargs="+", default=["mock", "easyocr"])
+    parser.add_argument("--batch-size", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--width", type=int, default=1240)
+    parser.add_argument("--height", type=int, default=1754)
+    parser.add_argument("--lang", default="korean")
+    parser.add_argument("--threshold", type=float, default=0.5)
+    args = parser.parse_args()
+
+    images = make_page_images(args.batch_size, args.width, args.height)
+
+    for engine_type in args.engines:
+        engine = OCREngineFactory.create_engine(engine_type, lang=args.lang)
+        if engine is None:
+            continue
+        engine.load_model()
+        if not engine.is_loaded:
+            print(f"\n[{engine_type}] 모델 로드 실패 - 건너뜀")
+            continue
+        bench_engine(engine, images, args.rounds, args.threshold)
+
+
+if __name__ == "__main__":
+    main()
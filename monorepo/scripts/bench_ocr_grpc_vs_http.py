@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+OCR 전송 경로 벤치마크 스크립트 (gRPC vs BentoML HTTP)
+
+1. 오프라인: 같은 배치 OCR 결과를 BentoML 응답(JSON)과 gRPC 응답
+   (OCRBatchResponse, PackedTextBoxes)으로 직렬화했을 때의 페이로드 크기와
+   워커 측 디코딩 시간(응답 → OCRExtractDTO)을 비교합니다.
+   - mock: Mock 엔진과 같은 페이지당 3박스
+   - dense: 실제 문서와 비슷한 페이지당 300박스
+2. 온라인(--http-url/--grpc-address 지정 시): 실행 중인 ML 서버에 같은 배치를
+   반복 요청하여 두 경로의 지연(p50/p95)과 실제 응답 크기를 측정합니다.
+   워커와 같은 클라이언트(OCRClient 연결 풀, OCRGrpcClient 채널 풀)를 사용합니다.
+
+실행 방법:
+    python scripts/bench_ocr_grpc_vs_http.py
+    python scripts/bench_ocr_grpc_vs_http.py --pages 10 --rounds 50 \\
+        --http-url http://localhost:8001 --grpc-address localhost:50051 \\
+        --image-path yb_test_storage/uploads/sample/page_1.png
+
+주의사항:
+    - 온라인 측정은 ML 서버를 OCR_ENGINE=mock으로 띄우고 HTTP(BentoML)와
+      gRPC(USE_GRPC=true)를 모두 켠 상태에서 실행하세요
+    - --image-path는 Storage에 존재해야 하며, 같은 이미지를 pages번 반복해 보냅니다
+      (결과 캐시가 켜져 있으면 두 경로 모두 캐시 적중으로 전송 비용만 비교됩니다)
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, List
+
+# 패키지 경로를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "packages" / "shared"))
+sys.path.insert(0, str(project_root / "packages" / "celery_worker"))
+
+from shared.grpc.generated import ocr_pb2  # noqa: E402
+from shared.grpc.ocr_converters import (  # noqa: E402
+    ocr_result_from_proto,
+    ocr_result_to_proto,
+)
+from shared.schemas.ocr_db import OCRExtractDTO  # noqa: E402
+from shared.schemas.ocr_text_box import OCRTextBoxCreate  # noqa: E402
+
+WORDS = ["합계", "금액", "INVOICE", "2024-03-15", "부가세", "₩1,250,000", "품목"]
+
+
+def make_results(pages: int, boxes: int) -> List[OCRExtractDTO]:
+    """페이지당 boxes개 텍스트 박스를 가진 배치 OCR 결과 생성"""
+    rng = random.Random(42)
+    results = []
+    for _ in range(pages):
+        text_boxes = []
+        for _ in range(boxes):
+            x, y = rng.uniform(0, 2400), rng.uniform(0, 3400)
+            w, h = rng.uniform(20, 400), rng.uniform(12, 40)
+            text_boxes.append(
+                OCRTextBoxCreate(
+                    text=" ".join(rng.choices(WORDS, k=rng.randint(1, 4))),
+                    confidence=rng.uniform(0.5, 1.0),
+                    bbox=[[x, y], [x + w, y], [x + w, y + h], [x, y + h]],
+                )
+            )
+        results.append(OCRExtractDTO(text_boxes=text_boxes))
+    return results
+
+
+def http_body(results: List[OCRExtractDTO]) -> bytes:
+    """BentoML BatchOCRResponse와 같은 JSON 본문"""
+    payload = {
+        "results": [result.model_dump(mode="json") for result in results],
+        "total_processed": len(results),
+        "total_success": len(results),
+        "total_failed": 0,
+    }
+    return json.dumps(payload, ensure_ascii=False).encode()
+
+
+def decode_http(body: bytes) -> List[OCRExtractDTO]:
+    """OCRClient.call_batch와 같은 디코딩 (JSON → OCRExtractDTO)"""
+    result = json.loads(body)
+    return [
+        OCRExtractDTO(
+            text_boxes=[
+                {
+                    "text": box["text"],
+                    "confidence": box["confidence"],
+                    "bbox": box["bbox"],
+                }
+                for box in r.get("text_boxes", [])
+            ]
+        )
+        for r in result["results"]
+    ]
+
+
+def grpc_body(results: List[OCRExtractDTO]) -> bytes:
+    return ocr_pb2.OCRBatchResponse(
+        results=[ocr_result_to_proto(result) for result in results],
+        total_processed=len(results),
+        total_success=len(results),
+    ).SerializeToString()
+
+
+def decode_grpc(body: bytes) -> List[OCRExtractDTO]:
+    response = ocr_pb2.OCRBatchResponse.FromString(body)
+    return [ocr_result_from_proto(result) for result in response.results]
+
+
+def median_ms(fn: Callable[[], object], rounds: int) -> float:
+    fn()  # 워밍업
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def run_offline(pages: int, rounds: int) -> None:
+    from google.protobuf.internal import api_implementation
+
+    print(
+        f"\n📦 오프라인 페이로드 비교 (pages={pages}, "
+        f"protobuf={api_implementation.Type()})\n"
+    )
+    print(
+        f"{'케이스':<8} {'경로':<6} {'크기(KB)':>10} {'비율':>7} "
+        f"{'인코딩(ms)':>11} {'디코딩(ms)':>11}"
+    )
+    print("-" * 60)
+    for name, boxes in (("mock", 3), ("dense", 300)):
+        results = make_results(pages, boxes)
+        http = http_body(results)
+        grpc_ = grpc_body(results)
+        rows = (
+            ("http", http, lambda: http_body(results), lambda: decode_http(http)),
+            ("grpc", grpc_, lambda: grpc_body(results), lambda: decode_grpc(grpc_)),
+        )
+        for transport, body, encode, decode in rows:
+            print(
+                f"{name:<8} {transport:<6} {len(body) / 1024:>10.1f} "
+                f"{len(body) / len(http):>7.2f} "
+                f"{median_ms(encode, rounds):>11.3f} {median_ms(decode, rounds):>11.3f}"
+            )
+
+
+async def measure_latency(
+    call: Callable[[], Awaitable[object]], rounds: int
+) -> List[float]:
+    await call()  # 워밍업 (연결 수립)
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def summarize(name: str, samples: List[float], size: int) -> None:
+    p95 = statistics.quantiles(samples, n=20)[-1] if len(samples) > 1 else samples[0]
+    print(
+        f"{name:<6} {statistics.median(samples):>10.2f} {p95:>10.2f} "
+        f"{size / 1024:>10.1f}"
+    )
+
+
+async def run_online(args) -> None:
+    from grpc_clients.ocr_grpc_client import OCRGrpcClient
+    from tasks.client.ocr_client import OCRClient
+
+    image_paths = [args.image_path] * args.pages
+    options = {"language": "korean", "confidence_threshold": 0.5}
+
+    print(f"\n🌐 온라인 지연 비교 (pages={args.pages}, rounds={args.rounds})\n")
+    print(f"{'경로':<6} {'p50(ms)':>10} {'p95(ms)':>10} {'응답(KB)':>10}")
+    print("-" * 40)
+
+    if args.http_url:
+        client = OCRClient(args.http_url)
+        try:
+            samples = await measure_latency(
+                lambda: client.call_batch(image_paths, options), args.rounds
+            )
+            response = await client.client.post(
+                "/extract_text_batch",
+                json={"request_data": options, "private_imgs": image_paths},
+                timeout=60.0,
+            )
+            summarize("http", samples, len(response.content))
+        finally:
+            await client.aclose()
+
+    if args.grpc_address:
+        grpc_client = OCRGrpcClient(args.grpc_address, pool_size=1)
+        try:
+            samples = await measure_latency(
+                lambda: grpc_client.batch_extract_text(image_paths), args.rounds
+            )
+            response = await grpc_client.batch_extract_text(image_paths)
+            summarize("grpc", samples, response.ByteSize())
+        finally:
+            await grpc_client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR gRPC vs HTTP 벤치마크")
+    parser.add_argument("--pages", type=int, default=10, help="배치당 이미지 수")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--http-url", default=None, help="BentoML 서버 URL")
+    parser.add_argument("--grpc-address", default=None, help="gRPC 서버 주소")
+    parser.add_argument("--image-path", default=None, help="Storage 이미지 경로")
+    args = parser.parse_args()
+
+    run_offline(args.pages, args.rounds)
+
+    if args.http_url or args.grpc_address:
+        if not args.image_path:
+            parser.error("온라인 측정에는 --image-path가 필요합니다")
+        asyncio.run(run_online(args))
+
+
+if __name__ == "__main__":
+    main()
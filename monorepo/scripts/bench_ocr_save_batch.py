@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+OCR 결과 DB 저장 벤치마크 스크립트
+
+텍스트 박스마다 CRUDBase.create(행별 commit/refresh)를 호출하던 기존 방식과
+OCRRepository의 다중 행 INSERT 경로의 처리량(rows/sec)을 비교합니다.
+
+실행 방법:
+    python scripts/bench_ocr_save_batch.py
+    python scripts/bench_ocr_save_batch.py --images 10 --boxes 300 --rounds 3
+    python scripts/bench_ocr_save_batch.py --database-url sqlite://
+
+주의사항:
+    - 기본값은 .env의 DATABASE_URL(동기 드라이버)을 사용합니다
+    - 측정용 행은 image_path가 'bench/'로 시작하며, 측정 후 삭제됩니다
+    - 첫 라운드는 워밍업으로 간주하여 결과에서 제외합니다
+"""
+
+import argparse
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, List
+
+from sqlalchemy import create_engine, delete
+from sqlalchemy.orm import Session, sessionmaker
+
+# 패키지 경로를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "packages" / "shared"))
+sys.path.insert(0, str(project_root / "packages" / "celery_worker"))
+
+from repository.ocr_repository import OCRRepository  # noqa: E402
+from shared.models import OCRExecution, OCRTextBox  # noqa: E402
+from shared.pipeline.context import PipelineContext  # noqa: E402
+from shared.repository.crud.sync_crud import (  # noqa: E402
+    ocr_execution_crud,
+    ocr_text_box_crud,
+)
+from shared.schemas import OCRExecutionCreate  # noqa: E402
+from shared.schemas.ocr_db import OCRExtractDTO, OCRTextBoxCreate  # noqa: E402
+
+BENCH_PREFIX = "bench/"
+
+
+def make_context(images: int, boxes: int) -> PipelineContext:
+    """합성 OCR 결과를 담은 컨텍스트 생성 (이미지 경로는 매번 고유)"""
+    run_id = uuid.uuid4().hex
+    paths = [f"{BENCH_PREFIX}{run_id}/page_{idx + 1}.png" for idx in range(images)]
+    text_boxes = [
+        OCRTextBoxCreate(
+            text=f"INVOICE line {idx}",
+            confidence=0.9,
+            bbox=[[0, idx], [100, idx], [100, idx + 10], [0, idx + 10]],
+        )
+        for idx in range(boxes)
+    ]
+    return PipelineContext(
+        batch_id="",
+        chain_execution_id=0,
+        private_imgs=paths,
+        public_file_paths=[f"public/{path}" for path in paths],
+        ocr_results=[OCRExtractDTO(text_boxes=text_boxes) for _ in paths],
+    )
+
+
+def save_per_row(session: Session, context: PipelineContext) -> None:
+    """기존 방식: 행마다 create (commit + refresh)"""
+    for idx, ocr_result in enumerate(context.ocr_results):
+        db_ocr_execution = ocr_execution_crud.create(
+            db=session,
+            obj_in=OCRExecutionCreate(
+                chain_execution_id=context.chain_execution_id,
+                image_path=context.private_imgs[idx],
+                public_path=context.public_file_paths[idx],
+                status="success",
+                error="",
+            ),
+        )
+        for box in ocr_result.text_boxes:
+            ocr_text_box_crud.create(
+                db=session,
+                obj_in=OCRTextBoxCreate(
+                    ocr_execution_id=db_ocr_execution.id,
+                    text=box.text,
+                    confidence=box.confidence,
+                    bbox=box.bbox,
+                ),
+            )
+
+
+def save_bulk(session: Session, context: PipelineContext) -> None:
+    """다중 행 INSERT 경로 (한 트랜잭션)"""
+    repository = OCRRepository()
+    rows, _ = repository._build_execution_rows(context)
+    repository._bulk_insert(session, rows)
+    session.commit()
+
+
+def cleanup(session_factory: sessionmaker) -> None:
+    with session_factory() as session:
+        executions = session.query(OCRExecution.id).filter(
+            OCRExecution.image_path.startswith(BENCH_PREFIX)
+        )
+        session.execute(
+            delete(OCRTextBox).where(OCRTextBox.ocr_execution_id.in_(executions))
+        )
+        session.execute(
+            delete(OCRExecution).where(OCRExecution.image_path.startswith(BENCH_PREFIX))
+        )
+        session.commit()
+
+
+def measure(
+    label: str,
+    save_fn: Callable[[Session, PipelineContext], None],
+    session_factory: sessionmaker,
+    images: int,
+    boxes: int,
+    rounds: int,
+) -> float:
+    rows_per_round = images * (boxes + 1)
+    rates: List[float] = []
+    for round_idx in range(rounds + 1):
+        context = make_context(images, boxes)
+        with session_factory() as session:
+            start = time.perf_counter()
+            save_fn(session, context)
+            elapsed = time.perf_counter() - start
+        if round_idx > 0:  # 첫 라운드는 워밍업
+            rates.append(rows_per_round / elapsed)
+
+    rate = statistics.median(rates)
+    print(f"  {label:<10} {rate:10.1f} rows/sec  ({rows_per_round} rows/round)")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR 결과 DB 저장 벤치마크")
+    parser.add_argument("--database-url", default=None, help="동기 DB URL")
+    parser.add_argument("--images", type=int, default=10, help="청크당 이미지 수")
+    parser.add_argument("--boxes", type=int, default=300, help="이미지당 텍스트 박스")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.database_url:
+        engine = create_engine(args.database_url)
+        if engine.dialect.name == "sqlite":
+            OCRExecution.metadata.create_all(
+                engine, tables=[OCRExecution.__table__, OCRTextBox.__table__]
+            )
+    else:
+        from shared.core.database import get_db_manager
+
+        engine = get_db_manager().sync_engine
+
+    session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+
+    print(
+        f"\nOCR 결과 저장 처리량 (images={args.images}, boxes/image={args.boxes}, "
+        f"db={engine.dialect.name})"
+    )
+    try:
+        per_row = measure(
+            "per-row",
+            save_per_row,
+            session_factory,
+            args.images,
+            args.boxes,
+            args.rounds,
+        )
+        bulk = measure(
+            "bulk",
+            save_bulk,
+            session_factory,
+            args.images,
+            args.boxes,
+            args.rounds,
+        )
+        print(f"  speedup    {bulk / per_row:10.2f}x")
+    finally:
+        cleanup(session_factory)
+
+
+if __name__ == "__main__":
+    main()
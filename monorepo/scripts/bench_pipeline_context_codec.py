@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+PipelineContext 직렬화 벤치마크 스크립트
+
+기존 저장 형식(model_dump_json + json.loads + 전체 검증)과 PipelineContextCodec의
+포맷/압축 조합별 인코딩/디코딩 시간과 값 크기를 비교합니다.
+--redis-url을 주면 실제 Redis에 저장하여 MEMORY USAGE(키당 메모리)도 측정합니다.
+
+실행 방법:
+    python scripts/bench_pipeline_context_codec.py
+    python scripts/bench_pipeline_context_codec.py --pages 10 --boxes 300 --rounds 20
+    python scripts/bench_pipeline_context_codec.py --redis-url redis://localhost:6379/0
+
+주의사항:
+    - zstd/lz4 조합은 zstandard/lz4 패키지가 설치된 경우에만 측정됩니다
+      (uv sync --extra compression)
+    - Redis 측정용 키는 'bench:pipeline:' 접두사를 사용하며 측정 후 삭제됩니다
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Optional
+
+# 패키지 경로를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "packages" / "shared"))
+
+from shared.pipeline.codec import (  # noqa: E402
+    JSONContextFormat,
+    PipelineContextCodec,
+    _compressors,
+)
+from shared.pipeline.context import PipelineContext  # noqa: E402
+from shared.schemas.ocr_db import OCRExtractDTO, OCRTextBoxCreate  # noqa: E402
+
+WORDS = [
+    "합계",
+    "금액",
+    "INVOICE",
+    "2024-03-15",
+    "부가세",
+    "₩1,250,000",
+    "품목",
+    "수량",
+]
+
+
+def make_context(pages: int, boxes: int) -> PipelineContext:
+    """300박스 내외의 실제 페이지와 비슷한 배치 OCR 컨텍스트 생성"""
+    rng = random.Random(42)
+    results = []
+    for _ in range(pages):
+        text_boxes = []
+        for _ in range(boxes):
+            x, y = rng.uniform(0, 2400), rng.uniform(0, 3400)
+            w, h = rng.uniform(20, 400), rng.uniform(12, 40)
+            text_boxes.append(
+                OCRTextBoxCreate(
+                    text=" ".join(rng.choices(WORDS, k=rng.randint(1, 4))),
+                    confidence=rng.uniform(0.5, 1.0),
+                    bbox=[[x, y], [x + w, y], [x + w, y + h], [x, y + h]],
+                )
+            )
+        results.append(OCRExtractDTO(text_boxes=text_boxes))
+
+    return PipelineContext(
+        batch_id="bench-batch",
+        chain_execution_id=1,
+        private_imgs=[f"uploads/bench/page_{idx + 1}.png" for idx in range(pages)],
+        public_file_paths=[f"public/bench/page_{idx + 1}.png" for idx in range(pages)],
+        is_batch=True,
+        options={"ocr_engine": "paddleocr", "language": "korean"},
+        ocr_results=results,
+    )
+
+
+def timeit(fn: Callable[[], object], rounds: int) -> float:
+    """중앙값(ms)"""
+    fn()  # 워밍업
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def redis_memory(client, key: str, value: bytes) -> Optional[int]:
+    client.set(key, value)
+    try:
+        return client.memory_usage(key, samples=0)
+    finally:
+        client.delete(key)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PipelineContext 직렬화 벤치마크")
+    parser.add_argument("--pages", type=int, default=10, help="컨텍스트당 페이지 수")
+    parser.add_argument("--boxes", type=int, default=300, help="페이지당 텍스트 박스")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+
+    context = make_context(args.pages, args.boxes)
+
+    redis_client = None
+    if args.redis_url:
+        import redis
+
+        redis_client = redis.Redis.from_url(args.redis_url, decode_responses=False)
+
+    # (이름, encode, decode)
+    legacy = JSONContextFormat()
+    candidates: List[tuple] = [
+        (
+            "legacy json",
+            lambda: context.model_dump_json().encode(),
+            legacy.loads,
+        )
+    ]
+    available = _compressors()
+    for format_name in ("json", "msgpack"):
+        for compression, compression_id in (("none", 0), ("zstd", 1), ("lz4", 2)):
+            if compression_id and compression_id not in available:
+                continue
+            codec = PipelineContextCodec(format_name, compression, 0)
+            candidates.append(
+                (
+                    f"{format_name}+{compression}",
+                    lambda codec=codec: codec.encode(context),
+                    codec.decode,
+                )
+            )
+
+    print(
+        f"\nPipelineContext 직렬화 (pages={args.pages}, boxes/page={args.boxes}, "
+        f"rounds={args.rounds})"
+    )
+    header = f"  {'format':<16}{'size':>12}{'encode':>12}{'decode':>12}"
+    if redis_client is not None:
+        header += f"{'redis mem':>14}"
+    print(header)
+
+    for name, encode, decode in candidates:
+        payload = encode()
+        encode_ms = timeit(encode, args.rounds)
+        decode_ms = timeit(lambda: decode(payload), args.rounds)
+        line = (
+            f"  {name:<16}{len(payload) / 1024:>9.1f} KB"
+            f"{encode_ms:>9.2f} ms{decode_ms:>9.2f} ms"
+        )
+        if redis_client is not None:
+            memory = redis_memory(redis_client, f"bench:pipeline:{name}", payload)
+            line += f"{(memory or 0) / 1024:>11.1f} KB"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
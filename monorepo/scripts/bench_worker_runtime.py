@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+워커 런타임(장수 이벤트 루프 + 재사용 스테이지) 벤치마크 스크립트
+
+작은 청크 N개를 Celery 태스크처럼 하나씩 실행하여 두 방식의
+태스크당 오버헤드와 HTTP 연결 생성 수를 비교합니다.
+
+- baseline: 태스크마다 asyncio.run + 스테이지/HTTP 클라이언트 새로 생성
+- runtime:  WorkerRuntime.run + 프로세스 수명 동안 재사용되는 스테이지
+
+스테이지는 로컬 keep-alive HTTP 서버에 요청 1회를 보내는 더미 스테이지이며,
+서버가 수락한 TCP 연결 수를 세어 연결 churn을 보여줍니다.
+
+실행 방법:
+    python scripts/bench_worker_runtime.py
+    python scripts/bench_worker_runtime.py --chunks 1000 --rounds 3
+
+주의사항:
+    - DB/Redis에 접근하지 않습니다 (save_db는 no-op, batch_id 없음 → 진행 이벤트 생략)
+    - 측정값은 프레임워크 오버헤드만 반영하며 실제 OCR/LLM 추론 시간은 포함하지 않습니다
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+import httpx
+
+# 패키지 경로를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "packages" / "shared"))
+sys.path.insert(0, str(project_root / "packages" / "celery_worker"))
+
+from core.worker_runtime import WorkerRuntime  # noqa: E402
+from shared.pipeline.context import PipelineContext  # noqa: E402
+from shared.pipeline.stage import PipelineStage  # noqa: E402
+
+
+class ConnectionCountingServer:
+    """keep-alive를 지원하는 최소 HTTP 서버 (수락한 연결 수 집계)"""
+
+    _RESPONSE = (
+        b"HTTP/1.1 200 OK\r\n"
+        b"Content-Type: application/json\r\n"
+        b"Content-Length: 11\r\n"
+        b"\r\n"
+        b'{"ok":true}'
+    )
+
+    def __init__(self):
+        self.connections = 0
+        self.port = 0
+        self._loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                headers = await reader.readuntil(b"\r\n\r\n")
+                if not headers:
+                    break
+                writer.write(self._RESPONSE)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def _serve(self):
+        asyncio.set_event_loop(self._loop)
+        server = self._loop.run_until_complete(
+            asyncio.start_server(self._handle, "127.0.0.1", 0)
+        )
+        self.port = server.sockets[0].getsockname()[1]
+        self._ready.set()
+        self._loop.run_forever()
+
+    def start(self) -> str:
+        self._thread.start()
+        self._ready.wait()
+        return f"http://127.0.0.1:{self.port}"
+
+
+class DummyStage(PipelineStage):
+    """HTTP 요청 1회를 보내는 더미 스테이지 (클라이언트는 인스턴스 수명 동안 유지)"""
+
+    def __init__(self, url: str):
+        super().__init__()
+        self.url = url
+        self.client = httpx.AsyncClient(timeout=5.0)
+
+    async def execute(self, context: PipelineContext) -> PipelineContext:
+        response = await self.client.get(self.url)
+        response.raise_for_status()
+        return context
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+def make_context(index: int) -> PipelineContext:
+    return PipelineContext(chain_execution_id=index, private_imgs=["page.png"])
+
+
+def run_baseline(url: str, chunks: int) -> List[float]:
+    """태스크마다 asyncio.run + 새 스테이지 (기존 방식)"""
+
+    async def _task(index: int):
+        stage = DummyStage(url)
+        try:
+            await stage.run(make_context(index))
+        finally:
+            await stage.aclose()
+
+    latencies = []
+    for index in range(chunks):
+        start = time.perf_counter()
+        asyncio.run(_task(index))
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def run_runtime(url: str, chunks: int) -> List[float]:
+    """WorkerRuntime.run + 재사용 스테이지"""
+    runtime = WorkerRuntime()
+    stage = DummyStage(url)
+    latencies = []
+    try:
+        for index in range(chunks):
+            start = time.perf_counter()
+            runtime.run(stage.run(make_context(index)))
+            latencies.append((time.perf_counter() - start) * 1000)
+    finally:
+        runtime.run(stage.aclose())
+        runtime.shutdown()
+    return latencies
+
+
+def measure(
+    server: ConnectionCountingServer,
+    runner: Callable[[str, int], List[float]],
+    url: str,
+    chunks: int,
+) -> Tuple[List[float], int]:
+    before = server.connections
+    latencies = runner(url, chunks)
+    # 서버 스레드가 마지막 연결 수락을 반영할 시간
+    time.sleep(0.05)
+    return latencies, server.connections - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description="워커 런타임 벤치마크")
+    parser.add_argument("--chunks", type=int, default=1000, help="청크(태스크) 수")
+    parser.add_argument("--rounds", type=int, default=3, help="반복 횟수")
+    args = parser.parse_args()
+
+    server = ConnectionCountingServer()
+    url = server.start()
+
+    print(f"\n📊 청크 {args.chunks}개 x {args.rounds}회\n")
+    print(
+        f"{'방식':<10} {'총(ms)':>10} {'평균(ms)':>10} {'p95(ms)':>10} {'연결 수':>8}"
+    )
+    print("-" * 54)
+
+    for name, runner in (("baseline", run_baseline), ("runtime", run_runtime)):
+        totals, means, p95s, connections = [], [], [], []
+        for _ in range(args.rounds):
+            latencies, opened = measure(server, runner, url, args.chunks)
+            totals.append(sum(latencies))
+            means.append(statistics.mean(latencies))
+            p95s.append(statistics.quantiles(latencies, n=20)[-1])
+            connections.append(opened)
+        print(
+            f"{name:<10} {statistics.median(totals):>10.1f} "
+            f"{statistics.median(means):>10.3f} {statistics.median(p95s):>10.3f} "
+            f"{max(connections):>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+OCR 서버 부하 중 헬스 체크 지연 측정 스크립트
+
+OCR 추론으로 서버를 포화시킨 상태에서 health_check 응답 시간이
+유휴 상태와 비슷하게 유지되는지 확인합니다.
+(추론이 이벤트 루프를 막으면 부하 구간의 p95/max가 추론 시간만큼 늘어남)
+
+실행 방법:
+    python scripts/load_test_ocr_health.py \\
+        --url http://localhost:8001 \\
+        --image-path yb_test_storage/uploads/sample/page_1.png \\
+        --concurrency 8 --duration 30
+
+주의사항:
+    - BentoML OCR 서버가 실행 중이어야 하며, --image-path는 Storage에 존재해야 합니다
+    - 서버의 OCR_INFERENCE_EXECUTOR / OCR_INFERENCE_WORKERS 설정을 바꿔가며 비교하세요
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+import httpx
+
+
+async def probe_health(
+    client: httpx.AsyncClient, url: str, stop_at: float, interval: float
+) -> List[float]:
+    """stop_at까지 interval 간격으로 health_check 지연(ms) 수집"""
+    latencies = []
+    while time.perf_counter() < stop_at:
+        start = time.perf_counter()
+        response = await client.post(f"{url}/health_check", json={})
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(interval)
+    return latencies
+
+
+async def saturate(
+    client: httpx.AsyncClient, url: str, image_paths: List[str], stop_at: float
+) -> int:
+    """stop_at까지 extract_text_batch를 반복 호출, 처리한 이미지 수 반환"""
+    processed = 0
+    payload = {
+        "request_data": {"language": "korean", "confidence_threshold": 0.5},
+        "private_imgs": image_paths,
+    }
+    while time.perf_counter() < stop_at:
+        response = await client.post(f"{url}/extract_text_batch", json=payload)
+        response.raise_for_status()
+        processed += response.json()["total_processed"]
+    return processed
+
+
+def summarize(label: str, latencies: List[float]) -> None:
+    latencies = sorted(latencies)
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    print(
+        f"  {label:<10} n={len(latencies):4d}  "
+        f"p50={statistics.median(latencies):8.2f}ms  "
+        f"p95={p95:8.2f}ms  max={latencies[-1]:8.2f}ms"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="OCR 부하 중 헬스 체크 지연 측정")
+    parser.add_argument("--url", default="http://localhost:8001")
+    parser.add_argument("--image-path", action="append", required=True)
+    parser.add_argument("--batch-size", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--interval", type=float, default=0.1)
+    args = parser.parse_args()
+
+    image_paths = (args.image_path * args.batch_size)[: args.batch_size]
+
+    async with httpx.AsyncClient(timeout=600.0) as client:
+        # 1. 유휴 상태 기준선
+        idle_stop = time.perf_counter() + min(args.duration, 10.0)
+        idle = await probe_health(client, args.url, idle_stop, args.interval)
+
+        # 2. OCR 포화 상태
+        loaded_stop = time.perf_counter() + args.duration
+        results = await asyncio.gather(
+            probe_health(client, args.url, loaded_stop, args.interval),
+            *(
+                saturate(client, args.url, image_paths, loaded_stop)
+                for _ in range(args.concurrency)
+            ),
+        )
+        loaded, processed = results[0], sum(results[1:])
+
+    print(f"\n헬스 체크 지연 (OCR 동시 요청 {args.concurrency}개)")
+    summarize("idle", idle)
+    summarize("saturated", loaded)
+    print(f"  OCR 처리량: {processed / args.duration:.2f} images/sec")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
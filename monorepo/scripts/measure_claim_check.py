@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Celery 체인 claim-check 효과 측정 스크립트
+
+배치 OCR 체인(ocr_stage → finish_stage)의 각 hop에서 브로커 메시지/결과 백엔드에
+저장되는 payload 크기와 hop당 직렬화 시간(직렬화 + 역직렬화 + 컨텍스트 복원)을
+전체 컨텍스트 전달 방식과 claim-check 방식으로 비교합니다.
+
+실행 방법:
+    python scripts/measure_claim_check.py
+    python scripts/measure_claim_check.py --pages 10 --boxes 300 --chunks 100
+    python scripts/measure_claim_check.py --redis-url redis://localhost:6379/0
+
+주의사항:
+    - claim-check 측정은 실제 Redis에 컨텍스트를 저장/조회합니다
+      (기본값은 .env의 REDIS_URL, 측정 후 키 삭제)
+    - 브로커 메모리는 청크 하나가 체인을 지나는 동안 브로커 메시지 본문과
+      결과 백엔드에 남는 payload 크기의 합으로 추정합니다
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import redis
+from kombu.serialization import dumps, loads
+
+# 패키지 경로를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "packages" / "shared"))
+sys.path.insert(0, str(project_root / "scripts"))
+
+from bench_pipeline_context_codec import make_context  # noqa: E402
+from shared.config import settings  # noqa: E402
+from shared.pipeline.cache import PipelineCacheService  # noqa: E402
+from shared.pipeline.context import PipelineContext  # noqa: E402
+
+# (hop 이름, 해당 시점에 OCR 결과가 포함되는지)
+HOPS = [
+    ("ocr_stage args", False),
+    ("ocr_stage result", True),
+    ("finish_stage args", True),
+    ("finish_stage result", True),
+]
+
+
+def celery_roundtrip(payload: dict) -> Tuple[int, float]:
+    """Celery JSON 직렬화 왕복 (바이트 수, ms)"""
+    start = time.perf_counter()
+    _, _, body = dumps(payload, serializer="json")
+    loads(body, "application/json", "utf-8")
+    return len(body), (time.perf_counter() - start) * 1000
+
+
+def measure_hop(
+    to_payload: Callable[[PipelineContext], dict],
+    from_payload: Callable[[dict], PipelineContext],
+    context: PipelineContext,
+    rounds: int,
+) -> Tuple[int, float]:
+    """hop 1회: payload 생성 → Celery 직렬화 왕복 → 컨텍스트 복원"""
+    samples: List[float] = []
+    size = 0
+    for _ in range(rounds + 1):
+        start = time.perf_counter()
+        payload = to_payload(context)
+        size, _ = celery_roundtrip(payload)
+        from_payload(payload)
+        samples.append((time.perf_counter() - start) * 1000)
+    return size, statistics.median(samples[1:])  # 첫 회는 워밍업
+
+
+def run_mode(
+    label: str,
+    to_payload: Callable[[PipelineContext], dict],
+    from_payload: Callable[[dict], PipelineContext],
+    contexts: Dict[bool, PipelineContext],
+    rounds: int,
+    chunks: int,
+) -> None:
+    print(f"\n[{label}]")
+    total_bytes = 0
+    total_ms = 0.0
+    for hop, with_results in HOPS:
+        size, elapsed = measure_hop(
+            to_payload, from_payload, contexts[with_results], rounds
+        )
+        total_bytes += size
+        total_ms += elapsed
+        print(f"  {hop:<20}{size / 1024:>10.1f} KB{elapsed:>10.2f} ms")
+    in_flight_mb = total_bytes * chunks / 1024 / 1024
+    print(
+        f"  {'합계 (청크당)':<16}{total_bytes / 1024:>12.1f} KB{total_ms:>10.2f} ms"
+        f"   → 청크 {chunks}개 동시 진행 시 ~{in_flight_mb:.1f} MB"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Celery claim-check 효과 측정")
+    parser.add_argument("--pages", type=int, default=10, help="청크당 페이지 수")
+    parser.add_argument("--boxes", type=int, default=300, help="페이지당 텍스트 박스")
+    parser.add_argument("--chunks", type=int, default=100, help="동시 진행 청크 수")
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--redis-url", default=settings.REDIS_URL)
+    args = parser.parse_args()
+
+    with_results = make_context(args.pages, args.boxes)
+    without_results = with_results.model_copy(update={"ocr_results": None})
+    contexts = {True: with_results, False: without_results}
+
+    print(
+        f"Celery hop payload (pages={args.pages}, boxes/page={args.boxes}, "
+        f"rounds={args.rounds})"
+    )
+
+    # 1. 전체 컨텍스트 전달 (기존 방식)
+    run_mode(
+        "full context",
+        lambda context: context.model_dump(),
+        lambda payload: PipelineContext(**payload),
+        contexts,
+        args.rounds,
+        args.chunks,
+    )
+
+    # 2. claim-check (Redis 저장/조회 포함)
+    client = redis.Redis.from_url(args.redis_url, decode_responses=False)
+    cache_service = PipelineCacheService(redis_client=client)
+
+    def to_claim(context: PipelineContext) -> dict:
+        cache_service.save_context(context)
+        return {
+            "batch_id": context.batch_id,
+            "chain_execution_id": context.chain_execution_id,
+        }
+
+    try:
+        run_mode(
+            "claim-check",
+            to_claim,
+            cache_service.from_task_payload,
+            contexts,
+            args.rounds,
+            args.chunks,
+        )
+    finally:
+        cache_service.delete_context(
+            with_results.batch_id, str(with_results.chain_execution_id)
+        )
+
+
+if __name__ == "__main__":
+    main()